@@ -0,0 +1,150 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, TypeVar, Union
+from weakref import WeakSet
+
+from sortedcontainers import SortedSet
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..model.bom import Bom
+    from ..model.component import Component
+    from ..model.service import Service
+    from ..model.vulnerability import Vulnerability
+
+    Owner = Union[Component, Service, Vulnerability]
+
+_T = TypeVar('_T')
+_H = TypeVar('_H', bound=Hashable)
+
+
+def _notifying(method: Callable[..., _T]) -> Callable[..., _T]:
+    @wraps(method)
+    def notifying(self: 'ObservedSortedSet[Any]', *args: Any, **kwargs: Any) -> _T:
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.notify()
+    return notifying
+
+
+class ObservedSortedSet(SortedSet[_H]):
+    """A `SortedSet` that notifies the :class:`BomRefIndex` instances that observe it of each modification."""
+
+    _observers: Optional['WeakSet[BomRefIndex]'] = None
+
+    def observe(self, index: 'BomRefIndex') -> None:
+        observers = self._observers
+        if observers is None:
+            observers = self._observers = WeakSet()
+        observers.add(index)
+
+    def notify(self) -> None:
+        observers = self._observers
+        if observers:
+            for index in tuple(observers):
+                index.invalidate()
+
+
+for _method in (
+    '__delitem__', 'add', '_add', 'clear', 'discard', '_discard', 'pop', 'remove',
+    'difference_update', '__isub__', 'intersection_update', '__iand__',
+    'symmetric_difference_update', '__ixor__', 'update', '__ior__', '_update',
+):
+    setattr(ObservedSortedSet, _method, _notifying(getattr(SortedSet, _method)))
+del _method
+
+
+def replace_observed(replaced: Optional['SortedSet[_H]'], iterable: Iterable[_H]) -> ObservedSortedSet[_H]:
+    """Make an :class:`ObservedSortedSet` that replaces another set - whose observers are notified."""
+    if isinstance(replaced, ObservedSortedSet):
+        replaced.notify()
+    return ObservedSortedSet(iterable)
+
+
+class BomRefIndex:
+    """Maps values of `BomRef` to their owners in a `Bom`.
+
+    Built on first use, and rebuilt on first use after it was invalidated.
+    It observes the sets of components, services and vulnerabilities it was built from,
+    and the component of the metadata - changes of any other `Bom` do not affect it.
+    Changes of the values of `BomRef` are not tracked.
+    Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self.__token = object()
+        self.__state: Optional[Tuple[object, Optional['Component'], Dict[str, 'Owner']]] = None
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # copies are not observed by anything - they start over
+        return BomRefIndex, ()
+
+    def invalidate(self) -> None:
+        # a fresh object each time - assigning it is atomic, so there are no lost updates across threads.
+        self.__token = object()
+
+    def get(self, bom: 'Bom', value: str) -> Optional['Owner']:
+        state = self.__state
+        metadata_component = bom.metadata.component
+        if state is None or state[0] is not self.__token or state[1] is not metadata_component:
+            token = self.__token  # before the build - a change during the build must cause another one
+            state = self.__state = token, metadata_component, self.__build(bom)
+        return state[2].get(value)
+
+    def __observe(self, observed: 'SortedSet[Any]') -> None:
+        if isinstance(observed, ObservedSortedSet):
+            observed.observe(self)
+
+    def __build(self, bom: 'Bom') -> Dict[str, 'Owner']:
+        owners: Dict[str, 'Owner'] = {}
+        observe = self.__observe
+        # on duplicate values, the first owner wins - in document order.
+        # nested structures are walked iteratively - deeply nested models must not exhaust the stack
+        observe(bom.components)
+        components: List['Component'] = list(reversed(bom.components))
+        if bom.metadata.component is not None:
+            components.append(bom.metadata.component)
+        while components:
+            component = components.pop()
+            value = component.bom_ref.value
+            if value is not None:
+                owners.setdefault(value, component)
+            observe(component.components)
+            components.extend(reversed(component.components))
+        observe(bom.services)
+        services: List['Service'] = list(reversed(bom.services))
+        while services:
+            service = services.pop()
+            value = service.bom_ref.value
+            if value is not None:
+                owners.setdefault(value, service)
+            observe(service.services)
+            services.extend(reversed(service.services))
+        observe(bom.vulnerabilities)
+        for vulnerability in bom.vulnerabilities:
+            value = vulnerability.bom_ref.value
+            if value is not None:
+                owners.setdefault(value, vulnerability)
+        return owners
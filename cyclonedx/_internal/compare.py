@@ -95,3 +95,7 @@ class ComparablePackageURL(ComparableTuple):
                 ComparableDict(purl.qualifiers) if isinstance(purl.qualifiers, dict) else purl.qualifiers,
                 purl.subpath
             ))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # `__new__` takes a PackageURL, so rebuild from the values - keeps holders, like `Component`, picklable
+        return tuple.__new__, (ComparablePackageURL, tuple(self))
@@ -22,10 +22,68 @@ Everything might change without any notice.
 """
 
 
-from hashlib import sha1
+from hashlib import blake2b, md5, sha1, sha3_256, sha3_384, sha3_512, sha256, sha384, sha512
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable
 
+from ..model import HashAlgorithm
+from .io import feed_file
 
-def file_sha1sum(filename: str) -> str:
+if TYPE_CHECKING:  # pragma: no cover
+    from .io import StrPath
+
+# bigger than `io.CHUNK_SIZE` - per chunk, each hasher releases the GIL once
+_CHUNK_SIZE = 4 * 1024 * 1024
+
+_HASHERS: Dict[HashAlgorithm, Callable[[], Any]] = {
+    HashAlgorithm.BLAKE2B_256: lambda: blake2b(digest_size=32),
+    HashAlgorithm.BLAKE2B_384: lambda: blake2b(digest_size=48),
+    HashAlgorithm.BLAKE2B_512: lambda: blake2b(digest_size=64),
+    HashAlgorithm.MD5: md5,  # nosec B303, B324
+    HashAlgorithm.SHA_1: sha1,  # nosec B303, B324
+    HashAlgorithm.SHA_256: sha256,
+    HashAlgorithm.SHA_384: sha384,
+    HashAlgorithm.SHA_512: sha512,
+    HashAlgorithm.SHA3_256: sha3_256,
+    HashAlgorithm.SHA3_384: sha3_384,
+    HashAlgorithm.SHA3_512: sha3_512,
+}
+
+
+def file_hashes(filename: 'StrPath', algorithms: Iterable[HashAlgorithm]) -> Dict[HashAlgorithm, str]:
+    """
+    Generate hashes of the provided file - with all algorithms from a single read.
+
+    Each chunk of the file is fed to all algorithms in turn, while it is hot in the CPU cache.
+    Regular files are memory-mapped; others, like pipes, are read into a reused buffer.
+
+    Args:
+        filename:
+            Path to file to hash
+        algorithms:
+            The algorithms to use - all but `HashAlgorithm.BLAKE3` are supported
+
+    Returns:
+        hex digests, by algorithm
+
+    Raises:
+        ValueError: if an algorithm is not supported
+    """
+    hashers = {}
+    for algorithm in algorithms:
+        factory = _HASHERS.get(algorithm)
+        if factory is None:
+            raise ValueError(f'Unsupported hash algorithm: {algorithm!r}')
+        hashers[algorithm] = factory()
+    updates = tuple(hasher.update for hasher in hashers.values())
+
+    def feed(chunk: memoryview) -> None:
+        for update in updates:
+            update(chunk)
+    feed_file(feed, filename, _CHUNK_SIZE)
+    return {algorithm: hasher.hexdigest() for algorithm, hasher in hashers.items()}
+
+
+def file_sha1sum(filename: 'StrPath') -> str:
     """
     Generate a SHA1 hash of the provided file.
 
@@ -36,8 +94,4 @@ def file_sha1sum(filename: str) -> str:
     Returns:
         SHA-1 hash
     """
-    h = sha1()  # nosec B303, B324
-    with open(filename, 'rb') as f:
-        for byte_block in iter(lambda: f.read(4096), b''):
-            h.update(byte_block)
-    return h.hexdigest()
+    return file_hashes(filename, (HashAlgorithm.SHA_1,))[HashAlgorithm.SHA_1]
@@ -0,0 +1,219 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+from contextlib import contextmanager
+from mmap import ACCESS_READ, mmap
+from os import PathLike, fstat
+from stat import S_ISREG
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, Union
+from xml.etree.ElementTree import Element, TreeBuilder, XMLParser  # nosec B405
+
+from ..exception.serialization import DeserializationLimitExceededException
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..serialization import DeserializationLimits
+
+BytesLike = Union[bytes, bytearray, memoryview, mmap]
+StrPath = Union[str, 'PathLike[str]']
+
+# size of the chunks that are fed to incremental parsers
+CHUNK_SIZE = 1024 * 1024
+
+
+def _try_mmap(f: IO[bytes]) -> Optional[mmap]:
+    # only non-empty regular files can be mapped - `st_size` of others, like pipes or files in `/proc`, means nothing
+    st = fstat(f.fileno())
+    if not S_ISREG(st.st_mode) or st.st_size == 0:
+        return None
+    try:
+        return mmap(f.fileno(), 0, access=ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+@contextmanager
+def map_file(path: StrPath) -> Generator[BytesLike, None, None]:
+    """
+    Memory-map a file for reading.
+
+    Files that cannot be mapped - empty ones, pipes, or files in `/proc` - are read into a `bytes` instead.
+    """
+    with open(path, 'rb') as f:
+        m = _try_mmap(f)
+        if m is None:
+            yield f.read()
+            return
+        with m:
+            yield m
+
+
+def feed_file(feed: Callable[[memoryview], Any], path: StrPath, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Feed the content of a file in chunks.
+
+    Files are memory-mapped - see :func:`map_file()`.
+    Files that cannot be mapped are read chunk by chunk, into a single buffer - so even endless pipes work.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        m = _try_mmap(f)
+        if m is not None:
+            with m:
+                feed_chunks(feed, m, chunk_size)
+            return
+        with memoryview(bytearray(chunk_size)) as buffer:
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                with buffer[:size] as chunk:
+                    feed(chunk)
+
+
+def feed_chunks(feed: Callable[[memoryview], Any], data: BytesLike, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Feed `data` in chunks, without copying.
+
+    All views are released when done - even on error - so that a `mmap` can be closed afterwards.
+    """
+    with memoryview(data) as view:
+        for offset in range(0, len(view), chunk_size):
+            with view[offset:offset + chunk_size] as chunk:
+                feed(chunk)
+
+
+def _exceeded(limit: str, value: int) -> DeserializationLimitExceededException:
+    return DeserializationLimitExceededException(f'Document exceeds {limit} of {value}')
+
+
+def check_bytes_limit(data: BytesLike, limits: Optional['DeserializationLimits']) -> None:
+    if limits is not None and limits.max_bytes is not None and len(data) > limits.max_bytes:
+        raise _exceeded('max_bytes', limits.max_bytes)
+
+
+def _check_string_lengths(values: Iterable[str], max_string_length: Optional[int]) -> None:
+    if max_string_length is not None and any(len(v) > max_string_length for v in values):
+        raise _exceeded('max_string_length', max_string_length)
+
+
+def check_json_limits(data: Any, limits: Optional['DeserializationLimits']) -> None:
+    """
+    Walk parsed JSON data - iteratively, so that deep nesting does not hit the recursion limit.
+
+    The JSON parser is not incremental, so the data is fully decoded before this checks it.
+    Only `max_bytes` bounds the memory it takes - see :func:`check_bytes_limit()`.
+    """
+    if limits is None:
+        return
+    max_depth = limits.max_depth
+    max_elements = limits.max_elements
+    max_string_length = limits.max_string_length
+    if max_depth is None and max_elements is None and max_string_length is None:
+        return
+    elements = 0
+    stack: List[Tuple[Any, int]] = [(data, 1)]
+    while stack:
+        value, depth = stack.pop()
+        elements += 1
+        if max_elements is not None and elements > max_elements:
+            raise _exceeded('max_elements', max_elements)
+        if isinstance(value, str):
+            _check_string_lengths((value,), max_string_length)
+        elif isinstance(value, (dict, list)):
+            if max_depth is not None and depth > max_depth:
+                raise _exceeded('max_depth', max_depth)
+            if isinstance(value, dict):
+                _check_string_lengths(value.keys(), max_string_length)
+                value = value.values()
+            stack.extend((v, depth + 1) for v in value)
+
+
+class _SafeTreeBuilder(TreeBuilder):
+    """
+    TreeBuilder that rejects any document type declaration, as soon as the parser reaches it.
+
+    Without a DTD, there are no entities to expand, and no external ones to resolve.
+    CycloneDX documents do not have any.
+    """
+
+    def doctype(self, name: Any, pubid: Any, system: Any) -> None:
+        raise ValueError('XML document type declarations are not allowed')
+
+
+class _LimitedTreeBuilder(_SafeTreeBuilder):
+    """
+    TreeBuilder that fails fast, while the document is still being parsed.
+    """
+
+    def __init__(self, limits: 'DeserializationLimits') -> None:
+        super().__init__()
+        self.__max_depth = limits.max_depth
+        self.__max_elements = limits.max_elements
+        self.__max_string_length = limits.max_string_length
+        self.__depth = 0
+        self.__elements = 0
+        self.__text_length = 0
+
+    def start(self, tag: Any, attrs: Dict[Any, Any]) -> Element:
+        self.__depth += 1
+        self.__elements += 1
+        self.__text_length = 0
+        if self.__max_depth is not None and self.__depth > self.__max_depth:
+            raise _exceeded('max_depth', self.__max_depth)
+        if self.__max_elements is not None and self.__elements > self.__max_elements:
+            raise _exceeded('max_elements', self.__max_elements)
+        _check_string_lengths(attrs.values(), self.__max_string_length)
+        return super().start(tag, attrs)
+
+    def end(self, tag: Any) -> Element:
+        self.__depth -= 1
+        self.__text_length = 0
+        return super().end(tag)
+
+    def data(self, data: str) -> None:
+        # a text might be passed in several parts
+        self.__text_length += len(data)
+        if self.__max_string_length is not None and self.__text_length > self.__max_string_length:
+            raise _exceeded('max_string_length', self.__max_string_length)
+        super().data(data)
+
+
+def xml_from_bytes(data: BytesLike, limits: Optional['DeserializationLimits'] = None) -> Element:
+    """
+    Parse an XML document from raw bytes, feeding the parser chunk by chunk.
+
+    Raises `ValueError` if the document has a document type declaration - see :class:`_SafeTreeBuilder`.
+    """
+    # no DTD means no entities - so the plain parser is safe
+    parser = XMLParser(  # nosec B314
+        target=_SafeTreeBuilder() if limits is None else _LimitedTreeBuilder(limits))
+    feed_chunks(parser.feed, data)
+    root: Element = parser.close()
+    return root
+
+
+def xml_namespace(element: Element) -> str:
+    """
+    Get the namespace of an element - empty string if there is none.
+    """
+    tag = element.tag
+    return tag[1:tag.index('}')] if tag.startswith('{') else ''
@@ -0,0 +1,51 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from packageurl import PackageURL
+
+# the same PURLs tend to show up over and over again - in a single BOM, and across BOMs.
+PURL_CACHE_SIZE = 4096
+
+
+_PurlFields = Tuple[str, Optional[str], str, Optional[str], Tuple[Tuple[str, str], ...], Optional[str]]
+
+
+@lru_cache(maxsize=PURL_CACHE_SIZE)
+def _parse(purl: str) -> _PurlFields:
+    # immutable - `PackageURL.qualifiers` is a dict, so parsed instances must not be shared
+    type_, namespace, name, version, qualifiers, subpath = PackageURL.from_string(purl=purl)
+    return type_, namespace, name, version, tuple(qualifiers.items()), subpath
+
+
+def purl_from_str(purl: str) -> PackageURL:
+    """
+    Parse a PURL string. Parsing is memoized, but each call gets its own `PackageURL` instance.
+
+    Raises `ValueError` if the string does not parse.
+    """
+    type_, namespace, name, version, qualifiers, subpath = _parse(purl)
+    # the fields are normalized already - skip the costly normalization of the constructor
+    return PackageURL._make((type_, namespace, name, version, dict(qualifiers), subpath))
@@ -0,0 +1,94 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+import marshal
+from hashlib import sha256
+from json import loads as json_loads
+from os import fspath, makedirs, replace, unlink
+from os.path import basename, join
+from sys import implementation
+from tempfile import mkstemp
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .io import StrPath
+
+# `marshal` data is specific to the interpreter - so is the cache.
+_CACHE_FILE_SUFFIX = f'.{implementation.cache_tag}-{marshal.version}.marshal'
+
+_cache_dir: Optional[str] = None
+
+
+def set_cache_dir(directory: Optional['StrPath']) -> None:
+    """
+    Set the directory of the on-disk cache of preprocessed schema resources. `None` disables the cache.
+    """
+    global _cache_dir
+    _cache_dir = None if directory is None else fspath(directory)
+
+
+def get_cache_dir() -> Optional[str]:
+    return _cache_dir
+
+
+def load_json(path: str) -> Any:
+    """
+    Load a JSON schema resource.
+
+    If the cache is enabled, the parsed resource is read from there - keyed by the hash of the resource file,
+    so that changed resources never hit stale cache entries.
+    Any failure to read or write the cache falls back to parsing the resource.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    cache_dir = _cache_dir
+    if cache_dir is None:
+        return json_loads(raw)
+    cache_file = join(cache_dir, f'{basename(path)}.{sha256(raw).hexdigest()}{_CACHE_FILE_SUFFIX}')
+    try:
+        with open(cache_file, 'rb') as f:
+            # reading at once is way faster than `marshal.load()` from the file
+            return marshal.loads(f.read())  # nosec B302 - the cache directory is to be trusted
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    data = json_loads(raw)
+    _write(cache_dir, cache_file, marshal.dumps(data))
+    return data
+
+
+def _write(cache_dir: str, cache_file: str, data: bytes) -> None:
+    # write to a temporary file first - concurrent readers must never see partial content.
+    try:
+        makedirs(cache_dir, exist_ok=True)
+        fd, tmp_file = mkstemp(dir=cache_dir, suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with open(fd, 'wb') as f:
+            f.write(data)
+        replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            unlink(tmp_file)
+        except OSError:
+            pass
@@ -0,0 +1,217 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple
+
+# deprecated SPDX-IDs - see https://spdx.org/licenses/#deprecated
+DEPRECATED_IDS: FrozenSet[str] = frozenset((
+    'AGPL-1.0', 'AGPL-3.0', 'BSD-2-Clause-FreeBSD', 'BSD-2-Clause-NetBSD', 'bzip2-1.0.5', 'eCos-2.0',
+    'GFDL-1.1', 'GFDL-1.2', 'GFDL-1.3', 'GPL-1.0', 'GPL-1.0+', 'GPL-2.0', 'GPL-2.0+',
+    'GPL-2.0-with-autoconf-exception', 'GPL-2.0-with-bison-exception', 'GPL-2.0-with-classpath-exception',
+    'GPL-2.0-with-font-exception', 'GPL-2.0-with-GCC-exception', 'GPL-3.0', 'GPL-3.0+',
+    'GPL-3.0-with-autoconf-exception', 'GPL-3.0-with-GCC-exception', 'LGPL-2.0', 'LGPL-2.0+', 'LGPL-2.1',
+    'LGPL-2.1+', 'LGPL-3.0', 'LGPL-3.0+', 'Net-SNMP', 'Nokia-Qt-exception-1.1', 'Nunit', 'StandardML-NJ',
+    'wxWindows',
+))
+
+# common long forms and nicknames, and what they are called in SPDX-IDs.
+# applied in order, on lower-cased text - so longer phrases come first.
+_PHRASES: Tuple[Tuple[Pattern[str], str], ...] = tuple((re.compile(rf'\b{pattern}\b'), repl) for pattern, repl in (
+    (r'gnu', ''),
+    (r'(?:lesser|library) general public', 'lgpl'),
+    (r'affero general public', 'agpl'),
+    (r'general public', 'gpl'),
+    (r'mozilla public', 'mpl'),
+    (r'eclipse public', 'epl'),
+    (r'european union public', 'eupl'),
+    (r'common development and distribution', 'cddl'),
+    (r'academic free', 'afl'),
+    (r'boost software', 'bsl'),
+    (r'universal permissive', 'upl'),
+    (r'python software foundation', 'psf'),
+    (r'apache software', 'apache'),
+    (r'creative commons', 'cc'),
+    (r'attribution', 'by'),
+    (r'share ?alike', 'sa'),
+    (r'non ?commercial', 'nc'),
+    (r'no ?deriv(?:ative)?s', 'nd'),
+    (r'(?:new|modified|revised) bsd', 'bsd 3 clause'),
+    (r'simplified bsd', 'bsd 2 clause'),
+    (r'expat', 'mit'),
+    (r'(?:or|and) (?:any )?(?:later|newer|greater)(?: versions?)?', ' orlater '),
+))
+
+# words that carry no meaning for telling licenses apart
+_NOISE = frozenset((
+    'the', 'a', 'license', 'licence', 'licenses', 'licences', 'licensed', 'version', 'ver', 'under',
+    'international', 'universal',
+))
+
+# the operators of compound expressions - case-sensitive, so that "or later" is not one
+_OPERATORS = re.compile(r'\b(?:AND|OR|WITH)\b')
+_PARENTHESIZED = re.compile(r'\(([^()]*)\)')
+# on normalized keys - like "gpl 2 with classpath exception"
+_WITH_EXCEPTION = re.compile(r'\bwith\b.*\bexception\b')
+
+_SEPARATORS = re.compile(r'[^a-z0-9.+]+')
+_PLUS = re.compile(r'\+')
+_VERSION_PREFIX = re.compile(r'(?:(?<=[a-z])|\b)v\.?(?=\d)')
+_LETTER_DIGIT = re.compile(r'(?<=[a-z])(?=\d)|(?<=\d)(?=[a-z])')
+_TRAILING_ZEROS = re.compile(r'(?<=\d)(?:\.0)+(?![.\d])')
+
+
+def normalize(value: str) -> str:
+    """Normalize a license name or ID - so that common spellings of the same license are equal."""
+    value = _SEPARATORS.sub(' ', value.lower())
+    for pattern, repl in _PHRASES:
+        value = pattern.sub(repl, value)
+    value = _PLUS.sub(' orlater ', value)
+    value = _VERSION_PREFIX.sub(' ', value)
+    value = _LETTER_DIGIT.sub(' ', value)
+    value = _TRAILING_ZEROS.sub('', value)
+    words: Set[str] = set()
+    tokens: List[str] = []
+    for token in value.split():
+        token = token.strip('.')
+        if not token or token in _NOISE:
+            continue
+        if token[0].isdigit():
+            tokens.append(token)  # versions are kept as they are
+        elif token not in words:
+            # repetitions of words, like in "MIT License MIT", are dropped
+            words.add(token)
+            tokens.append(token)
+    return ' '.join(tokens)
+
+
+def strip_annotations(value: str) -> Optional[str]:
+    """Remove parenthesized annotations that repeat the rest - like "(MIT)" in "MIT License (MIT)".
+
+    :returns: `None` if `value` looks like a compound expression -
+              with an operator, or with parentheses that add something
+    """
+    if _OPERATORS.search(value):
+        return None
+    if '(' not in value and ')' not in value:
+        return value
+    rest = _PARENTHESIZED.sub(' ', value)
+    if '(' in rest or ')' in rest:  # nested or unbalanced
+        return None
+    rest_tokens = set(normalize(rest).split())
+    for annotation in _PARENTHESIZED.findall(value):
+        if not rest_tokens.issuperset(normalize(annotation).split()):
+            return None
+    return rest
+
+
+def _version_signature(key: str) -> Tuple[Tuple[str, ...], bool]:
+    """Get the version numbers of a normalized key, and whether it is "or later".
+
+    Like with the IDs, "only" is the default - ``GPL-2.0`` is ``GPL-2.0-only``.
+    """
+    tokens = key.split()
+    return tuple(token for token in tokens if token[0].isdigit()), 'orlater' in tokens
+
+
+def _trigrams(key: str) -> Set[str]:
+    padded = f' {key} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SpdxIdMatcher:
+    """Matches free text to SPDX-IDs.
+
+    Lookups go from cheap to costly: the normalized text, its tokens in any order,
+    then the best overlap of character trigrams.
+    Similar is not good enough for versions: the trigram lookup considers only IDs of the very same
+    version numbers and "only"/"or later" - text without any version does not match a versioned ID.
+    Compound expressions match nothing - see :func:`strip_annotations()`.
+    Neither does similar text of a license with an exception, like "GPL-2.0 with Classpath exception".
+    Thread-safe - all state is built in the constructor.
+
+    :param ids: the SPDX-IDs to match to
+    :param deprecated_ids: the deprecated ones among ``ids`` - they are matched to their successors, if any,
+                           but never returned themselves
+    """
+
+    def __init__(self, ids: Iterable[str], deprecated_ids: Iterable[str] = ()) -> None:
+        ids = frozenset(ids)
+        deprecated_ids = frozenset(deprecated_ids)
+        by_key: Dict[str, str] = {}
+        for id_ in sorted(ids, key=len):
+            # later ones win - so deprecated IDs, like `GPL-2.0+`, lose against `GPL-2.0-or-later`
+            target = f'{id_}-only' if f'{id_}-only' in ids else id_  # like `GPL-2.0` -> `GPL-2.0-only`
+            if target in deprecated_ids:
+                continue
+            by_key[normalize(id_)] = target
+        by_key.pop('', None)
+        self._by_key = by_key
+        by_sorted_key: Dict[str, Optional[str]] = {}
+        for key, id_ in by_key.items():
+            sorted_key = ' '.join(sorted(key.split()))
+            # ambiguous ones are dropped
+            by_sorted_key[sorted_key] = id_ if by_sorted_key.get(sorted_key, id_) == id_ else None
+        self._by_sorted_key = by_sorted_key
+        self._keys: List[Tuple[str, int, Tuple[Tuple[str, ...], bool]]] = []
+        self._postings: Dict[str, List[int]] = {}
+        for key, id_ in by_key.items():
+            trigrams = _trigrams(key)
+            index = len(self._keys)
+            self._keys.append((id_, len(trigrams), _version_signature(key)))
+            for trigram in trigrams:
+                self._postings.setdefault(trigram, []).append(index)
+
+    def match(self, value: str) -> Optional[Tuple[str, float]]:
+        """Get the best matching SPDX-ID and its score - from ``1.0`` for a known spelling, down to ``0.0``.
+
+        :returns: ``None`` if nothing matches at all
+        """
+        stripped = strip_annotations(value)
+        if stripped is None:
+            return None
+        key = normalize(stripped)
+        if not key:
+            return None
+        id_ = self._by_key.get(key) or self._by_sorted_key.get(' '.join(sorted(key.split())))
+        if id_ is not None:
+            return id_, 1.0
+        if _WITH_EXCEPTION.search(key):
+            # a license with an exception - no single ID is similar enough, unless it is a known spelling
+            return None
+        trigrams = _trigrams(key)
+        overlaps: Dict[int, int] = {}
+        for trigram in trigrams:
+            for index in self._postings.get(trigram, ()):
+                overlaps[index] = overlaps.get(index, 0) + 1
+        signature = _version_signature(key)
+        keys = self._keys
+        overlaps = {index: overlap for index, overlap in overlaps.items() if keys[index][2] == signature}
+        if not overlaps:
+            return None
+        nr_trigrams = len(trigrams)
+        best_score, best_index = max(
+            # Sørensen-Dice coefficient; on a tie, the first key - of the shorter ID - wins
+            (2.0 * overlap / (nr_trigrams + keys[index][1]), -index)
+            for index, overlap in overlaps.items())
+        return keys[-best_index][0], best_score
@@ -0,0 +1,186 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+Asyncio-friendly variants of the blocking, CPU-heavy functionality - see :class:`AsyncRunner`.
+"""
+
+__all__ = ['AsyncRunner']
+
+from asyncio import Semaphore, StreamWriter, get_running_loop
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
+
+from ._internal.io import CHUNK_SIZE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._internal.io import BytesLike
+    from .model.bom import Bom
+    from .output import BaseOutput
+    from .schema import OutputFormat, SchemaVersion
+    from .serialization import DeserializationLimits
+    from .validation import ValidationError
+
+_T = TypeVar('_T')
+
+
+# region tasks - module-level, so that they can be sent to a process pool
+
+def _validate(output_format: 'OutputFormat', schema_version: 'SchemaVersion',
+              data: Union[str, 'BytesLike']) -> Optional['ValidationError']:
+    from .validation import make_schemabased_validator
+    validator = make_schemabased_validator(output_format, schema_version)
+    if isinstance(data, str):
+        return validator.validate_str(data)
+    return validator.validate_bytes(data)
+
+
+def _validate_bom(bom: 'Bom') -> bool:
+    return bom.validate()
+
+
+def _bom_from_bytes(data: 'BytesLike', output_format: Optional['OutputFormat'],
+                    limits: Optional['DeserializationLimits']) -> 'Bom':
+    from .model.bom import Bom
+    return Bom.from_bytes(data, output_format, limits=limits)
+
+
+def _output_as_string(bom: 'Bom', output_format: 'OutputFormat', schema_version: 'SchemaVersion',
+                      deterministic_bom_refs: bool, indent: Optional[Union[int, str]]) -> str:
+    # a fresh outputter - outputters are stateful, and must not be shared across threads
+    from .output import make_outputter
+    return make_outputter(bom, output_format, schema_version, deterministic_bom_refs=deterministic_bom_refs
+                          ).output_as_string(indent=indent)
+
+# endregion tasks
+
+
+class AsyncRunner:
+    """Runs blocking, CPU-heavy work off the event loop - in an executor, with bounded concurrency.
+
+    Example::
+
+        runner = AsyncRunner(max_concurrency=4)
+        error = await runner.validate(OutputFormat.JSON, SchemaVersion.V1_6, request_body)
+        bom = await runner.bom_from_bytes(request_body)
+        await runner.write_to(make_outputter(bom, OutputFormat.JSON, SchemaVersion.V1_6), writer)
+
+    The work is done by ``executor`` - the loop's default executor, if ``None``.
+    A ``ProcessPoolExecutor`` is supported; then, all arguments must be picklable - a `mmap.mmap` is not.
+
+    At most ``max_concurrency`` calls are in the executor at any time; more calls wait for their turn.
+    Cancelling a call that waits for its turn, or that is not started by the executor yet, drops its work.
+    Work that has started already runs to completion - its result is discarded.
+
+    Do not modify a :class:`~cyclonedx.model.bom.Bom` while it is worked on.
+    Outputting the same ``Bom`` concurrently is fine - it does not modify the ``Bom``.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, *,
+                 max_concurrency: Optional[int] = None) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f'Unexpected max_concurrency: {max_concurrency!r}')
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        self.__semaphore: Optional[Semaphore] = None
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """The executor that does the work - ``None`` means the loop's default executor."""
+        return self._executor
+
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        """Limit of calls in the executor at any time - ``None`` means no limit."""
+        return self._max_concurrency
+
+    async def run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run any blocking ``func`` in the executor.
+
+        :param func: the function to run
+        :param args: positional arguments for ``func``
+        :return: the result of ``func``
+        """
+        loop = get_running_loop()
+        if self._max_concurrency is None:
+            return await loop.run_in_executor(self._executor, func, *args)
+        if self.__semaphore is None:
+            # created lazily - in the running loop
+            self.__semaphore = Semaphore(self._max_concurrency)
+        async with self.__semaphore:
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    async def validate(self, output_format: 'OutputFormat', schema_version: 'SchemaVersion',
+                       data: Union[str, 'BytesLike']) -> Optional['ValidationError']:
+        """Validate a serialized document against the schema of its format and version.
+
+        Requires the optional validation dependencies - see :mod:`cyclonedx.validation`.
+
+        :param output_format: the format of the document
+        :param schema_version: the schema version of the document
+        :param data: the document - a string or the raw bytes
+        :return: validation error
+        :retval None: if ``data`` is valid
+        :retval ValidationError: if ``data`` is invalid
+        """
+        return await self.run(_validate, output_format, schema_version, data)
+
+    async def validate_bom(self, bom: 'Bom') -> bool:
+        """Validate a ``Bom`` - see :meth:`cyclonedx.model.bom.Bom.validate()`."""
+        return await self.run(_validate_bom, bom)
+
+    async def bom_from_bytes(self, data: 'BytesLike', output_format: Optional['OutputFormat'] = None, *,
+                             limits: Optional['DeserializationLimits'] = None) -> 'Bom':
+        """Deserialize a document - see :meth:`cyclonedx.model.bom.Bom.from_bytes()`."""
+        return await self.run(_bom_from_bytes, data, output_format, limits)
+
+    async def output_as_string(self, outputter: 'BaseOutput', *,
+                               indent: Optional[Union[int, str]] = None) -> str:
+        """Serialize the ``Bom`` of an outputter - like its ``output_as_string()``.
+
+        The outputter itself is not used - only its ``Bom``, format, schema version and settings.
+
+        :param outputter: the outputter
+        :param indent: the indentation - see the outputter's ``output_as_string()``
+        :return: the serialized document
+        """
+        return await self.run(_output_as_string,
+                              outputter.get_bom(), outputter.output_format, outputter.schema_version,
+                              outputter.deterministic_bom_refs, indent)
+
+    async def write_to(self, outputter: 'BaseOutput', stream: StreamWriter, *,
+                       indent: Optional[Union[int, str]] = None,
+                       chunk_size: int = CHUNK_SIZE) -> None:
+        """Serialize the ``Bom`` of an outputter, and write it to a stream - UTF-8 encoded.
+
+        The document is written in chunks; after each one, the stream is drained -
+        so a slow peer slows down the writing, instead of piling up the document in the stream's buffer.
+        The stream is neither closed nor drained completely afterwards.
+
+        :param outputter: the outputter - see :meth:`output_as_string()`
+        :param stream: the stream to write to
+        :param indent: the indentation - see the outputter's ``output_as_string()``
+        :param chunk_size: number of bytes per chunk
+        """
+        if chunk_size < 1:
+            raise ValueError(f'Unexpected chunk_size: {chunk_size!r}')
+        data = (await self.output_as_string(outputter, indent=indent)).encode('utf-8')
+        with memoryview(data) as view:
+            for offset in range(0, len(view), chunk_size):
+                stream.write(view[offset:offset + chunk_size])
+                await stream.drain()
@@ -37,6 +37,14 @@ class CycloneDxDeserializationException(CycloneDxException):
     pass
 
 
+class DeserializationLimitExceededException(CycloneDxDeserializationException):
+    """
+    Raised when a document that is being deserialized exceeds a configured
+    :py:class:`cyclonedx.serialization.DeserializationLimits`.
+    """
+    pass
+
+
 class SerializationOfUnsupportedComponentTypeException(CycloneDxSerializationException):
     """
     Raised when attempting serializing/normalizing a :py:class:`cyclonedx.model.component.Component`
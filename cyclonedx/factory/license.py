@@ -15,11 +15,15 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
 
 from ..exception.factory import InvalidLicenseExpressionException, InvalidSpdxLicenseException
-from ..model.license import DisjunctiveLicense, LicenseExpression
-from ..spdx import fixup_id as spdx_fixup, is_compound_expression as is_spdx_compound_expression
+from ..model.license import DisjunctiveLicense, LicenseExpression, _freeze as _freeze_license
+from ..spdx import (
+    fixup_id as spdx_fixup,
+    is_compound_expression as is_spdx_compound_expression,
+    validate_expressions as validate_spdx_expressions,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..model import AttachedText, XsUri
@@ -35,23 +39,48 @@ class LicenseFactory:
                          license_acknowledgement: Optional['LicenseAcknowledgement'] = None
                          ) -> 'License':
         """Make a :class:`cyclonedx.model.license.License` from a string."""
-        try:
-            return self.make_with_id(value,
-                                     text=license_text,
-                                     url=license_url,
+        spdx_license_id = spdx_fixup(value)
+        if spdx_license_id is not None:
+            return DisjunctiveLicense(id=spdx_license_id,
+                                      text=license_text,
+                                      url=license_url,
+                                      acknowledgement=license_acknowledgement)
+        if is_spdx_compound_expression(value):
+            return LicenseExpression(value,
                                      acknowledgement=license_acknowledgement)
-        except InvalidSpdxLicenseException:
-            pass
-        try:
-            return self.make_with_expression(value,
-                                             acknowledgement=license_acknowledgement)
-        except InvalidLicenseExpressionException:
-            pass
         return self.make_with_name(value,
                                    text=license_text,
                                    url=license_url,
                                    acknowledgement=license_acknowledgement)
 
+    def make_from_strings(self, values: Iterable[str]) -> Dict[str, 'License']:
+        """Make licenses from many strings at once - like :meth:`make_from_string()`, but shared.
+
+        Meant for large inputs, like the output of license scanners, that repeat the same few strings.
+        Each distinct string is resolved only once,
+        and strings that resolve to the same SPDX-ID - like ``mit`` and ``MIT`` - get the same license.
+        The licenses are frozen, so that they can be shared: setting any of their properties raises
+        :class:`AttributeError`.
+
+        :returns: mapping of each distinct string to its license - in order of first appearance
+        """
+        spdx_license_ids = {value: spdx_fixup(value) for value in dict.fromkeys(values)}
+        is_expression = validate_spdx_expressions(
+            value for value, spdx_license_id in spdx_license_ids.items() if spdx_license_id is None)
+        by_id: Dict[str, 'License'] = {}
+        licenses: Dict[str, 'License'] = {}
+        for value, spdx_license_id in spdx_license_ids.items():
+            if spdx_license_id is not None:
+                license = by_id.get(spdx_license_id)
+                if license is None:
+                    license = by_id[spdx_license_id] = _freeze_license(DisjunctiveLicense(id=spdx_license_id))
+            elif is_expression[value]:
+                license = _freeze_license(LicenseExpression(value))
+            else:
+                license = _freeze_license(DisjunctiveLicense(name=value))
+            licenses[value] = license
+        return licenses
+
     def make_with_expression(self, expression: str, *,
                              acknowledgement: Optional['LicenseAcknowledgement'] = None
                              ) -> LicenseExpression:
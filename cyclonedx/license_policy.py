@@ -0,0 +1,196 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+License policies - which licenses are allowed or denied - evaluated over a :class:`~cyclonedx.model.bom.Bom`.
+"""
+
+__all__ = ['LicensePolicy', 'LicensePolicyViolation']
+
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .model.component import Component
+from .model.license import DisjunctiveLicense, LicenseExpression
+from .model.service import Service
+from .spdx import (
+    evaluate_expression as evaluate_spdx_expression,
+    fixup_id as spdx_fixup,
+    parse_expression as parse_spdx_expression,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .model.bom import Bom
+    from .model.license import License
+
+_WITH = ' WITH '
+
+
+class LicensePolicyViolation:
+    """A component or service that violates a :class:`LicensePolicy`."""
+
+    subject: Union[Component, Service]
+    """The violating component or service."""
+
+    licenses: Tuple['License', ...]
+    """The licenses that are not acceptable - empty, if the subject violates by having no license at all."""
+
+    def __init__(self, subject: Union[Component, Service], licenses: Tuple['License', ...]) -> None:
+        self.subject = subject
+        self.licenses = licenses
+
+    def __repr__(self) -> str:
+        return f'<LicensePolicyViolation subject={self.subject!r} licenses={self.licenses!r}>'
+
+
+class LicensePolicy:
+    """Policy of allowed and denied licenses.
+
+    A license is acceptable, if it is not denied - and if it is allowed, in case there is an allow-list.
+    Licenses are given as SPDX-IDs, license names, or licenses with an exception -
+    like ``GPL-2.0-or-later WITH Classpath-exception-2.0``, which is judged by the license alone, unless listed itself.
+    A compound expression is acceptable, if any of its choices has only acceptable licenses -
+    see :func:`cyclonedx.spdx.evaluate_expression()`. Unparsable expressions are not acceptable.
+    A component or service is acceptable, if all of its licenses are.
+
+    Example - does anything in the BOM fall under a strong copyleft license::
+
+        copyleft = LicensePolicy(denied=('GPL-2.0-only', 'GPL-2.0-or-later', 'GPL-3.0-only', 'GPL-3.0-or-later'))
+        if copyleft.has_violations(bom):
+            ...
+
+    Verdicts are memoized per policy - each distinct license is evaluated only once,
+    however many components share it.
+
+    :param allowed: the allow-list - ``None`` means to allow everything that is not denied
+    :param denied: the deny-list
+    :param require_license: whether components and services without any license violate the policy
+    """
+
+    def __init__(self, *,
+                 allowed: Optional[Iterable[str]] = None,
+                 denied: Iterable[str] = (),
+                 require_license: bool = False) -> None:
+        self.__allowed = None if allowed is None else self.__canonicalize(allowed)
+        self.__denied = self.__canonicalize(denied)
+        self.__require_license = require_license
+        self.__terms: Dict[str, bool] = {}
+        self.__licenses: Dict['License', bool] = {}
+
+    @property
+    def allowed(self) -> Optional[FrozenSet[str]]:
+        """The allow-list, canonicalized - ``None`` if everything is allowed that is not denied."""
+        return self.__allowed
+
+    @property
+    def denied(self) -> FrozenSet[str]:
+        """The deny-list, canonicalized."""
+        return self.__denied
+
+    @property
+    def require_license(self) -> bool:
+        """Whether components and services without any license violate the policy."""
+        return self.__require_license
+
+    @staticmethod
+    def __canonicalize(licenses: Iterable[str]) -> FrozenSet[str]:
+        canonical: Set[str] = set()
+        for license in licenses:
+            try:
+                choices = parse_spdx_expression(license)
+            except ValueError:  # too many choices - so not a single license, anyway
+                choices = None
+            if choices is not None and len(choices) == 1:
+                terms, = choices
+                if len(terms) == 1:
+                    canonical.update(terms)
+                    continue
+            canonical.add(spdx_fixup(license) or license)
+        return frozenset(canonical)
+
+    def is_acceptable(self, license: 'License') -> bool:
+        """Whether a license is acceptable under this policy."""
+        verdict = self.__licenses.get(license)
+        if verdict is None:
+            if isinstance(license, LicenseExpression):
+                verdict = self.__is_expression_acceptable(license.value)
+            elif isinstance(license, DisjunctiveLicense) and license.id is not None:
+                verdict = self.__is_expression_acceptable(license.id)
+            else:
+                verdict = self.__is_term_acceptable(license.name or '')
+            self.__licenses[license] = verdict
+        return verdict
+
+    def __is_expression_acceptable(self, expression: str) -> bool:
+        # unparsable ones are not acceptable
+        return evaluate_spdx_expression(expression, self.__is_term_acceptable) is True
+
+    def __is_term_acceptable(self, term: str) -> bool:
+        verdict = self.__terms.get(term)
+        if verdict is None:
+            if term in self.__denied:
+                verdict = False
+            elif self.__allowed is not None and term in self.__allowed:
+                verdict = True
+            else:
+                # a license with exception that is not listed itself is judged by the license
+                license = term.split(_WITH, 1)[0]
+                verdict = license not in self.__denied and (self.__allowed is None or license in self.__allowed)
+            self.__terms[term] = verdict
+        return verdict
+
+    def check(self, subject: Union[Component, Service]) -> Optional[LicensePolicyViolation]:
+        """Check a single component or service - not the ones nested in it.
+
+        :return: the violation
+        :retval None: if ``subject`` is acceptable
+        """
+        licenses = subject.licenses
+        if not licenses:
+            return LicensePolicyViolation(subject, ()) if self.__require_license else None
+        offending = tuple(license for license in licenses if not self.is_acceptable(license))
+        return LicensePolicyViolation(subject, offending) if offending else None
+
+    def iter_violations(self, bom: 'Bom') -> Iterator[LicensePolicyViolation]:
+        """Check all components and services of a BOM, in one pass.
+
+        This includes the component the BOM describes, and all nested components and services.
+        Tools that made the BOM are not checked.
+
+        :return: iterator of violations; empty if all are acceptable
+        """
+        components: List[Component] = list(reversed(bom.components))
+        if bom.metadata.component is not None:
+            components.append(bom.metadata.component)
+        # nested structures are walked iteratively - deeply nested models must not exhaust the stack
+        while components:
+            component = components.pop()
+            violation = self.check(component)
+            if violation is not None:
+                yield violation
+            components.extend(reversed(component.components))
+        services: List[Service] = list(reversed(bom.services))
+        while services:
+            service = services.pop()
+            violation = self.check(service)
+            if violation is not None:
+                yield violation
+            services.extend(reversed(service.services))
+
+    def has_violations(self, bom: 'Bom') -> bool:
+        """Whether any component or service of a BOM violates this policy - see :meth:`iter_violations()`."""
+        return next(self.iter_violations(bom), None) is not None
@@ -25,9 +25,9 @@ from a `cyclonedx.parser.BaseParser` implementation.
 import re
 from datetime import datetime
 from enum import Enum
-from functools import reduce
+from functools import lru_cache
 from json import loads as json_loads
-from typing import Any, Dict, FrozenSet, Generator, Iterable, List, Optional, Tuple, Type, Union
+from typing import Any, Dict, FrozenSet, Generator, Iterable, List, Optional, Type, Union
 from urllib.parse import quote as url_quote
 from uuid import UUID
 from warnings import warn
@@ -306,6 +306,11 @@ class _HashTypeRepositorySerializationHelper(serializable.helpers.BaseHelper):
     __CASES[SchemaVersion1Dot5] = __CASES[SchemaVersion1Dot4]
     __CASES[SchemaVersion1Dot6] = __CASES[SchemaVersion1Dot5]
 
+    @classmethod
+    def cases(cls, view: Type[serializable.ViewType]) -> FrozenSet[HashAlgorithm]:
+        """Get the values that are supported by ``view``."""
+        return cls.__CASES.get(view, frozenset())
+
     @classmethod
     def __prep(cls, hts: Iterable['HashType'], view: Type[serializable.ViewType]) -> Generator['HashType', None, None]:
         cases = cls.__CASES.get(view, ())
@@ -650,6 +655,11 @@ class _ExternalReferenceSerializationHelper(serializable.helpers.BaseHelper):
         ExternalReferenceType.RFC_9166,
     }
 
+    @classmethod
+    def cases(cls, view: Type[serializable.ViewType]) -> FrozenSet[ExternalReferenceType]:
+        """Get the values that are supported by ``view``."""
+        return cls.__CASES.get(view, frozenset())
+
     @classmethod
     def __normalize(cls, extref: ExternalReferenceType, view: Type[serializable.ViewType]) -> str:
         return (
@@ -692,21 +702,20 @@ class XsUri(serializable.helpers.BaseHelper):
 
     _INVALID_URI_REGEX = re.compile(r'%(?![0-9A-F]{2})|#.*#', re.IGNORECASE + re.MULTILINE)
 
-    __SPEC_REPLACEMENTS = (
-        (' ', '%20'),
-        ('"', '%22'),
-        ("'", '%27'),
-        ('[', '%5B'),
-        (']', '%5D'),
-        ('<', '%3C'),
-        ('>', '%3E'),
-        ('{', '%7B'),
-        ('}', '%7D'),
-    )
+    __SPEC_REPLACEMENTS = str.maketrans({
+        ' ': '%20',
+        '"': '%22',
+        "'": '%27',
+        '[': '%5B',
+        ']': '%5D',
+        '<': '%3C',
+        '>': '%3E',
+        '{': '%7B',
+        '}': '%7D',
+    })
 
-    @staticmethod
-    def __spec_replace(v: str, r: Tuple[str, str]) -> str:
-        return v.replace(*r)
+    # URLs tend to repeat a lot across a BOM - like license URLs, VCS URLs, advisories ...
+    _CACHE_SIZE = 4096
 
     @classmethod
     def _spec_migrate(cls, o: str) -> str:
@@ -722,14 +731,20 @@ class XsUri(serializable.helpers.BaseHelper):
          @see https://datatracker.ietf.org/doc/html/rfc2396
          @see https://datatracker.ietf.org/doc/html/rfc3987
         """
-        return reduce(cls.__spec_replace, cls.__SPEC_REPLACEMENTS, o)
+        return o.translate(cls.__SPEC_REPLACEMENTS)
 
-    def __init__(self, uri: str) -> None:
-        if re.search(XsUri._INVALID_URI_REGEX, uri):
+    @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def __validated_migrated(uri: str) -> str:
+        # the invalid patterns require a `%` or a `#` - skip the regex if there is none
+        if ('%' in uri or '#' in uri) and XsUri._INVALID_URI_REGEX.search(uri):
             raise InvalidUriException(
                 f"Supplied value '{uri}' does not appear to be a valid URI."
             )
-        self._uri = self._spec_migrate(uri)
+        return XsUri._spec_migrate(uri)
+
+    def __init__(self, uri: str) -> None:
+        self._uri = self.__validated_migrated(uri)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, XsUri):
@@ -18,6 +18,7 @@
 
 from datetime import datetime
 from itertools import chain
+from json import loads as json_loads
 from typing import TYPE_CHECKING, Generator, Iterable, Optional, Union
 from uuid import UUID, uuid4
 from warnings import warn
@@ -25,8 +26,20 @@ from warnings import warn
 import serializable
 from sortedcontainers import SortedSet
 
+from .._internal.bom_ref_index import BomRefIndex as _BomRefIndex, replace_observed as _replace_observed
+from .._internal.io import (
+    check_bytes_limit as _check_bytes_limit,
+    check_json_limits as _check_json_limits,
+    map_file as _map_file,
+    xml_from_bytes as _xml_from_bytes,
+    xml_namespace as _xml_namespace,
+)
+from .._internal.purl import purl_from_str as _purl_from_str
 from .._internal.time import get_now_utc as _get_now_utc
 from ..exception.model import LicenseExpressionAlongWithOthersException, UnknownComponentDependencyException
+from ..exception.serialization import DeserializationLimitExceededException
+from ..schema import OutputFormat
+from ..schema.detect import detect_format as _detect_format
 from ..schema.schema import (
     SchemaVersion1Dot0,
     SchemaVersion1Dot1,
@@ -36,7 +49,7 @@ from ..schema.schema import (
     SchemaVersion1Dot5,
     SchemaVersion1Dot6,
 )
-from ..serialization import UrnUuidHelper
+from ..serialization import DeserializationLimits, UrnUuidHelper
 from . import _BOM_LINK_PREFIX, ExternalReference, Property
 from .bom_ref import BomRef
 from .component import Component
@@ -52,6 +65,8 @@ from .vulnerability import Vulnerability
 if TYPE_CHECKING:  # pragma: no cover
     from packageurl import PackageURL
 
+    from .._internal.io import BytesLike, StrPath
+
 
 @serializable.serializable_class
 class BomMetaData:
@@ -336,6 +351,7 @@ class Bom:
         Returns:
             New, empty `cyclonedx.model.bom.Bom` instance.
         """
+        self.__bom_ref_index = _BomRefIndex()
         self.serial_number = serial_number or uuid4()
         self.version = version
         self.metadata = metadata or BomMetaData()
@@ -418,7 +434,7 @@ class Bom:
 
     @components.setter
     def components(self, components: Iterable[Component]) -> None:
-        self._components = SortedSet(components)
+        self._components = _replace_observed(getattr(self, '_components', None), components)
 
     @property
     @serializable.view(SchemaVersion1Dot2)
@@ -439,7 +455,7 @@ class Bom:
 
     @services.setter
     def services(self, services: Iterable[Service]) -> None:
-        self._services = SortedSet(services)
+        self._services = _replace_observed(getattr(self, '_services', None), services)
 
     @property
     @serializable.view(SchemaVersion1Dot1)
@@ -531,7 +547,7 @@ class Bom:
 
     @vulnerabilities.setter
     def vulnerabilities(self, vulnerabilities: Iterable[Vulnerability]) -> None:
-        self._vulnerabilities = SortedSet(vulnerabilities)
+        self._vulnerabilities = _replace_observed(getattr(self, '_vulnerabilities', None), vulnerabilities)
 
     # @property
     # ...
@@ -571,17 +587,92 @@ class Bom:
     def definitions(self, definitions: Definitions) -> None:
         self._definitions = definitions
 
-    def get_component_by_purl(self, purl: Optional['PackageURL']) -> Optional[Component]:
+    @classmethod
+    def from_bytes(cls, data: 'BytesLike', output_format: Optional[OutputFormat] = None, *,
+                   limits: Optional[DeserializationLimits] = None) -> 'Bom':
+        """
+        Deserialize a CycloneDX document from its raw bytes.
+
+        Args:
+            data:
+                The raw document. Any bytes-like object is accepted, including a `mmap.mmap`.
+                XML is parsed from `data` in place. JSON is not: the JSON parser only accepts `bytes`,
+                so any other bytes-like object - like a `mmap.mmap` - is copied as a whole before it is parsed.
+            output_format:
+                The format of the document. Detected from the document itself, if omitted.
+            limits:
+                Optional resource limits. The document is checked against them before any model is built.
+                XML is checked while it is parsed. JSON is decoded completely before it is checked,
+                so for JSON, only `max_bytes` bounds the memory that is taken.
+
+        Raises:
+            `DeserializationLimitExceededException` if the document exceeds any of the `limits`,
+            or nests too deep to be processed at all.
+            `ValueError` if an XML document has a document type declaration - entities are not supported.
+            `TypeError` if the document does not deserialize to an instance of this class.
+
+        Returns:
+            `Bom`
+        """
+        _check_bytes_limit(data, limits)
+        if output_format is None:
+            output_format = _detect_format(data)
+        try:
+            if output_format is OutputFormat.JSON:
+                json = json_loads(data if isinstance(data, (bytes, bytearray)) else bytes(data))
+                _check_json_limits(json, limits)
+                bom = cls.from_json(  # type:ignore[attr-defined]
+                    json)
+            elif output_format is OutputFormat.XML:
+                root = _xml_from_bytes(data, limits)
+                bom = cls.from_xml(  # type:ignore[attr-defined]
+                    root, _xml_namespace(root))
+            else:
+                raise ValueError(f'Unexpected output_format: {output_format!r}')
+        except RecursionError as err:
+            raise DeserializationLimitExceededException(
+                'Document nesting exceeds the recursion limit') from err
+        if not isinstance(bom, cls):
+            raise TypeError(f'Expected an instance of {cls.__name__}, got {type(bom).__name__}')
+        return bom
+
+    @classmethod
+    def from_path(cls, path: 'StrPath', output_format: Optional[OutputFormat] = None, *,
+                  limits: Optional[DeserializationLimits] = None) -> 'Bom':
+        """
+        Deserialize a CycloneDX document file.
+
+        The file is memory-mapped. An XML document is fed to the parser from the mapping as is,
+        a JSON document is copied from it first - see :meth:`from_bytes`.
+
+        Args:
+            path:
+                Path to the document file.
+            output_format:
+                The format of the document. Detected from the document itself, if omitted.
+            limits:
+                Optional resource limits. See :meth:`from_bytes`.
+
+        Returns:
+            `Bom`
+        """
+        with _map_file(path) as data:
+            return cls.from_bytes(data, output_format, limits=limits)
+
+    def get_component_by_purl(self, purl: Optional[Union['PackageURL', str]]) -> Optional[Component]:
         """
         Get a Component already in the Bom by its PURL
 
         Args:
              purl:
                 An instance of `packageurl.PackageURL` to look and find `Component`.
+                A PURL string is also accepted.
 
         Returns:
             `Component` or `None`
         """
+        if isinstance(purl, str):
+            purl = _purl_from_str(purl)
         if purl:
             found = [x for x in self.components if x.purl == purl]
             if len(found) == 1:
@@ -617,6 +708,29 @@ class Bom:
         for c in self.components:
             yield from c.get_all_nested_components(include_self=True)
 
+    def get_by_bom_ref(self, bom_ref: Union[BomRef, str]) -> Optional[Union[Component, Service, Vulnerability]]:
+        """
+        Get the Component, Service or Vulnerability a bom-ref refers to.
+
+        This includes the component the BOM describes, and all nested components and services.
+        Lookups are O(1): they go to an index that is built on first use,
+        and rebuilt on first use after components, services or vulnerabilities of this Bom were added or removed.
+        Changing the value of a `BomRef` in place is not tracked:
+        lookups of the old and the new value stay stale until the next such addition or removal.
+
+        Args:
+            bom_ref:
+                The `BomRef`, or its value - like `Dependency.ref` or `BomTarget.ref`.
+
+        Returns:
+            `Component`, `Service`, `Vulnerability` or `None` - if nothing in this Bom has the bom-ref.
+            If multiple things have the same bom-ref, the first one in document order.
+        """
+        value = bom_ref.value if isinstance(bom_ref, BomRef) else bom_ref
+        if not value:
+            return None
+        return self.__bom_ref_index.get(self, value)
+
     def get_vulnerabilities_for_bom_ref(self, bom_ref: BomRef) -> 'SortedSet[Vulnerability]':
         """
         Get all known Vulnerabilities that affect the supplied bom_ref.
@@ -16,7 +16,8 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 
-from typing import TYPE_CHECKING, Any, Optional
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import serializable
 
@@ -27,6 +28,22 @@ if TYPE_CHECKING:  # pragma: no cover
 
     _T_BR = TypeVar('_T_BR', bound='BomRef')
 
+# values that stand in for the ones of `BomRef`s, by `id()` of the `BomRef` - while a serialization is in progress.
+# context-local, so that concurrent serializations do not interfere; the `BomRef`s themselves are left untouched.
+# see also: `cyclonedx.output.BomRefDiscriminator`
+_SUBSTITUTES: 'ContextVar[Optional[Dict[int, str]]]' = ContextVar('cyclonedx.bom_ref.substitutes', default=None)
+
+
+def _serialized_value(bom_ref: 'BomRef') -> Optional[str]:
+    """The value of a `BomRef` to serialize - a substitute, if there is one.
+
+    Only the serialization looks up substitutes - reading `BomRef.value` stays as cheap as reading an attribute.
+    """
+    substitutes = _SUBSTITUTES.get()
+    if substitutes is not None:
+        return substitutes.get(id(bom_ref), bom_ref._value)
+    return bom_ref._value
+
 
 @serializable.serializable_class
 class BomRef(serializable.helpers.BaseHelper):
@@ -65,7 +82,7 @@ class BomRef(serializable.helpers.BaseHelper):
 
     def __lt__(self, other: Any) -> bool:
         if isinstance(other, BomRef):
-            return str(self) < str(other)
+            return (self._value or '') < (other._value or '')
         return NotImplemented
 
     def __hash__(self) -> int:
@@ -85,7 +102,7 @@ class BomRef(serializable.helpers.BaseHelper):
     @classmethod
     def serialize(cls, o: Any) -> Optional[str]:
         if isinstance(o, cls):
-            return o.value
+            return _serialized_value(o)
         raise SerializationOfUnexpectedValueException(
             f'Attempt to serialize a non-BomRef: {o!r}')
 
@@ -16,9 +16,11 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from itertools import chain
 from os.path import exists
-from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Type, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Type, Union
 from warnings import warn
 
 # See https://github.com/package-url/packageurl-python/issues/65
@@ -27,8 +29,9 @@ from packageurl import PackageURL
 from sortedcontainers import SortedSet
 
 from .._internal.bom_ref import bom_ref_from_str as _bom_ref_from_str
+from .._internal.bom_ref_index import replace_observed as _replace_observed
 from .._internal.compare import ComparablePackageURL as _ComparablePackageURL, ComparableTuple as _ComparableTuple
-from .._internal.hash import file_sha1sum as _file_sha1sum
+from .._internal.hash import file_hashes as _file_hashes
 from ..exception.model import InvalidOmniBorIdException, InvalidSwhidException, NoPropertiesProvidedException
 from ..exception.serialization import (
     CycloneDxDeserializationException,
@@ -324,6 +327,11 @@ class _ComponentScopeSerializationHelper(serializable.helpers.BaseHelper):
     __CASES[SchemaVersion1Dot5] = __CASES[SchemaVersion1Dot4]
     __CASES[SchemaVersion1Dot6] = __CASES[SchemaVersion1Dot5]
 
+    @classmethod
+    def cases(cls, view: Type[serializable.ViewType]) -> FrozenSet[ComponentScope]:
+        """Get the values that are supported by ``view``."""
+        return cls.__CASES.get(view, frozenset())
+
     @classmethod
     def __normalize(cls, cs: ComponentScope, view: Type[serializable.ViewType]) -> Optional[str]:
         return cs.value \
@@ -403,6 +411,11 @@ class _ComponentTypeSerializationHelper(serializable.helpers.BaseHelper):
         ComponentType.CRYPTOGRAPHIC_ASSET,
     }
 
+    @classmethod
+    def cases(cls, view: Type[serializable.ViewType]) -> FrozenSet[ComponentType]:
+        """Get the values that are supported by ``view``."""
+        return cls.__CASES.get(view, frozenset())
+
     @classmethod
     def __normalize(cls, ct: ComponentType, view: Type[serializable.ViewType]) -> Optional[str]:
         if ct in cls.__CASES.get(view, ()):
@@ -1033,7 +1046,8 @@ class Component(Dependable):
     """
 
     @staticmethod
-    def for_file(absolute_file_path: str, path_for_bom: Optional[str]) -> 'Component':
+    def for_file(absolute_file_path: str, path_for_bom: Optional[str], *,
+                 hash_algorithms: Iterable[HashAlgorithm] = (HashAlgorithm.SHA_1,)) -> 'Component':
         """
         Helper method to create a Component that represents the provided local file as a Component.
 
@@ -1042,6 +1056,9 @@ class Component(Dependable):
                 Absolute path to the file you wish to represent
             path_for_bom:
                 Optionally, if supplied this is the path that will be used to identify the file in the BOM
+            hash_algorithms:
+                Algorithms of the hashes to add - all computed from a single read of the file.
+                SHA-1 is always added, since the version is derived from it.
 
         Returns:
             `Component` representing the supplied file
@@ -1049,12 +1066,13 @@ class Component(Dependable):
         if not exists(absolute_file_path):
             raise FileExistsError(f'Supplied file path {absolute_file_path!r} does not exist')
 
-        sha1_hash: str = _file_sha1sum(absolute_file_path)
+        hashes = _file_hashes(absolute_file_path, dict.fromkeys(chain((HashAlgorithm.SHA_1,), hash_algorithms)))
+        sha1_hash: str = hashes[HashAlgorithm.SHA_1]
         return Component(
             name=path_for_bom if path_for_bom else absolute_file_path,
             version=f'0.0.0-{sha1_hash[0:12]}',
             hashes=[
-                HashType(alg=HashAlgorithm.SHA_1, content=sha1_hash)
+                HashType(alg=alg, content=content) for alg, content in hashes.items()
             ],
             type=ComponentType.FILE, purl=PackageURL(
                 type='generic', name=path_for_bom if path_for_bom else absolute_file_path,
@@ -1062,6 +1080,46 @@ class Component(Dependable):
             )
         )
 
+    @staticmethod
+    def for_files(absolute_file_paths: Iterable[str], *,
+                  path_for_bom: Optional[Callable[[str], Optional[str]]] = None,
+                  hash_algorithms: Iterable[HashAlgorithm] = (HashAlgorithm.SHA_1,),
+                  max_workers: Optional[int] = None) -> List['Component']:
+        """
+        Helper method to create Components for many local files - see :meth:`for_file()`.
+
+        The files are hashed across a pool of threads - hashing releases the GIL.
+
+        Args:
+            absolute_file_paths:
+                Absolute paths to the files you wish to represent
+            path_for_bom:
+                Optionally, if supplied this gets the path that will be used to identify a file in the BOM
+            hash_algorithms:
+                Algorithms of the hashes to add - see :meth:`for_file()`
+            max_workers:
+                Maximum number of threads - see :class:`concurrent.futures.ThreadPoolExecutor`
+
+        Returns:
+            `Component` representing each supplied file, in the given order
+        """
+        absolute_file_paths = list(absolute_file_paths)
+        for absolute_file_path in absolute_file_paths:
+            # fail fast - before anything is hashed
+            if not exists(absolute_file_path):
+                raise FileExistsError(f'Supplied file path {absolute_file_path!r} does not exist')
+        hash_algorithms = tuple(hash_algorithms)
+
+        def for_file(absolute_file_path: str) -> 'Component':
+            return Component.for_file(
+                absolute_file_path, path_for_bom(absolute_file_path) if path_for_bom else None,
+                hash_algorithms=hash_algorithms)
+
+        if len(absolute_file_paths) < 2:
+            return list(map(for_file, absolute_file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(for_file, absolute_file_paths))
+
     def __init__(
         self, *,
         name: str,
@@ -1473,6 +1531,7 @@ class Component(Dependable):
     @purl.setter
     def purl(self, purl: Optional[PackageURL]) -> None:
         self._purl = purl
+        self.__purl_comparable = None if purl is None else _ComparablePackageURL(purl)
 
     @property
     @serializable.json_name('omniborId')
@@ -1626,7 +1685,7 @@ class Component(Dependable):
 
     @components.setter
     def components(self, components: Iterable['Component']) -> None:
-        self._components = SortedSet(components)
+        self._components = _replace_observed(getattr(self, '_components', None), components)
 
     @property
     @serializable.view(SchemaVersion1Dot3)
@@ -1753,7 +1812,7 @@ class Component(Dependable):
                 self.mime_type, self.supplier, self.author, self.publisher,
                 self.description, self.scope, _ComparableTuple(self.hashes),
                 _ComparableTuple(self.licenses), self.copyright, self.cpe,
-                None if self.purl is None else _ComparablePackageURL(self.purl),
+                self.__purl_comparable,
                 self.swid, self.pedigree,
                 _ComparableTuple(self.external_references), _ComparableTuple(self.properties),
                 _ComparableTuple(self.components), self.evidence, self.release_notes, self.modified,
@@ -1764,7 +1823,7 @@ class Component(Dependable):
                 other.mime_type, other.supplier, other.author, other.publisher,
                 other.description, other.scope, _ComparableTuple(other.hashes),
                 _ComparableTuple(other.licenses), other.copyright, other.cpe,
-                None if other.purl is None else _ComparablePackageURL(other.purl),
+                other.__purl_comparable,
                 other.swid, other.pedigree,
                 _ComparableTuple(other.external_references), _ComparableTuple(other.properties),
                 _ComparableTuple(other.components), other.evidence, other.release_notes, other.modified,
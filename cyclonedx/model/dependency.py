@@ -24,7 +24,7 @@ from sortedcontainers import SortedSet
 
 from .._internal.compare import ComparableTuple as _ComparableTuple
 from ..exception.serialization import SerializationOfUnexpectedValueException
-from .bom_ref import BomRef
+from .bom_ref import BomRef, _serialized_value as _bom_ref_serialized_value
 
 
 class _DependencyRepositorySerializationHelper(serializable.helpers.BaseHelper):
@@ -33,7 +33,7 @@ class _DependencyRepositorySerializationHelper(serializable.helpers.BaseHelper):
     @classmethod
     def serialize(cls, o: Any) -> List[str]:
         if isinstance(o, (SortedSet, set)):
-            return [str(i.ref) for i in o]
+            return [_bom_ref_serialized_value(i.ref) or '' for i in o]
         raise SerializationOfUnexpectedValueException(
             f'Attempt to serialize a non-DependencyRepository: {o!r}')
 
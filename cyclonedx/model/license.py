@@ -70,6 +70,8 @@ class DisjunctiveLicense:
         See the CycloneDX Schema definition: https://cyclonedx.org/docs/1.6/json/#components_items_licenses
     """
 
+    _frozen = False  # see `_freeze()`
+
     def __init__(
         self, *,
         id: Optional[str] = None, name: Optional[str] = None,
@@ -106,6 +108,7 @@ class DisjunctiveLicense:
 
     @id.setter
     def id(self, id: Optional[str]) -> None:
+        _check_not_frozen(self)
         self._id = id
         if id is not None:
             self._name = None
@@ -124,6 +127,7 @@ class DisjunctiveLicense:
 
     @name.setter
     def name(self, name: Optional[str]) -> None:
+        _check_not_frozen(self)
         self._name = name
         if name is not None:
             self._id = None
@@ -141,6 +145,7 @@ class DisjunctiveLicense:
 
     @text.setter
     def text(self, text: Optional[AttachedText]) -> None:
+        _check_not_frozen(self)
         self._text = text
 
     @property
@@ -157,6 +162,7 @@ class DisjunctiveLicense:
 
     @url.setter
     def url(self, url: Optional[XsUri]) -> None:
+        _check_not_frozen(self)
         self._url = url
 
     # @property
@@ -216,6 +222,7 @@ class DisjunctiveLicense:
 
     @acknowledgement.setter
     def acknowledgement(self, acknowledgement: Optional[LicenseAcknowledgement]) -> None:
+        _check_not_frozen(self)
         self._acknowledgement = acknowledgement
 
     def __eq__(self, other: object) -> bool:
@@ -252,6 +259,8 @@ class LicenseExpression:
         https://cyclonedx.org/docs/1.6/json/#components_items_licenses_items_expression
     """
 
+    _frozen = False  # see `_freeze()`
+
     def __init__(
         self, value: str, *,
         acknowledgement: Optional[LicenseAcknowledgement] = None,
@@ -274,6 +283,7 @@ class LicenseExpression:
 
     @value.setter
     def value(self, value: str) -> None:
+        _check_not_frozen(self)
         self._value = value
 
     # @property
@@ -309,6 +319,7 @@ class LicenseExpression:
 
     @acknowledgement.setter
     def acknowledgement(self, acknowledgement: Optional[LicenseAcknowledgement]) -> None:
+        _check_not_frozen(self)
         self._acknowledgement = acknowledgement
 
     def __hash__(self) -> int:
@@ -337,6 +348,21 @@ License = Union[LicenseExpression, DisjunctiveLicense]
 - :class:`DisjunctiveLicense`
 """
 
+
+def _freeze(license: License) -> License:
+    """Make a license immutable - so it can be shared, for example across components.
+
+    Setting any of its properties raises :class:`AttributeError` afterwards.
+    """
+    license._frozen = True
+    return license
+
+
+def _check_not_frozen(license: License) -> None:
+    if license._frozen:
+        raise AttributeError(f'cannot modify frozen {type(license).__name__}')
+
+
 if TYPE_CHECKING:  # pragma: no cover
     # workaround for https://github.com/python/mypy/issues/5264
     # this code path is taken when static code analysis or documentation tools runs through.
@@ -30,6 +30,7 @@ import serializable
 from sortedcontainers import SortedSet
 
 from .._internal.bom_ref import bom_ref_from_str as _bom_ref_from_str
+from .._internal.bom_ref_index import replace_observed as _replace_observed
 from .._internal.compare import ComparableTuple as _ComparableTuple
 from ..schema.schema import SchemaVersion1Dot3, SchemaVersion1Dot4, SchemaVersion1Dot5, SchemaVersion1Dot6
 from . import DataClassification, ExternalReference, Property, XsUri
@@ -332,7 +333,7 @@ class Service(Dependable):
 
     @services.setter
     def services(self, services: Iterable['Service']) -> None:
-        self._services = SortedSet(services)
+        self._services = _replace_observed(getattr(self, '_services', None), services)
 
     @property
     @serializable.view(SchemaVersion1Dot4)
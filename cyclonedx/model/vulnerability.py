@@ -636,6 +636,11 @@ class _VulnerabilityScoreSourceSerializationHelper(serializable.helpers.BaseHelp
     }
     __CASES[SchemaVersion1Dot6] = __CASES[SchemaVersion1Dot5]
 
+    @classmethod
+    def cases(cls, view: Type[serializable.ViewType]) -> FrozenSet[VulnerabilityScoreSource]:
+        """Get the values that are supported by ``view``."""
+        return cls.__CASES.get(view, frozenset())
+
     @classmethod
     def __normalize(cls, vss: VulnerabilityScoreSource, view: Type[serializable.ViewType]) -> str:
         return (
@@ -23,24 +23,32 @@ and according to different versions of the CycloneDX schema standard.
 
 import os
 from abc import ABC, abstractmethod
+from contextvars import Token
+from hashlib import sha256
 from itertools import chain
 from random import random
-from typing import TYPE_CHECKING, Any, Iterable, Literal, Mapping, Optional, Type, Union, overload
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Literal, Mapping, Optional, Set, Tuple, Type, Union, overload
 
+from ..model.bom_ref import _SUBSTITUTES as _BOM_REF_SUBSTITUTES, _serialized_value as _bom_ref_serialized_value
 from ..schema import OutputFormat, SchemaVersion
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..model.bom import Bom
     from ..model.bom_ref import BomRef
+    from ..model.component import Component
+    from ..model.service import Service
+    from ..model.vulnerability import Vulnerability
+    from ..validation import ValidationError
     from .json import Json as JsonOutputter
     from .xml import Xml as XmlOutputter
 
 
 class BaseOutput(ABC):
 
-    def __init__(self, bom: 'Bom', **kwargs: int) -> None:
+    def __init__(self, bom: 'Bom', *, deterministic_bom_refs: bool = False, **kwargs: int) -> None:
         super().__init__(**kwargs)
         self._bom = bom
+        self._deterministic_bom_refs = deterministic_bom_refs
         self._generated: bool = False
 
     @property
@@ -61,9 +69,21 @@ class BaseOutput(ABC):
     def generated(self, generated: bool) -> None:
         self._generated = generated
 
+    @property
+    def deterministic_bom_refs(self) -> bool:
+        """Whether missing and duplicate `BomRef` values are made up reproducibly, instead of randomly.
+
+        See :class:`DeterministicBomRefDiscriminator`.
+        """
+        return self._deterministic_bom_refs
+
     def get_bom(self) -> 'Bom':
         return self._bom
 
+    def _make_bom_ref_discriminator(self) -> 'BomRefDiscriminator':
+        return (DeterministicBomRefDiscriminator if self._deterministic_bom_refs else BomRefDiscriminator
+                ).from_bom(self._bom)
+
     def set_bom(self, bom: 'Bom') -> None:
         self._bom = bom
 
@@ -77,6 +97,20 @@ class BaseOutput(ABC):
                          **kwargs: Any) -> str:
         ...  # pragma: no cover
 
+    def validate(self) -> Optional['ValidationError']:
+        """Validate the output against the schema of its format and version.
+
+        Generates the output, if not done already.
+        Requires the optional validation dependencies - see :mod:`cyclonedx.validation`.
+
+        :return: validation error
+        :retval None: if the output is valid
+        :retval ValidationError: if the output is invalid
+        """
+        from ..validation import make_schemabased_validator
+        return make_schemabased_validator(self.output_format, self.schema_version).validate_str(
+            self.output_as_string())
+
     def output_to_file(self, filename: str, allow_overwrite: bool = False, *,
                        indent: Optional[Union[int, str]] = None,
                        **kwargs: Any) -> None:
@@ -93,23 +127,27 @@ class BaseOutput(ABC):
 
 @overload
 def make_outputter(bom: 'Bom', output_format: Literal[OutputFormat.JSON],
-                   schema_version: SchemaVersion) -> 'JsonOutputter':
+                   schema_version: SchemaVersion, *,
+                   deterministic_bom_refs: bool = ...) -> 'JsonOutputter':
     ...  # pragma: no cover
 
 
 @overload
 def make_outputter(bom: 'Bom', output_format: Literal[OutputFormat.XML],
-                   schema_version: SchemaVersion) -> 'XmlOutputter':
+                   schema_version: SchemaVersion, *,
+                   deterministic_bom_refs: bool = ...) -> 'XmlOutputter':
     ...  # pragma: no cover
 
 
 @overload
 def make_outputter(bom: 'Bom', output_format: OutputFormat,
-                   schema_version: SchemaVersion) -> Union['XmlOutputter', 'JsonOutputter']:
+                   schema_version: SchemaVersion, *,
+                   deterministic_bom_refs: bool = ...) -> Union['XmlOutputter', 'JsonOutputter']:
     ...  # pragma: no cover
 
 
-def make_outputter(bom: 'Bom', output_format: OutputFormat, schema_version: SchemaVersion) -> BaseOutput:
+def make_outputter(bom: 'Bom', output_format: OutputFormat, schema_version: SchemaVersion, *,
+                   deterministic_bom_refs: bool = False) -> BaseOutput:
     """
     Helper method to quickly get the correct output class/formatter.
 
@@ -121,6 +159,7 @@ def make_outputter(bom: 'Bom', output_format: OutputFormat, schema_version: Sche
     :param bom: Bom
     :param output_format: OutputFormat
     :param schema_version: SchemaVersion
+    :param deterministic_bom_refs: see :attr:`BaseOutput.deterministic_bom_refs`
     :return: BaseOutput
     """
     if TYPE_CHECKING:  # pragma: no cover
@@ -135,15 +174,26 @@ def make_outputter(bom: 'Bom', output_format: OutputFormat, schema_version: Sche
     klass = BY_SCHEMA_VERSION.get(schema_version, None)
     if klass is None:
         raise ValueError(f'Unknown {output_format.name}/schema_version: {schema_version!r}')
-    return klass(bom)
+    return klass(bom, deterministic_bom_refs=deterministic_bom_refs)
 
 
 class BomRefDiscriminator:
+    """Makes the values of `BomRef`s unique - missing and duplicate ones are made up - for the time of a serialization.
+
+    The `BomRef`s are not modified. Instead, while discriminated, the made-up values stand in for the actual ones
+    when serialized in the current thread - or the current `contextvars` context, to be precise.
+    So the same `BomRef`s can be discriminated and serialized in multiple threads concurrently.
+    Reading `BomRef.value` always gets the actual value.
+
+    Call :meth:`reset()` in the context that :meth:`discriminate()` was called in - like via ``with``.
+    Called from another context, it can only stop the substitutes in that other context.
+    """
 
     def __init__(self, bomrefs: Iterable['BomRef'], prefix: str = 'BomRef') -> None:
         # do not use dict/set here, different BomRefs with same value have same hash and would shadow each other
-        self._bomrefs = tuple((bomref, bomref.value) for bomref in bomrefs)
+        self._bomrefs = tuple((bomref, _bom_ref_serialized_value(bomref)) for bomref in bomrefs)
         self._prefix = prefix
+        self._token: Optional['Token[Optional[Dict[int, str]]]'] = None
 
     def __enter__(self) -> None:
         self.discriminate()
@@ -152,17 +202,35 @@ class BomRefDiscriminator:
         self.reset()
 
     def discriminate(self) -> None:
-        known_values = []
+        self.reset()
+        substitutes = _BOM_REF_SUBSTITUTES.get()
+        # substitutes of an enclosing discrimination stay in effect, unless overridden
+        substitutes = self._make_substitutes() if substitutes is None else {**substitutes, **self._make_substitutes()}
+        self._token = _BOM_REF_SUBSTITUTES.set(substitutes)
+
+    def reset(self) -> None:
+        token = self._token
+        if token is not None:
+            self._token = None
+            try:
+                _BOM_REF_SUBSTITUTES.reset(token)
+            except ValueError:
+                # created in another context - restore what was there before, in this one
+                _BOM_REF_SUBSTITUTES.set(None if token.old_value is Token.MISSING else token.old_value)
+
+    def _make_substitutes(self) -> Dict[int, str]:
+        substitutes: Dict[int, str] = {}
+        # the values are what must be unique - so a set of them is fine, and keeps this linear
+        known_values: Set[str] = set()
         for bomref, _ in self._bomrefs:
-            value = bomref.value
+            value = substitutes.get(id(bomref)) or _bom_ref_serialized_value(bomref)
             if value is None or value in known_values:
                 value = self._make_unique()
-                bomref.value = value
-            known_values.append(value)
-
-    def reset(self) -> None:
-        for bomref, original_value in self._bomrefs:
-            bomref.value = original_value
+                while value in known_values:
+                    value = self._make_unique()
+                substitutes[id(bomref)] = value
+            known_values.add(value)
+        return substitutes
 
     def _make_unique(self) -> str:
         return f'{self._prefix}{str(random())[1:]}{str(random())[1:]}'  # nosec B311
@@ -174,3 +242,68 @@ class BomRefDiscriminator:
             map(lambda s: s.bom_ref, bom.services),
             map(lambda v: v.bom_ref, bom.vulnerabilities)
         ), prefix)
+
+
+class DeterministicBomRefDiscriminator(BomRefDiscriminator):
+    """Like :class:`BomRefDiscriminator`, but the values it makes up are reproducible.
+
+    A made-up value is derived from a digest of the identity of what the ref belongs to -
+    the PackageURL of a component, or its group, name and version.
+    If the same identity occurs multiple times, its occurrence is taken into account - in the given order.
+    So the same BOM always gets the same values, and its output is the same on every run.
+    """
+
+    def __init__(self, bomrefs: Iterable[Tuple['BomRef', str]], prefix: str = 'BomRef') -> None:
+        """
+        :param bomrefs: pairs of a ref and the identity of what it belongs to
+        :param prefix: the prefix of made-up values
+        """
+        bomrefs = tuple(bomrefs)
+        super().__init__((bomref for bomref, _ in bomrefs), prefix)
+        self._identities = tuple(identity for _, identity in bomrefs)
+
+    def _make_substitutes(self) -> Dict[int, str]:
+        substitutes: Dict[int, str] = {}
+        # made-up values must not take away any given value - not even one that comes later
+        reserved = frozenset(value for _, value in self._bomrefs if value is not None)
+        known_values: Set[str] = set()
+        occurrences: Dict[str, int] = {}
+        for (bomref, _), identity in zip(self._bomrefs, self._identities):
+            value = substitutes.get(id(bomref)) or _bom_ref_serialized_value(bomref)
+            if value is None or value in known_values:
+                while True:
+                    occurrence = occurrences.get(identity, 0)
+                    occurrences[identity] = occurrence + 1
+                    value = self._make_deterministic(identity, occurrence)
+                    if value not in known_values and value not in reserved:
+                        break
+                substitutes[id(bomref)] = value
+            known_values.add(value)
+        return substitutes
+
+    def _make_deterministic(self, identity: str, occurrence: int) -> str:
+        if occurrence:
+            identity = f'{identity}#{occurrence}'
+        return f'{self._prefix}-{sha256(identity.encode("utf-8")).hexdigest()[:20]}'
+
+    @staticmethod
+    def _component_identity(component: 'Component') -> str:
+        if component.purl is not None:
+            return f'component:{component.purl.to_string()}'
+        return f'component:{component.group or ""}/{component.name}@{component.version or ""}'
+
+    @staticmethod
+    def _service_identity(service: 'Service') -> str:
+        return f'service:{service.group or ""}/{service.name}@{service.version or ""}'
+
+    @staticmethod
+    def _vulnerability_identity(vulnerability: 'Vulnerability') -> str:
+        return f'vulnerability:{vulnerability.id or ""}'
+
+    @classmethod
+    def from_bom(cls, bom: 'Bom', prefix: str = 'BomRef') -> 'DeterministicBomRefDiscriminator':
+        return cls(chain(
+            ((c.bom_ref, cls._component_identity(c)) for c in bom._get_all_components()),
+            ((s.bom_ref, cls._service_identity(s)) for s in bom.services),
+            ((v.bom_ref, cls._vulnerability_identity(v)) for v in bom.vulnerabilities)
+        ), prefix)
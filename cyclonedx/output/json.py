@@ -32,16 +32,17 @@ from ..schema.schema import (
     SchemaVersion1Dot5,
     SchemaVersion1Dot6,
 )
-from . import BaseOutput, BomRefDiscriminator
+from . import BaseOutput
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..model.bom import Bom
+    from ..validation import ValidationError
 
 
 class Json(BaseOutput, BaseSchemaVersion):
 
-    def __init__(self, bom: 'Bom') -> None:
-        super().__init__(bom=bom)
+    def __init__(self, bom: 'Bom', *, deterministic_bom_refs: bool = False) -> None:
+        super().__init__(bom=bom, deterministic_bom_refs=deterministic_bom_refs)
         self._bom_json: Dict[str, Any] = dict()
 
     @property
@@ -69,7 +70,7 @@ class Json(BaseOutput, BaseSchemaVersion):
         _view = SCHEMA_VERSIONS.get(self.schema_version_enum)
         bom = self.get_bom()
         bom.validate()
-        with BomRefDiscriminator.from_bom(bom):
+        with self._make_bom_ref_discriminator():
             bom_json: Dict[str, Any] = json_loads(
                 bom.as_json(  # type:ignore[attr-defined]
                     view_=_view))
@@ -77,6 +78,15 @@ class Json(BaseOutput, BaseSchemaVersion):
         self._bom_json = bom_json
         self.generated = True
 
+    def validate(self) -> Optional['ValidationError']:
+        """Validate the output against the schema of its version.
+
+        The in-memory data is handed to the validator as is - it is not serialized and parsed again.
+        """
+        from ..validation.json import JsonValidator
+        self.generate()
+        return JsonValidator(self.schema_version).validate_data(self._bom_json)
+
     def output_as_string(self, *,
                          indent: Optional[Union[int, str]] = None,
                          **kwargs: Any) -> str:
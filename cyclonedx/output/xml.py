@@ -32,15 +32,15 @@ from ..schema.schema import (
     SchemaVersion1Dot5,
     SchemaVersion1Dot6,
 )
-from . import BaseOutput, BomRefDiscriminator
+from . import BaseOutput
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..model.bom import Bom
 
 
 class Xml(BaseSchemaVersion, BaseOutput):
-    def __init__(self, bom: 'Bom') -> None:
-        super().__init__(bom=bom)
+    def __init__(self, bom: 'Bom', *, deterministic_bom_refs: bool = False) -> None:
+        super().__init__(bom=bom, deterministic_bom_refs=deterministic_bom_refs)
         self._bom_xml: str = ''
 
     @property
@@ -59,7 +59,7 @@ class Xml(BaseSchemaVersion, BaseOutput):
         bom = self.get_bom()
         bom.validate()
         xmlns = self.get_target_namespace()
-        with BomRefDiscriminator.from_bom(bom):
+        with self._make_bom_ref_discriminator():
             self._bom_xml = '<?xml version="1.0" ?>\n' + xml_dumps(
                 bom.as_xml(  # type:ignore[attr-defined]
                     _view, as_string=False, xmlns=xmlns),
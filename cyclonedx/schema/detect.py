@@ -0,0 +1,140 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+Detection of the format and schema version of serialized CycloneDX documents - without parsing them.
+"""
+
+__all__ = [
+    'detect_format', 'detect_format_of_file',
+    'detect_format_and_version', 'detect_format_and_version_of_file', 'detect_format_and_version_of_stream',
+]
+
+import re
+from typing import TYPE_CHECKING, BinaryIO, Optional, Tuple
+
+from . import OutputFormat, SchemaVersion
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .._internal.io import BytesLike, StrPath
+
+# a document starts with optional BOM and whitespace - so this is plenty
+_PEEK_SIZE = 1024
+
+# the version is declared in the document's head - in the root element, or in the top-level properties
+_VERSION_PEEK_SIZE = 16 * 1024
+
+_JSON_SPEC_VERSION = re.compile(rb'"specVersion"\s*:\s*"(\d+\.\d+)')
+_JSON_SCHEMA = re.compile(rb'"\$schema"\s*:\s*"[^"]*/bom-(\d+\.\d+)')
+_XML_NAMESPACE = re.compile(rb'xmlns(?::[\w.-]+)?\s*=\s*["\']http://cyclonedx\.org/schema/bom/(\d+\.\d+)["\']')
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+
+def detect_format(data: 'BytesLike') -> OutputFormat:
+    """Detect the format of a serialized document.
+
+    Only the first bytes of ``data`` are looked at.
+
+    :param data: the raw document
+    :raises ValueError: if the format could not be detected
+    """
+    head = bytes(data[:_PEEK_SIZE])
+    if head.startswith(_UTF8_BOM):
+        head = head[len(_UTF8_BOM):]
+    head = head.lstrip()
+    if head.startswith(b'{'):
+        return OutputFormat.JSON
+    if head.startswith(b'<'):
+        return OutputFormat.XML
+    raise ValueError('Unable to detect the format of the document')
+
+
+def detect_format_of_file(path: 'StrPath') -> OutputFormat:
+    """Detect the format of a serialized document file.
+
+    Only the first bytes of the file are read.
+
+    :param path: path to the file
+    :raises ValueError: if the format could not be detected
+    """
+    with open(path, 'rb') as f:
+        return detect_format(f.read(_PEEK_SIZE))
+
+
+def _detect_version(output_format: OutputFormat, head: bytes) -> Optional[SchemaVersion]:
+    if output_format is OutputFormat.JSON:
+        match = _JSON_SPEC_VERSION.search(head) or _JSON_SCHEMA.search(head)
+    else:
+        match = _XML_NAMESPACE.search(head)
+    if match is None:
+        return None
+    try:
+        return SchemaVersion.from_version(match.group(1).decode())
+    except ValueError:
+        return None
+
+
+def detect_format_and_version(data: 'BytesLike') -> Tuple[OutputFormat, SchemaVersion]:
+    """Detect the format and the schema version of a serialized document.
+
+    Only the first kilobytes of ``data`` are looked at - the document is not parsed.
+    The result fits :func:`cyclonedx.validation.make_schemabased_validator`, like so::
+
+        validator = make_schemabased_validator(*detect_format_and_version(data))
+
+    :param data: the raw document
+    :raises ValueError: if the format or the version could not be detected
+    """
+    head = bytes(data[:_VERSION_PEEK_SIZE])
+    output_format = detect_format(head)
+    schema_version = _detect_version(output_format, head)
+    if schema_version is None:
+        raise ValueError(f'Unable to detect the schema version of the {output_format.name} document')
+    return output_format, schema_version
+
+
+def detect_format_and_version_of_file(path: 'StrPath') -> Tuple[OutputFormat, SchemaVersion]:
+    """Detect the format and the schema version of a serialized document file.
+
+    Only the first kilobytes of the file are read.
+
+    :param path: path to the file
+    :raises ValueError: if the format or the version could not be detected
+    """
+    with open(path, 'rb') as f:
+        return detect_format_and_version(f.read(_VERSION_PEEK_SIZE))
+
+
+def detect_format_and_version_of_stream(stream: BinaryIO) -> Tuple[OutputFormat, SchemaVersion]:
+    """Detect the format and the schema version of a serialized document stream.
+
+    Only the first kilobytes of the stream are read.
+    Afterwards, the stream is rewound to where it was, so it can be consumed as a whole.
+
+    :param stream: a seekable binary stream
+    :raises ValueError: if the format or the version could not be detected, or the stream is not seekable
+    """
+    if not stream.seekable():
+        raise ValueError('Stream is not seekable')
+    position = stream.tell()
+    try:
+        head = stream.read(_VERSION_PEEK_SIZE)
+    finally:
+        stream.seek(position)
+    return detect_format_and_version(head)
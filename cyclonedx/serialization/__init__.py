@@ -27,6 +27,7 @@ from uuid import UUID
 from packageurl import PackageURL
 from serializable.helpers import BaseHelper
 
+from .._internal.purl import purl_from_str as _purl_from_str
 from ..exception.serialization import CycloneDxDeserializationException, SerializationOfUnexpectedValueException
 from ..model.bom_ref import BomRef
 from ..model.license import _LicenseRepositorySerializationHelper
@@ -62,13 +63,51 @@ class PackageUrl(BaseHelper):
     @classmethod
     def deserialize(cls, o: Any) -> PackageURL:
         try:
-            return PackageURL.from_string(purl=str(o))
+            return _purl_from_str(str(o))
         except ValueError as err:
             raise CycloneDxDeserializationException(
                 f'PURL string supplied does not parse: {o!r}'
             ) from err
 
 
+class DeserializationLimits:
+    """Resource limits that are enforced when reading a CycloneDX document.
+
+    The limits are checked while/right after the document is parsed, and before any model is built from it:
+    XML is checked while it is parsed, JSON right after - the JSON parser is not incremental.
+    So for JSON, only :attr:`max_bytes` bounds the memory that parsing takes.
+    Exceeding any of them raises :class:`cyclonedx.exception.serialization.DeserializationLimitExceededException`.
+
+    A limit of ``None`` means: unlimited.
+    """
+
+    max_bytes: Optional[int]
+    """Maximum size of the raw document, in bytes."""
+
+    max_depth: Optional[int]
+    """Maximum nesting depth of the document's elements - JSON objects/arrays, or XML elements."""
+
+    max_elements: Optional[int]
+    """Maximum number of elements in the document - JSON values, or XML elements."""
+
+    max_string_length: Optional[int]
+    """Maximum length of any string in the document - JSON keys and values, or XML text and attribute values."""
+
+    def __init__(self, *,
+                 max_bytes: Optional[int] = None,
+                 max_depth: Optional[int] = None,
+                 max_elements: Optional[int] = None,
+                 max_string_length: Optional[int] = None) -> None:
+        self.max_bytes = max_bytes
+        self.max_depth = max_depth
+        self.max_elements = max_elements
+        self.max_string_length = max_string_length
+
+    def __repr__(self) -> str:
+        return f'<DeserializationLimits max_bytes={self.max_bytes}, max_depth={self.max_depth}, ' \
+            f'max_elements={self.max_elements}, max_string_length={self.max_string_length}>'
+
+
 class UrnUuidHelper(BaseHelper):
 
     @classmethod
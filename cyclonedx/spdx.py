@@ -18,37 +18,69 @@
 
 __all__ = [
     'is_supported_id', 'fixup_id',
-    'is_compound_expression'
+    'is_compound_expression', 'validate_expressions',
+    'match_id', 'parse_expression', 'evaluate_expression',
+    'preload',
 ]
 
-from json import load as json_load
-from typing import TYPE_CHECKING, Dict, Optional, Set
-
-from license_expression import get_spdx_licensing  # type:ignore[import-untyped]
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple, Union
 
 from .schema._res import SPDX_JSON as __SPDX_JSON_SCHEMA
 
 if TYPE_CHECKING:  # pragma: no cover
-    from license_expression import Licensing
+    from license_expression import Licensing  # type:ignore[import-untyped]
+
+    from ._internal.spdx_match import SpdxIdMatcher
 
 # region init
-# python's internal module loader will assure that this init-part runs only once.
+# the data is loaded on first use - not on import, since many processes never need it.
+# loading is idempotent, so a rare concurrent double-load is harmless.
+
+
+@lru_cache(maxsize=None)
+def __get_ids() -> FrozenSet[str]:
+    from ._internal.schema_cache import load_json
+
+    # !!! this requires to ship the actual schema data with the package.
+    ids = frozenset(load_json(__SPDX_JSON_SCHEMA).get('enum', []))
+    assert len(ids) > 0, 'known SPDX-IDs should be non-empty set'
+    return ids
+
 
-# !!! this requires to ship the actual schema data with the package.
-with open(__SPDX_JSON_SCHEMA) as schema:
-    __IDS: Set[str] = set(json_load(schema).get('enum', []))
-assert len(__IDS) > 0, 'known SPDX-IDs should be non-empty set'
+@lru_cache(maxsize=None)
+def __get_ids_lower_map() -> Dict[str, str]:
+    return {id_.lower(): id_ for id_ in __get_ids()}
 
-__IDS_LOWER_MAP: Dict[str, str] = dict((id_.lower(), id_) for id_ in __IDS)
 
-__SPDX_EXPRESSION_LICENSING: 'Licensing' = get_spdx_licensing()
+@lru_cache(maxsize=None)
+def __get_expression_licensing() -> 'Licensing':
+    # building the index of license symbols is costly
+    from license_expression import get_spdx_licensing
+    return get_spdx_licensing()
+
+
+@lru_cache(maxsize=None)
+def __get_id_matcher(include_deprecated: bool = False) -> 'SpdxIdMatcher':
+    from ._internal.spdx_match import DEPRECATED_IDS, SpdxIdMatcher
+    return SpdxIdMatcher(__get_ids(), () if include_deprecated else DEPRECATED_IDS)
+
+
+def preload() -> None:
+    """Load all SPDX data now, instead of on first use.
+
+    Meant for long-running processes, like servers, that want to pay the cost upfront - not on a first request.
+    """
+    __get_ids_lower_map()
+    __get_expression_licensing()
+    __get_id_matcher()
 
 # endregion
 
 
 def is_supported_id(value: str) -> bool:
     """Validate a SPDX-ID according to current spec."""
-    return value in __IDS
+    return value in __get_ids()
 
 
 def fixup_id(value: str) -> Optional[str]:
@@ -56,12 +88,43 @@ def fixup_id(value: str) -> Optional[str]:
 
     :returns: repaired value string, or `None` if fixup was unable to help.
     """
-    return __IDS_LOWER_MAP.get(value.lower())
+    return __get_ids_lower_map().get(value.lower())
+
+
+def match_id(value: str, *, min_score: float = 0.8,
+             include_deprecated: bool = False) -> Optional[Tuple[str, float]]:
+    """Match a free-text license name to a SPDX-ID - fuzzily.
+
+    Unlike :func:`fixup_id()`, this understands common spellings,
+    like "Apache 2.0", "GPLv2+", "The MIT License" or "3-clause BSD".
+    Deprecated SPDX-IDs are matched to their successors, like "GPL-2.0" to ``GPL-2.0-only``.
+    Otherwise, the SPDX-ID with the most similar name wins.
+    Compound expressions, like ``MIT OR Apache-2.0``, match nothing - see :func:`parse_expression()` for those.
+    Results are memoized - inputs tend to repeat.
+
+    :param value: the license name
+    :param min_score: the least score that counts as a match
+    :param include_deprecated: whether deprecated SPDX-IDs that have no successor may be the result,
+                               like ``GPL-2.0-with-classpath-exception``
+    :returns: the SPDX-ID and its score - ``1.0`` for a known spelling, less for a similar one -
+              or `None` if nothing matches well enough
+    """
+    match = __match_id(value, include_deprecated)
+    if match is None or match[1] < min_score:
+        return None
+    return match
+
+
+@lru_cache(maxsize=8192)
+def __match_id(value: str, include_deprecated: bool) -> Optional[Tuple[str, float]]:
+    return __get_id_matcher(include_deprecated).match(value)
 
 
 def is_compound_expression(value: str) -> bool:
     """Validate compound expression.
 
+    Results are memoized - a document typically has only few distinct expressions.
+
     .. note::
         Utilizes `license-expression library`_ to
         validate SPDX compound expression according to `SPDX license expression spec`_.
@@ -69,9 +132,118 @@ def is_compound_expression(value: str) -> bool:
     .. _SPDX license expression spec: https://spdx.github.io/spdx-spec/v2.3/SPDX-license-expressions/
     .. _license-expression library: https://github.com/nexB/license-expression
     """
+    return __is_compound_expression(value)
+
+
+def validate_expressions(values: Iterable[str]) -> Dict[str, bool]:
+    """Validate many compound expressions at once - see :func:`is_compound_expression()`.
+
+    Duplicates are validated only once.
+
+    :returns: mapping of each distinct value to whether it is a valid compound expression - in order of appearance
+    """
+    return {value: __is_compound_expression(value) for value in dict.fromkeys(values)}
+
+
+@lru_cache(maxsize=4096)
+def __is_compound_expression(value: str) -> bool:
     try:
-        res = __SPDX_EXPRESSION_LICENSING.validate(value)
+        res = __get_expression_licensing().validate(value)
     except Exception:
         # the throw happens when internals crash due to unexpected input characters.
         return False
     return 0 == len(res.errors)
+
+
+# a license, or an operator - `True` for AND, `False` for OR - with its operands
+_Node = Union[str, Tuple[bool, Tuple[Any, ...]]]
+
+# the number of choices grows exponentially - so the combinations that are computed are capped
+_MAX_CHOICES = 1024
+
+
+@lru_cache(maxsize=4096)
+def parse_expression(value: str) -> Optional[FrozenSet[FrozenSet[str]]]:
+    """Parse a compound expression into the choices of licenses it offers.
+
+    Each choice is a set of licenses that apply together - the disjunctive normal form of the expression.
+    Like ``MIT OR (Apache-2.0 AND BSD-3-Clause)`` has the choices ``{MIT}`` and ``{Apache-2.0, BSD-3-Clause}``.
+    Licenses with an exception are kept as one, like ``GPL-2.0-or-later WITH Classpath-exception-2.0``.
+    Known licenses are canonicalized, unknown ones are kept as they are.
+    Results are memoized, and immutable - so they can be shared.
+
+    The number of choices grows exponentially with the number of ``AND``-ed ``OR``-clauses.
+    To judge an expression from untrusted input, use :func:`evaluate_expression()` instead.
+
+    :returns: the choices, or `None` if `value` is not a parsable expression
+    :raises ValueError: if computing the choices takes more than 1024 combinations of licenses
+    """
+    node = __parse(value)
+    if node is None:
+        return None
+    return __choices(node)
+
+
+def evaluate_expression(value: str, predicate: Callable[[str], bool]) -> Optional[bool]:
+    """Evaluate a compound expression, with a predicate for each of its licenses.
+
+    ``AND`` holds if all of its operands hold, ``OR`` if any of them does.
+    So the result is whether any choice of :func:`parse_expression()` has only licenses the predicate holds for -
+    but it is computed in linear time, without listing the choices.
+    The predicate gets the licenses like they are in the choices.
+
+    :returns: the result, or `None` if `value` is not a parsable expression
+    """
+    node = __parse(value)
+    if node is None:
+        return None
+    return __evaluate(node, predicate)
+
+
+@lru_cache(maxsize=4096)
+def __parse(value: str) -> Optional[_Node]:
+    try:
+        parsed = __get_expression_licensing().parse(value)
+        if parsed is None:
+            return None
+        return __node(parsed)
+    except Exception:
+        # the throw happens when internals crash due to unexpected input characters.
+        return None
+
+
+def __node(parsed: Any) -> _Node:
+    from license_expression import AND, OR, LicenseWithExceptionSymbol
+
+    if isinstance(parsed, (AND, OR)):
+        return isinstance(parsed, AND), tuple(__node(arg) for arg in parsed.args)
+    if isinstance(parsed, LicenseWithExceptionSymbol):
+        return f'{parsed.license_symbol.key} WITH {parsed.exception_symbol.key}'
+    return str(parsed.key)
+
+
+def __evaluate(node: _Node, predicate: Callable[[str], bool]) -> bool:
+    if isinstance(node, str):
+        return predicate(node)
+    is_and, args = node
+    if is_and:
+        return all(__evaluate(arg, predicate) for arg in args)
+    return any(__evaluate(arg, predicate) for arg in args)
+
+
+def __choices(node: _Node) -> FrozenSet[FrozenSet[str]]:
+    if isinstance(node, str):
+        return frozenset((frozenset((node,)),))
+    is_and, args = node
+    if not is_and:
+        each_choices = [__choices(arg) for arg in args]
+        if sum(map(len, each_choices)) > _MAX_CHOICES:
+            raise ValueError(f'Expression has more than {_MAX_CHOICES} choices')
+        return frozenset(choice for arg_choices in each_choices for choice in arg_choices)
+    choices: FrozenSet[FrozenSet[str]] = frozenset((frozenset(),))
+    for arg in args:
+        arg_choices = __choices(arg)
+        if len(choices) * len(arg_choices) > _MAX_CHOICES:
+            raise ValueError(f'Expression has more than {_MAX_CHOICES} choices')
+        choices = frozenset(choice | arg_choice for choice in choices for arg_choice in arg_choices)
+    return choices
@@ -17,13 +17,14 @@
 
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Literal, Optional, Protocol, Union, overload
+from typing import TYPE_CHECKING, Any, Iterable, Literal, Optional, Protocol, Union, overload
 
-from ..schema import OutputFormat
+from .._internal.schema_cache import set_cache_dir as _set_schema_cache_dir
+from ..schema import OutputFormat, SchemaVersion
 
 if TYPE_CHECKING:  # pragma: no cover
-    from ..schema import SchemaVersion
-    from .json import JsonValidator
+    from .._internal.io import StrPath
+    from .json import JsonStrictValidator, JsonValidator
     from .xml import XmlValidator
 
 
@@ -119,3 +120,54 @@ def make_schemabased_validator(output_format: OutputFormat, schema_version: 'Sch
     else:
         raise ValueError(f'Unexpected output_format: {output_format!r}')
     return Validator(schema_version)
+
+
+def warm_up(output_formats: Iterable[OutputFormat] = (OutputFormat.JSON, OutputFormat.XML),
+            schema_versions: Iterable['SchemaVersion'] = tuple(SchemaVersion), *,
+            strict: bool = False) -> None:
+    """Preload the Schema-based Validators for certain :class:`OutputFormat` and :class:`SchemaVersion`.
+
+    Compiled schemas are cached process-wide and are shared by all validator instances -
+    except for XML, whose compiled schemas are cached per thread, as they are not thread-safe.
+    Long-running processes may call this at startup, so that no validation has to pay for compiling a schema;
+    for XML, call it in each thread that validates.
+    Combinations that are not supported - like JSON in version 1.0 - are skipped.
+
+    :param output_formats: the formats to preload
+    :param schema_versions: the schema versions to preload
+    :param strict: whether to preload the strict variants - only affects JSON
+    """
+    schema_versions = tuple(schema_versions)
+    for output_format in output_formats:
+        if output_format not in (OutputFormat.JSON, OutputFormat.XML):
+            raise ValueError(f'Unexpected output_format: {output_format!r}')
+        for schema_version in schema_versions:
+            validator: Union['JsonValidator', 'JsonStrictValidator', 'XmlValidator']
+            try:
+                if strict and OutputFormat.JSON is output_format:
+                    from .json import JsonStrictValidator as StrictValidator
+                    validator = StrictValidator(schema_version)
+                else:
+                    validator = make_schemabased_validator(output_format, schema_version)
+            except ValueError:
+                continue  # unsupported
+            validator._warm_up()
+
+
+def set_schema_cache_dir(directory: Optional['StrPath']) -> None:
+    """Enable an on-disk cache of preprocessed schema resources - or disable it by passing ``None``.
+
+    The cache speeds up the cold start of processes that validate only once or twice:
+    they read the preprocessed resources, instead of parsing the schema files.
+    Entries are keyed by the hash of the respective schema file, so they never get stale.
+    The directory is created on demand; failures to read or write it are ignored.
+
+    Currently, this affects JSON schemas only - compiled XML schemas cannot be persisted.
+    The cache is not shared between different Python interpreters and versions.
+
+    .. warning::
+        Entries are loaded via :mod:`marshal`. Use a directory that only trusted users can write to.
+
+    :param directory: the cache directory
+    """
+    _set_schema_cache_dir(directory)
@@ -0,0 +1,77 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+Validate many document files in bulk - see :func:`cyclonedx.validation.bulk.validate_files()`.
+
+Usage::
+
+    python -m cyclonedx.validation [--strict] [--format-checks {all,none,fast}] [--max-errors N] [--workers N]
+                                   PATH [PATH ...]
+
+Exits with code ``1`` if any file is invalid.
+"""
+
+import sys
+from argparse import ArgumentParser, ArgumentTypeError
+from typing import Optional, Sequence, TextIO
+
+from .bulk import validate_files
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f'must be at least 1: {value!r}')
+    return number
+
+
+def main(argv: Optional[Sequence[str]] = None, out: TextIO = sys.stdout) -> int:
+    parser = ArgumentParser(prog='python -m cyclonedx.validation',
+                            description='Validate CycloneDX documents - files, or directories of them.')
+    parser.add_argument('paths', metavar='PATH', nargs='+',
+                        help='file or directory to validate')
+    parser.add_argument('--strict', action='store_true',
+                        help='do not allow additional or unknown JSON properties')
+    parser.add_argument('--format-checks', choices=('all', 'none', 'fast'), default='all',
+                        help='which formats to check in JSON; "fast" skips the costly ones (default: %(default)s)')
+    parser.add_argument('--max-errors', metavar='N', type=_positive_int, default=None,
+                        help='report at most N errors per file')
+    parser.add_argument('--workers', metavar='N', type=_positive_int, default=None,
+                        help='number of worker processes; defaults to the number of CPUs')
+    args = parser.parse_args(argv)
+
+    nr_files = nr_invalid = 0
+    for result in validate_files(args.paths, max_workers=args.workers, max_errors=args.max_errors,
+                                 strict=args.strict, format_checks=args.format_checks):
+        nr_files += 1
+        kind = '?' if result.output_format is None else result.output_format.name
+        if result.schema_version is not None:
+            kind += f' {result.schema_version.to_version()}'
+        status = 'OK' if result.is_valid else 'INVALID'
+        out.write(f'{status}\t{result.duration:.3f}s\t{kind}\t{result.path}\n')
+        if not result.is_valid:
+            nr_invalid += 1
+            for error in result.errors:
+                out.write(f'\t{error}\n')
+    out.write(f'{nr_files} files, {nr_invalid} invalid\n')
+    return 1 if nr_invalid else 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
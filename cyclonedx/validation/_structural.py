@@ -0,0 +1,424 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+import re
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from urllib.parse import unquote
+
+# the verdict of a check: `True` if proven valid, `False` if proven invalid, `None` if unknown
+_Verdict = Optional[bool]
+_Check = Callable[[Any], _Verdict]
+FormatConforms = Callable[[Any, str], bool]
+
+# keywords of draft 7 that are not implemented here - a schema that uses any of them gives unknown verdicts
+_UNSUPPORTED = frozenset(('multipleOf', 'dependencies', 'contains'))
+
+
+def _unknown(value: Any) -> _Verdict:
+    return None
+
+
+def _valid(value: Any) -> _Verdict:
+    return True
+
+
+def _invalid(value: Any) -> _Verdict:
+    return False
+
+
+def _all(checks: List[_Check]) -> _Check:
+    if not checks:
+        return _valid
+    if len(checks) == 1:
+        return checks[0]
+    checks_t = tuple(checks)
+
+    def check(value: Any) -> _Verdict:
+        verdict: _Verdict = True
+        for check_ in checks_t:
+            v = check_(value)
+            if v is False:
+                return False
+            if v is None:
+                verdict = None
+        return verdict
+    return check
+
+
+def _each(checks: Iterable[Tuple[_Check, Any]]) -> _Verdict:
+    # verdict of checks of values, like of all items
+    verdict: _Verdict = True
+    for check, value in checks:
+        v = check(value)
+        if v is False:
+            return False
+        if v is None:
+            verdict = None
+    return verdict
+
+
+def _any(checks: List[_Check]) -> _Check:
+    checks_t = tuple(checks)
+
+    def check(value: Any) -> _Verdict:
+        verdict: _Verdict = False
+        for check_ in checks_t:
+            v = check_(value)
+            if v is True:
+                return True
+            if v is None:
+                verdict = None
+        return verdict
+    return check
+
+
+def _one(checks: List[_Check]) -> _Check:
+    checks_t = tuple(checks)
+
+    def check(value: Any) -> _Verdict:
+        verdicts = [check_(value) for check_ in checks_t]
+        passed = verdicts.count(True)
+        if passed > 1:
+            return False
+        if None in verdicts:
+            return None
+        return passed == 1
+    return check
+
+
+def _negated(negated: _Check) -> _Check:
+    def check(value: Any) -> _Verdict:
+        v = negated(value)
+        return None if v is None else not v
+    return check
+
+
+def _conditional(if_: _Check, then: _Check, else_: _Check) -> _Check:
+    def check(value: Any) -> _Verdict:
+        v = if_(value)
+        if v is None:
+            return None
+        return then(value) if v else else_(value)
+    return check
+
+
+def _unique_key(value: Any) -> Hashable:
+    """Key that is equal for values that are equal in the sense of JSON schema.
+
+    Unlike in Python, booleans are no numbers; but integers and floats of the same value are equal.
+    """
+    if isinstance(value, str):
+        return 's', value
+    if isinstance(value, bool):
+        return 'b', value
+    if value is None:
+        return 'z',
+    if isinstance(value, (int, float)):
+        return 'n', value
+    if isinstance(value, (list, tuple)):
+        return 'a', tuple(map(_unique_key, value))
+    if isinstance(value, dict):
+        return 'o', frozenset((k, _unique_key(v)) for k, v in value.items())
+    return 'x', id(value)
+
+
+def _prescreen_key(value: Any) -> Hashable:
+    # equal for equal values - but cheap: objects are reduced to their string members, which usually identify them
+    if isinstance(value, dict):
+        return frozenset((k, v) for k, v in value.items() if isinstance(v, str))
+    return _unique_key(value)
+
+
+def _are_unique(values: List[Any]) -> bool:
+    return len(set(map(_prescreen_key, values))) == len(values) \
+        or len(set(map(_unique_key, values))) == len(values)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    'array': lambda value: isinstance(value, list),
+    'boolean': lambda value: isinstance(value, bool),
+    'integer': lambda value: (isinstance(value, int) and not isinstance(value, bool))
+    or (isinstance(value, float) and value.is_integer()),
+    'null': lambda value: value is None,
+    'number': _is_number,
+    'object': lambda value: isinstance(value, dict),
+    'string': lambda value: isinstance(value, str),
+}
+
+
+class StructuralChecker:
+    """
+    Fast, conservative validation of CycloneDX JSON documents against a draft 7 JSON schema.
+
+    The schema is compiled to plain closures that give a three-valued verdict: valid, invalid or unknown.
+    Verdicts of valid and invalid are exact - they equal those of a complete schema validation, formats included.
+    Anything that is not implemented here - like the keywords `multipleOf`, `dependencies` and `contains`,
+    or unresolvable references - makes the verdict unknown.
+    So a caller must treat everything but a verdict of valid as "go validate it properly".
+    """
+
+    def __init__(self, schema: Dict[str, Any], resources: Dict[str, Dict[str, Any]],
+                 format_conforms: Optional[FormatConforms]) -> None:
+        """
+        :param schema: the root schema
+        :param resources: referenced schemas, by their file name - like ``spdx.SNAPSHOT.schema.json``
+        :param format_conforms: checks a value against a format - ``None`` means to not check formats
+        """
+        self.__resources = resources
+        self.__format_conforms = format_conforms
+        # compiled checks, by `id()` of the (sub-)schema - the schemas are kept alive by `__resources` and `__root`
+        self.__compiled: Dict[int, _Check] = {}
+        self.__root = schema
+        self.__check = self.__compile(schema, schema)
+
+    def check(self, data: Any) -> bool:
+        """Whether ``data`` is proven to be valid."""
+        try:
+            return self.__check(data) is True
+        except RecursionError:
+            return False
+
+    def __compile(self, schema: Any, document: Dict[str, Any]) -> _Check:
+        if schema is True:
+            return _valid
+        if schema is False:
+            return _invalid
+        if not isinstance(schema, dict):
+            return _unknown
+        compiled = self.__compiled.get(id(schema))
+        if compiled is None:
+            # a forward reference, so that recursive schemas terminate
+            cell: List[_Check] = []
+            self.__compiled[id(schema)] = lambda value: cell[0](value)
+            compiled = self.__compile_object(schema, document)
+            cell.append(compiled)
+            self.__compiled[id(schema)] = compiled
+        return compiled
+
+    def __resolve(self, ref: str, document: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        base, _, fragment = ref.partition('#')
+        if base:
+            target = self.__resources.get(base.rpartition('/')[2])
+            if target is None:
+                raise LookupError(ref)
+            document = target
+        schema: Any = document
+        if fragment:
+            if not fragment.startswith('/'):
+                raise LookupError(ref)
+            for token in fragment[1:].split('/'):
+                token = unquote(token).replace('~1', '/').replace('~0', '~')
+                if isinstance(schema, list):
+                    schema = schema[int(token)]
+                else:
+                    schema = schema[token]
+        return schema, document
+
+    def __compile_object(self, schema: Dict[str, Any], document: Dict[str, Any]) -> _Check:  # noqa:C901
+        if '$id' in schema and not str(schema['$id']).startswith('#') and schema is not document:
+            # a change of the base URI - not supported
+            return _unknown
+        if '$ref' in schema:
+            # in draft 7, siblings of `$ref` are ignored
+            try:
+                target, target_document = self.__resolve(schema['$ref'], document)
+            except (LookupError, ValueError, TypeError):
+                return _unknown
+            return self.__compile(target, target_document)
+        if not _UNSUPPORTED.isdisjoint(schema):
+            return _unknown
+
+        checks: List[_Check] = []
+        if 'type' in schema:
+            types = schema['type']
+            types = [types] if isinstance(types, str) else types
+            if not all(t in _TYPES for t in types):
+                return _unknown
+            type_checks = tuple(_TYPES[t] for t in types)
+            checks.append(type_checks[0] if len(type_checks) == 1
+                          else lambda value: any(type_check(value) for type_check in type_checks))
+        if 'enum' in schema:
+            enum = frozenset(map(_unique_key, schema['enum']))
+            checks.append(lambda value: _unique_key(value) in enum)
+        if 'const' in schema:
+            const = _unique_key(schema['const'])
+            checks.append(lambda value: _unique_key(value) == const)
+        if 'format' in schema and self.__format_conforms is not None:
+            format_conforms = self.__format_conforms
+            format_ = schema['format']
+            checks.append(lambda value: format_conforms(value, format_))
+        string_check = self.__compile_string(schema)
+        if string_check is not None:
+            checks.append(string_check)
+        number_check = self.__compile_number(schema)
+        if number_check is not None:
+            checks.append(number_check)
+        object_check = self.__compile_properties(schema, document)
+        if object_check is not None:
+            checks.append(object_check)
+        array_check = self.__compile_items(schema, document)
+        if array_check is not None:
+            checks.append(array_check)
+        checks.extend(self.__compile_combinators(schema, document))
+        return _all(checks)
+
+    @staticmethod
+    def __compile_string(schema: Dict[str, Any]) -> Optional[_Check]:
+        if not ('pattern' in schema or 'minLength' in schema or 'maxLength' in schema):
+            return None
+        pattern = re.compile(schema['pattern']) if 'pattern' in schema else None
+        min_length: int = schema.get('minLength', 0)
+        max_length: Optional[int] = schema.get('maxLength')
+
+        def check(value: Any) -> _Verdict:
+            if not isinstance(value, str):
+                return True
+            return len(value) >= min_length \
+                and (max_length is None or len(value) <= max_length) \
+                and (pattern is None or pattern.search(value) is not None)
+        return check
+
+    @staticmethod
+    def __compile_number(schema: Dict[str, Any]) -> Optional[_Check]:
+        bounds = tuple((keyword, schema[keyword]) for keyword in (
+            'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum') if keyword in schema)
+        if not bounds:
+            return None
+        minimum = schema.get('minimum')
+        maximum = schema.get('maximum')
+        exclusive_minimum = schema.get('exclusiveMinimum')
+        exclusive_maximum = schema.get('exclusiveMaximum')
+
+        def check(value: Any) -> _Verdict:
+            if not _is_number(value):
+                return True
+            return (minimum is None or value >= minimum) \
+                and (maximum is None or value <= maximum) \
+                and (exclusive_minimum is None or value > exclusive_minimum) \
+                and (exclusive_maximum is None or value < exclusive_maximum)
+        return check
+
+    def __compile_properties(self, schema: Dict[str, Any], document: Dict[str, Any]) -> Optional[_Check]:
+        keywords = ('properties', 'patternProperties', 'additionalProperties',
+                    'required', 'minProperties', 'maxProperties')
+        if not any(keyword in schema for keyword in keywords):
+            return None
+        lookup = self.__compile_property_lookup(schema, document)
+        required = tuple(schema.get('required', ()))
+        min_properties: int = schema.get('minProperties', 0)
+        max_properties: Optional[int] = schema.get('maxProperties')
+
+        def check(value: Any) -> _Verdict:
+            if not isinstance(value, dict):
+                return True
+            if len(value) < min_properties or (max_properties is not None and len(value) > max_properties):
+                return False
+            for name in required:
+                if name not in value:
+                    return False
+            verdict: _Verdict = True
+            for name, item in value.items():
+                v = lookup(name)(item)
+                if v is False:
+                    return False
+                if v is None:
+                    verdict = None
+            return verdict
+        return check
+
+    def __compile_property_lookup(self, schema: Dict[str, Any], document: Dict[str, Any]) -> Callable[[str], _Check]:
+        """Make a lookup of the check of a property value, by the name of the property."""
+        properties = {name: self.__compile(subschema, document)
+                      for name, subschema in schema.get('properties', {}).items()}
+        additional = self.__compile(schema['additionalProperties'], document) \
+            if 'additionalProperties' in schema \
+            else _valid
+        if 'patternProperties' not in schema:
+            return lambda name: properties.get(name, additional)
+        pattern_properties = tuple((re.compile(pattern), self.__compile(subschema, document))
+                                   for pattern, subschema in schema['patternProperties'].items())
+
+        def lookup(name: str) -> _Check:
+            checks = [check for pattern, check in pattern_properties if pattern.search(name) is not None]
+            if name in properties:
+                checks.append(properties[name])
+            elif not checks:
+                checks.append(additional)
+            return _all(checks)
+        return lookup
+
+    def __compile_items(self, schema: Dict[str, Any], document: Dict[str, Any]) -> Optional[_Check]:
+        keywords = ('items', 'minItems', 'maxItems', 'uniqueItems')
+        if not any(keyword in schema for keyword in keywords):
+            return None
+        items_schema = schema.get('items', True)
+        if isinstance(items_schema, list):
+            # tuple typing - the rest of the items go against `additionalItems`
+            tuple_items = tuple(self.__compile(subschema, document) for subschema in items_schema)
+            additional_items = self.__compile(schema.get('additionalItems', True), document)
+        else:
+            tuple_items = ()
+            additional_items = self.__compile(items_schema, document)
+        min_items: int = schema.get('minItems', 0)
+        max_items: Optional[int] = schema.get('maxItems')
+        unique: bool = schema.get('uniqueItems', False)
+
+        def check(value: Any) -> _Verdict:
+            if not isinstance(value, list):
+                return True
+            if len(value) < min_items or (max_items is not None and len(value) > max_items):
+                return False
+            if unique and not _are_unique(value):
+                return False
+            verdict: _Verdict = True
+            for index, item in enumerate(value):
+                v = tuple_items[index](item) if index < len(tuple_items) else additional_items(item)
+                if v is False:
+                    return False
+                if v is None:
+                    verdict = None
+            return verdict
+        return check
+
+    def __compile_combinators(self, schema: Dict[str, Any], document: Dict[str, Any]) -> List[_Check]:
+        checks: List[_Check] = []
+        if 'allOf' in schema:
+            checks.append(_all([self.__compile(subschema, document) for subschema in schema['allOf']]))
+        if 'anyOf' in schema:
+            checks.append(_any([self.__compile(subschema, document) for subschema in schema['anyOf']]))
+        if 'oneOf' in schema:
+            checks.append(_one([self.__compile(subschema, document) for subschema in schema['oneOf']]))
+        if 'propertyNames' in schema:
+            property_names = self.__compile(schema['propertyNames'], document)
+            checks.append(lambda value: _each((property_names, name) for name in value)
+                          if isinstance(value, dict) else True)
+        if 'not' in schema:
+            checks.append(_negated(self.__compile(schema['not'], document)))
+        if 'if' in schema and ('then' in schema or 'else' in schema):
+            checks.append(_conditional(self.__compile(schema['if'], document),
+                                       self.__compile(schema.get('then', True), document),
+                                       self.__compile(schema.get('else', True), document)))
+        return checks
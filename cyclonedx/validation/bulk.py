@@ -0,0 +1,198 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+Bulk validation of many document files across a process pool.
+"""
+
+__all__ = ['BulkValidationResult', 'iter_paths', 'validate_files']
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
+from os import cpu_count, fspath, walk
+from os.path import isdir, join, splitext
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple, Union
+
+from ..exception import MissingOptionalDependencyException
+from ..schema import OutputFormat, SchemaVersion
+from ..schema.detect import detect_format_and_version_of_file
+from . import ValidationError, make_schemabased_validator
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .._internal.io import StrPath
+    from .json import FormatChecks, JsonStrictValidator, JsonValidator
+    from .xml import XmlValidator
+
+_FILE_EXTENSIONS = frozenset(('.json', '.xml'))
+
+
+class BulkValidationResult:
+    """Outcome of validating a single document file - see :func:`validate_files()`."""
+
+    path: str
+    """The validated file."""
+
+    output_format: Optional[OutputFormat]
+    """The detected format - ``None`` if it could not be detected."""
+
+    schema_version: Optional[SchemaVersion]
+    """The detected schema version - ``None`` if it could not be detected."""
+
+    errors: Tuple[str, ...]
+    """Messages of all errors found - including failures to detect or to parse the document."""
+
+    duration: float
+    """Seconds spent on the file - detection, parsing and validation."""
+
+    def __init__(self, path: str,
+                 output_format: Optional[OutputFormat], schema_version: Optional[SchemaVersion],
+                 errors: Tuple[str, ...], duration: float) -> None:
+        self.path = path
+        self.output_format = output_format
+        self.schema_version = schema_version
+        self.errors = errors
+        self.duration = duration
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the document is valid."""
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return f'<BulkValidationResult path={self.path!r} is_valid={self.is_valid!r} duration={self.duration!r}>'
+
+
+def iter_paths(paths: Iterable['StrPath']) -> Iterator[str]:
+    """Expand directories to the JSON and XML files in them - recursively and in a stable order.
+
+    Other paths are passed as they are.
+    """
+    for path in paths:
+        path = fspath(path)
+        if not isdir(path):
+            yield path
+            continue
+        for dirpath, dirnames, filenames in walk(path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if splitext(filename)[1].lower() in _FILE_EXTENSIONS:
+                    yield join(dirpath, filename)
+
+
+@lru_cache(maxsize=None)
+def _get_validator(output_format: OutputFormat, schema_version: SchemaVersion, strict: bool,
+                   format_checks: Union[str, FrozenSet[str]]
+                   ) -> Union['JsonValidator', 'JsonStrictValidator', 'XmlValidator']:
+    # validators are kept for the lifetime of the worker process, and so are their compiled schemas.
+    if OutputFormat.JSON is output_format:
+        from .json import JsonStrictValidator, JsonValidator
+        return (JsonStrictValidator if strict else JsonValidator)(
+            schema_version, format_checks=format_checks)
+    return make_schemabased_validator(output_format, schema_version)
+
+
+def _error_message(error: ValidationError) -> str:
+    # JSON schema errors are verbose - the location and the message are what is needed.
+    json_path = getattr(error.data, 'json_path', None)
+    if json_path is not None:
+        return f'{json_path}: {error.data.message}'
+    return str(error)
+
+
+def _failure_message(error: BaseException) -> str:
+    return str(error) or type(error).__name__
+
+
+def _validate_file(path: str, max_errors: Optional[int], strict: bool,
+                   format_checks: Union[str, FrozenSet[str]]) -> BulkValidationResult:
+    # this runs in a worker process - everything that is returned must be picklable.
+    start = perf_counter()
+    output_format: Optional[OutputFormat] = None
+    schema_version: Optional[SchemaVersion] = None
+    try:
+        output_format, schema_version = detect_format_and_version_of_file(path)
+        validator = _get_validator(output_format, schema_version, strict, format_checks)
+        errors = tuple(_error_message(error) for error in validator.iter_errors(
+            validator._load_path(path), max_errors=max_errors))
+    except MissingOptionalDependencyException:
+        raise  # not a matter of the file
+    except Exception as error:  # unreadable, undetectable, unsupported, malformed, nested too deep, ...
+        errors = (_failure_message(error),)
+    return BulkValidationResult(path, output_format, schema_version, errors, perf_counter() - start)
+
+
+def validate_files(paths: Iterable['StrPath'], *,
+                   max_workers: Optional[int] = None,
+                   max_errors: Optional[int] = None,
+                   strict: bool = False,
+                   format_checks: 'FormatChecks' = 'all') -> Iterator[BulkValidationResult]:
+    """Validate many document files in a process pool.
+
+    Directories are expanded via :func:`iter_paths()`.
+    Format and schema version of each file are detected - see :mod:`cyclonedx.schema.detect`.
+    Each worker process keeps its compiled schemas, so every schema is compiled at most once per worker.
+
+    Results are yielded in the order of completion - not in the order of ``paths``.
+    A file that fails to be validated at all - unreadable, malformed, nested too deep, ... -
+    is reported as invalid, with the failure as its only error; the other files are not affected.
+    Only a bounded number of files is in flight, so ``paths`` may be a lazy and long iterable.
+
+    Requires the optional validation dependencies - see :mod:`cyclonedx.validation`.
+
+    :param paths: files and directories to validate
+    :param max_workers: number of worker processes - defaults to the number of CPUs
+    :param max_errors: collect at most this many errors per file - ``None`` means no limit
+    :param strict: whether to validate JSON strictly - see :class:`~cyclonedx.validation.json.JsonStrictValidator`
+    :param format_checks: which formats to check in JSON - see :data:`~cyclonedx.validation.json.FormatChecks`
+    :return: iterator of results
+    :raises ValueError: if ``max_workers`` or ``max_errors`` is less than ``1``
+    """
+    # checked right away - not on the first result
+    if max_workers is None:
+        max_workers = cpu_count() or 1
+    elif max_workers < 1:
+        raise ValueError(f'Unexpected max_workers: {max_workers!r}')
+    if max_errors is not None and max_errors < 1:
+        raise ValueError(f'Unexpected max_errors: {max_errors!r}')
+    if not isinstance(format_checks, str):
+        format_checks = frozenset(format_checks)  # must be hashable
+    return _validate_files(iter_paths(paths), max_workers, max_errors, strict, format_checks)
+
+
+def _validate_files(paths_iter: Iterator[str], max_workers: int, max_errors: Optional[int], strict: bool,
+                    format_checks: Union[str, FrozenSet[str]]) -> Iterator[BulkValidationResult]:
+    max_pending = max_workers * 4
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending: Dict['Future[BulkValidationResult]', str] = {}
+        while True:
+            for path in islice(paths_iter, max_pending - len(pending)):
+                pending[executor.submit(_validate_file, path, max_errors, strict, format_checks)] = path
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    result = future.result()
+                except MissingOptionalDependencyException:
+                    raise
+                except Exception as error:  # the worker failed - like a crashed process
+                    result = BulkValidationResult(path, None, None, (_failure_message(error),), 0.0)
+                yield result
@@ -16,23 +16,50 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 
-__all__ = ['JsonValidator', 'JsonStrictValidator']
+__all__ = ['JsonValidator', 'JsonStrictValidator', 'FormatChecks', 'FORMAT_CHECKS_FAST', 'json_pointer']
 
 from abc import ABC
-from json import loads as json_loads
-from typing import TYPE_CHECKING, Any, Literal, Optional, Tuple
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from json import dumps as json_dumps, load as json_load, loads as json_loads
+from os import cpu_count
+from os.path import basename
+from threading import Lock
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from ..schema import OutputFormat
 
 if TYPE_CHECKING:  # pragma: no cover
+    from .._internal.io import BytesLike, StrPath
     from ..schema import SchemaVersion
 
+from .._internal.schema_cache import load_json as _load_schema_json
 from ..exception import MissingOptionalDependencyException
 from ..schema._res import BOM_JSON as _S_BOM, BOM_JSON_STRICT as _S_BOM_STRICT, JSF as _S_JSF, SPDX_JSON as _S_SPDX
 from . import BaseSchemabasedValidator, SchemabasedValidator, ValidationError
+from ._structural import StructuralChecker as _StructuralChecker
 
 _missing_deps_error: Optional[Tuple[MissingOptionalDependencyException, ImportError]] = None
 try:
+    from jsonschema import FormatChecker  # type:ignore[import-untyped]
     from jsonschema.exceptions import ValidationError as JsonValidationError  # type:ignore[import-untyped]
     from jsonschema.validators import Draft7Validator  # type:ignore[import-untyped]
     from referencing import Registry
@@ -46,15 +73,111 @@ except ImportError as err:
         'Please install `cyclonedx-python-lib` with the extra "json-validation".\n'
     ), err
 
+_FORMATS_DRAFT7 = frozenset((
+    'date', 'date-time', 'time',
+    'email', 'idn-email',
+    'hostname', 'idn-hostname', 'ipv4', 'ipv6',
+    'uri', 'uri-reference', 'iri', 'iri-reference', 'uri-template',
+    'json-pointer', 'relative-json-pointer',
+    'regex',
+))
+
+FORMAT_CHECKS_FAST: FrozenSet[str] = _FORMATS_DRAFT7 - {
+    # these are costly - they match against huge regular expressions, or run IDNA codecs
+    'uri', 'uri-reference', 'iri', 'iri-reference', 'uri-template',
+    'idn-hostname',
+}
+"""The format checks of the ``'fast'`` preset - see :data:`FormatChecks`."""
+
+FormatChecks = Union[Literal['all', 'none', 'fast'], Iterable[str]]
+"""Which format checks a JSON validator runs.
+
+``'all'``: all format checks of JSON schema draft 7 - the default.
+``'none'``: no format checks at all.
+``'fast'``: all but the costly ones - see :data:`FORMAT_CHECKS_FAST`.
+Alternatively, the names of the formats to check - like ``{'date-time', 'idn-email'}``.
+
+Format checks are done only if the optional dependencies needed for the respective format are installed.
+"""
+
+_FORMAT_CHECKS_PRESETS: Dict[str, FrozenSet[str]] = {
+    'all': _FORMATS_DRAFT7,
+    'none': frozenset(),
+    'fast': FORMAT_CHECKS_FAST,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_structural_checker(schema_file: str, format_checker: Optional['FormatChecker']) -> _StructuralChecker:
+    return _StructuralChecker(
+        _load_schema_json(schema_file),
+        {basename(resource): _load_schema_json(resource) for resource in (_S_SPDX, _S_JSF)},
+        None if format_checker is None else format_checker.conforms)
+
+
+@lru_cache(maxsize=None)
+def _get_fragmented_properties(schema_file: str) -> Tuple[str, ...]:
+    # top-level arrays of referenced definitions - their items are validated one by one.
+    return tuple(
+        name
+        for name, prop in _load_schema_json(schema_file)['properties'].items()
+        if prop.get('type') == 'array' and tuple(prop.get('items', ())) == ('$ref',))
+
+
+def json_pointer(error: ValidationError) -> str:
+    """Get the location of a JSON validation error in the document - as a JSON pointer (:rfc:`6901`).
+
+    Like ``/components/12/name``. The root of the document is ``''``.
+
+    :param error: an error of a JSON validator
+    :return: the JSON pointer
+    """
+    return ''.join(
+        '/' + str(part).replace('~', '~0').replace('/', '~1')
+        for part in error.data.absolute_path)
+
+
+# process-wide cache of compiled validators - see `_BaseJsonValidator._validator`
+_validators: Dict[Tuple[str, FrozenSet[str]], 'JsonSchemaValidator'] = {}
+# process-wide cache of compiled validators for items of top-level arrays - see `_BaseJsonValidator._fragment_validator`
+_fragment_validators: Dict[Tuple[str, FrozenSet[str], str], 'JsonSchemaValidator'] = {}
+_validators_lock = Lock()
+
 
 class _BaseJsonValidator(BaseSchemabasedValidator, ABC):
     @property
     def output_format(self) -> Literal[OutputFormat.JSON]:
         return OutputFormat.JSON
 
-    def __init__(self, schema_version: 'SchemaVersion') -> None:
+    def __init__(self, schema_version: 'SchemaVersion', *,
+                 format_checks: FormatChecks = 'all') -> None:
         # this is the def that is used for generating the documentation
         super().__init__(schema_version)
+        if isinstance(format_checks, str):
+            try:
+                self.__format_checks = _FORMAT_CHECKS_PRESETS[format_checks]
+            except KeyError:
+                raise ValueError(f'Unexpected format_checks: {format_checks!r}') from None
+        else:
+            self.__format_checks = frozenset(format_checks)
+            unknown = self.__format_checks - _FORMATS_DRAFT7
+            if unknown:
+                raise ValueError(f'Unknown formats: {sorted(unknown)!r}')
+
+    @property
+    def format_checks(self) -> FrozenSet[str]:
+        """Get the names of the formats that are checked."""
+        return self.__format_checks
+
+    _fast_path: bool = False
+
+    def _passes_fast_path(self, data: Any) -> bool:
+        if not self._fast_path:
+            return False
+        schema_file = self._schema_file
+        if schema_file is None:
+            raise NotImplementedError('missing schema file')
+        return _get_structural_checker(schema_file, self._validator.format_checker).check(data)
 
     if _missing_deps_error:  # noqa:C901
         __MDERROR = _missing_deps_error
@@ -62,19 +185,140 @@ class _BaseJsonValidator(BaseSchemabasedValidator, ABC):
         def validate_str(self, data: str) -> Optional[ValidationError]:
             raise self.__MDERROR[0] from self.__MDERROR[1]
 
+        def validate_bytes(self, data: 'BytesLike') -> Optional[ValidationError]:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def validate_path(self, path: 'StrPath') -> Optional[ValidationError]:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def validate_file(self, file: IO[Any]) -> Optional[ValidationError]:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def validate_data(self, data: Any) -> Optional[ValidationError]:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def iter_errors(self, data: Any, *, max_errors: Optional[int] = None) -> Iterator[ValidationError]:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def iter_errors_parallel(self, data: Any, *,
+                                 max_errors: Optional[int] = None,
+                                 executor: Optional[Executor] = None,
+                                 max_workers: Optional[int] = None,
+                                 chunk_size: int = 256) -> Iterator[ValidationError]:
+            # arguments are checked regardless of the dependencies
+            if chunk_size < 1:
+                raise ValueError(f'Unexpected chunk_size: {chunk_size!r}')
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def _fragment_validator(self, name: str) -> 'JsonSchemaValidator':
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        @property
+        def _validator(self) -> 'JsonSchemaValidator':
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def _load_path(self, path: 'StrPath') -> Any:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def _warm_up(self) -> None:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
     else:
         def validate_str(self, data: str) -> Optional[ValidationError]:
-            return self._validata_data(
+            return self.validate_data(
                 json_loads(data))
 
-        def _validata_data(self, data: Any) -> Optional[ValidationError]:
+        def validate_bytes(self, data: 'BytesLike') -> Optional[ValidationError]:
+            """Validate a raw document.
+
+            The JSON parser only accepts `bytes`, so any other bytes-like object - like a `mmap.mmap` -
+            is copied as a whole before it is parsed.
+            """
+            return self.validate_data(
+                json_loads(data if isinstance(data, (bytes, bytearray)) else bytes(data)))
+
+        def validate_path(self, path: 'StrPath') -> Optional[ValidationError]:
+            """Validate a document file."""
+            return self.validate_data(
+                self._load_path(path))
+
+        def validate_file(self, file: IO[Any]) -> Optional[ValidationError]:
+            """Validate a document from an open file - binary or text."""
+            return self.validate_data(
+                json_load(file))
+
+        def validate_data(self, data: Any) -> Optional[ValidationError]:
+            """Validate already parsed data - like the result of :func:`json.loads()`.
+
+            This skips any serialization and parsing.
+            """
             validator = self._validator  # may throw on error that MUST NOT be caught
+            if self._passes_fast_path(data):
+                return None
             try:
                 validator.validate(data)
             except JsonValidationError as error:
                 return ValidationError(error)
             return None
 
+        def iter_errors(self, data: Any, *, max_errors: Optional[int] = None) -> Iterator[ValidationError]:
+            """Validate already parsed data, and get all errors of a single validation run.
+
+            Errors are produced lazily - the validation stops as soon as ``max_errors`` were found.
+
+            :param data: the parsed document
+            :param max_errors: stop after this many errors - ``None`` means no limit
+            :return: iterator of validation errors; empty if ``data`` is valid
+            """
+            validator = self._validator  # may throw on error that MUST NOT be caught
+            if self._passes_fast_path(data):
+                return iter(())
+            return (ValidationError(error) for error in islice(validator.iter_errors(data), max_errors))
+
+        def iter_errors_parallel(self, data: Any, *,
+                                 max_errors: Optional[int] = None,
+                                 executor: Optional[Executor] = None,
+                                 max_workers: Optional[int] = None,
+                                 chunk_size: int = 256) -> Iterator[ValidationError]:
+            """Validate already parsed data across a process pool, and get all errors.
+
+            The items of the top-level arrays - like ``components``, ``services`` and ``vulnerabilities`` -
+            are validated in chunks by worker processes, each against the definition of its array's items.
+            Meanwhile, the rest of the document is validated in the current process.
+            So for large documents, validation time scales with the number of CPUs.
+
+            Errors come in a stable order: those of the rest of the document first, then those of the items.
+            Their locations are absolute - see :func:`json_pointer()`.
+            Duplicate items are found via their canonical JSON serialization, not by the schema.
+            Unlike with :meth:`iter_errors()`, errors lack the sub-errors of ``anyOf``/``oneOf`` for items.
+            Does not take any fast path.
+
+            :param data: the parsed document
+            :param max_errors: stop after this many errors - ``None`` means no limit
+            :param executor: the pool to use - keep one for many documents, so workers keep their compiled schemas.
+                             ``None`` means to start a process pool of ``max_workers`` for this document only
+            :param max_workers: number of worker processes - defaults to the number of CPUs
+            :param chunk_size: number of items per task
+            :return: iterator of validation errors; empty if ``data`` is valid
+            """
+            if chunk_size < 1:
+                raise ValueError(f'Unexpected chunk_size: {chunk_size!r}')
+            validator = self._validator  # may throw on error that MUST NOT be caught
+            schema_file = self._schema_file
+            if schema_file is None:
+                raise NotImplementedError('missing schema file')
+            names = tuple(
+                name for name in _get_fragmented_properties(schema_file)
+                if isinstance(data.get(name), list) and data[name]
+            ) if isinstance(data, dict) else ()
+            if not names:
+                return (ValidationError(error) for error in islice(validator.iter_errors(data), max_errors))
+            return _iter_errors_parallel(
+                validator, data, names, (type(self), self.schema_version, self.format_checks),
+                executor, max_workers, chunk_size, max_errors)
+
+        _validata_data = validate_data
+
         __validator: Optional['JsonSchemaValidator'] = None
 
         @property
@@ -83,25 +327,92 @@ class _BaseJsonValidator(BaseSchemabasedValidator, ABC):
                 schema_file = self._schema_file
                 if schema_file is None:
                     raise NotImplementedError('missing schema file')
-                with open(schema_file) as sf:
-                    self.__validator = Draft7Validator(
-                        json_loads(sf.read()),
-                        registry=self.__make_validator_registry(),
-                        format_checker=Draft7Validator.FORMAT_CHECKER)
+                self.__validator = self.__get_validator(schema_file, self.format_checks)
             return self.__validator
 
+        def _load_path(self, path: 'StrPath') -> Any:
+            with open(path, 'rb') as f:
+                return json_loads(f.read())
+
+        def _fragment_validator(self, name: str) -> 'JsonSchemaValidator':
+            # the item's definition is referenced from the root schema, so that all definitions are at hand.
+            # draft 7 ignores the siblings of `$ref`.
+            schema_file = self._schema_file
+            if schema_file is None:
+                raise NotImplementedError('missing schema file')
+            key = (schema_file, self.format_checks, name)
+            validator = _fragment_validators.get(key)
+            if validator is None:
+                root_validator = self._validator
+                with _validators_lock:
+                    validator = _fragment_validators.get(key)
+                    if validator is None:
+                        root_schema = root_validator.schema
+                        validator = _fragment_validators[key] = root_validator.evolve(
+                            schema=dict(root_schema, **root_schema['properties'][name]['items']))
+            return validator
+
+        def _warm_up(self) -> None:
+            self._validator  # noqa:B018
+
+        @classmethod
+        def __get_validator(cls, schema_file: str, format_checks: FrozenSet[str]) -> 'JsonSchemaValidator':
+            # compiled validators are stateless, so they are shared process-wide.
+            # the schema file identifies format, version and strictness.
+            key = (schema_file, format_checks)
+            validator = _validators.get(key)
+            if validator is None:
+                with _validators_lock:
+                    validator = _validators.get(key)
+                    if validator is None:
+                        validator = _validators[key] = Draft7Validator(
+                            _load_schema_json(schema_file),
+                            registry=cls.__get_validator_registry(),
+                            format_checker=cls.__make_format_checker(format_checks))
+            return validator
+
         @staticmethod
-        def __make_validator_registry() -> Registry[Any]:
+        def __make_format_checker(format_checks: FrozenSet[str]) -> Optional[FormatChecker]:
+            if not format_checks:
+                return None
+            if format_checks == _FORMATS_DRAFT7:
+                return Draft7Validator.FORMAT_CHECKER
+            format_checker = FormatChecker(formats=())
+            format_checker.checkers = {
+                name: checker
+                for name, checker in Draft7Validator.FORMAT_CHECKER.checkers.items()
+                if name in format_checks}
+            return format_checker
+
+        @staticmethod
+        @lru_cache(maxsize=1)
+        def __get_validator_registry() -> Registry[Any]:
             schema_prefix = 'http://cyclonedx.org/schema/'
-            with open(_S_SPDX) as spdx, open(_S_JSF) as jsf:
-                return Registry().with_resources([
-                    (f'{schema_prefix}spdx.SNAPSHOT.schema.json', DRAFT7.create_resource(json_loads(spdx.read()))),
-                    (f'{schema_prefix}jsf-0.82.SNAPSHOT.schema.json', DRAFT7.create_resource(json_loads(jsf.read()))),
-                ])
+            return Registry().with_resources([
+                (f'{schema_prefix}spdx.SNAPSHOT.schema.json', DRAFT7.create_resource(_load_schema_json(_S_SPDX))),
+                (f'{schema_prefix}jsf-0.82.SNAPSHOT.schema.json', DRAFT7.create_resource(_load_schema_json(_S_JSF))),
+            ])
 
 
 class JsonValidator(_BaseJsonValidator, BaseSchemabasedValidator, SchemabasedValidator):
-    """Validator for CycloneDX documents in JSON format."""
+    """Validator for CycloneDX documents in JSON format.
+
+    With ``fast_path``, documents are first checked by a lean evaluation of the schema,
+    which either proves a document valid, or gives up.
+    Only documents that it cannot prove valid go through the complete schema validation - to get a proper error.
+    The verdict is the same either way; this is just way faster for large and valid documents.
+    """
+
+    def __init__(self, schema_version: 'SchemaVersion', *,
+                 format_checks: FormatChecks = 'all',
+                 fast_path: bool = False) -> None:
+        super().__init__(schema_version, format_checks=format_checks)
+        self._fast_path = fast_path
+
+    @property
+    def fast_path(self) -> bool:
+        """Whether documents that are proven valid by a lean evaluation of the schema skip the complete validation."""
+        return self._fast_path
 
     @property
     def _schema_file(self) -> Optional[str]:
@@ -117,3 +428,116 @@ class JsonStrictValidator(_BaseJsonValidator, BaseSchemabasedValidator, Schemaba
     @property
     def _schema_file(self) -> Optional[str]:
         return _S_BOM_STRICT.get(self.schema_version)
+
+
+# region parallel validation - see `_BaseJsonValidator.iter_errors_parallel()`
+
+# (item index within the chunk, path, schema path, validator keyword, validator value, message)
+_FragmentError = Tuple[int, Tuple[Union[str, int], ...], Tuple[Union[str, int], ...], str, Any, str]
+
+
+@lru_cache(maxsize=None)
+def _get_worker_validator(validator_type: Type[_BaseJsonValidator], schema_version: 'SchemaVersion',
+                          format_checks: FrozenSet[str]) -> _BaseJsonValidator:
+    return validator_type(schema_version, format_checks=format_checks)
+
+
+def _validate_fragments(validator_type: Type[_BaseJsonValidator], schema_version: 'SchemaVersion',
+                        format_checks: FrozenSet[str], name: str, items: List[Any],
+                        max_errors: Optional[int]) -> List[_FragmentError]:
+    # this runs in a worker process - jsonschema's errors are not passed as they are,
+    # since they carry (sub)schemas and instances, which are costly to pickle.
+    validator = _get_worker_validator(validator_type, schema_version, format_checks)._fragment_validator(name)
+    errors: List[_FragmentError] = []
+    for index, item in enumerate(items):
+        for error in validator.iter_errors(item):
+            errors.append((index, tuple(error.path), tuple(error.schema_path),
+                           error.validator, error.validator_value, error.message))
+            if max_errors is not None and len(errors) >= max_errors:
+                return errors
+    return errors
+
+
+def _get_instance(data: Any, path: Iterable[Union[str, int]]) -> Any:
+    for part in path:
+        data = data[part]
+    return data
+
+
+def _iter_duplicate_errors(schema: Dict[str, Any], data: Dict[str, Any],
+                           names: Iterable[str]) -> Iterator[ValidationError]:
+    for name in names:
+        prop = schema['properties'][name]
+        if not prop.get('uniqueItems'):
+            continue
+        seen = set()
+        for item in data[name]:
+            key = json_dumps(item, sort_keys=True)
+            if key in seen:
+                yield ValidationError(JsonValidationError(
+                    f'{name!r} has non-unique elements',
+                    validator='uniqueItems', validator_value=True,
+                    path=(name,), schema_path=('properties', name, 'uniqueItems'),
+                    instance=data[name]))
+                break
+            seen.add(key)
+
+
+def _iter_errors_parallel(validator: 'JsonSchemaValidator', data: Dict[str, Any], names: Tuple[str, ...],
+                          task: Tuple[Type[_BaseJsonValidator], 'SchemaVersion', FrozenSet[str]],
+                          executor: Optional[Executor], max_workers: Optional[int],
+                          chunk_size: int, max_errors: Optional[int]) -> Iterator[ValidationError]:
+    errors = _iter_errors_parallel_unbounded(validator, data, names, task, executor, max_workers,
+                                             chunk_size, max_errors)
+    try:
+        yield from islice(errors, max_errors)
+    finally:
+        errors.close()  # cancel what is in flight - right away
+
+
+def _iter_errors_parallel_unbounded(validator: 'JsonSchemaValidator', data: Dict[str, Any], names: Tuple[str, ...],
+                                    task: Tuple[Type[_BaseJsonValidator], 'SchemaVersion', FrozenSet[str]],
+                                    executor: Optional[Executor], max_workers: Optional[int],
+                                    chunk_size: int, max_errors: Optional[int]
+                                    ) -> Generator[ValidationError, None, None]:
+    own_executor = executor is None
+    pool = ProcessPoolExecutor(max_workers=max_workers) if executor is None else executor
+    # only a bounded number of chunks is in flight - each one is a copy of its items
+    max_pending = (max_workers or cpu_count() or 1) * 4
+    chunks = ((name, offset, data[name][offset:offset + chunk_size])
+              for name in names
+              for offset in range(0, len(data[name]), chunk_size))
+    pending: Deque[Tuple[str, int, 'Future[List[_FragmentError]]']] = deque()
+
+    def submit(nr_chunks: int) -> None:
+        for name, offset, items in islice(chunks, nr_chunks):
+            pending.append((name, offset, pool.submit(
+                _validate_fragments, *task, name, items, max_errors)))
+
+    try:
+        submit(max_pending)
+        # the rest of the document is validated while the workers are busy
+        envelope = dict(data)
+        for name in names:
+            envelope[name] = []
+        for error in validator.iter_errors(envelope):
+            yield ValidationError(error)
+        yield from _iter_duplicate_errors(validator.schema, data, names)
+        while pending:
+            name, offset, future = pending.popleft()
+            fragment_errors = future.result()
+            submit(1)
+            for index, path, schema_path, keyword, keyword_value, message in fragment_errors:
+                path = (name, offset + index, *path)
+                yield ValidationError(JsonValidationError(
+                    message,
+                    validator=keyword, validator_value=keyword_value,
+                    path=path, schema_path=('properties', name, 'items', *schema_path),
+                    instance=_get_instance(data, path)))
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+        if own_executor:
+            pool.shutdown(wait=True)
+
+# endregion parallel validation
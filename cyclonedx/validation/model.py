@@ -16,7 +16,225 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 
-# nothing here, yet.
-# in the future this could be the place where model validation is done.
-# like the current `model.bom.Bom.validate()`
-# see also: https://github.com/CycloneDX/cyclonedx-python-lib/issues/455
+"""
+Model-level validation - of a :class:`~cyclonedx.model.bom.Bom`, without serializing it.
+"""
+
+__all__ = ['ModelValidator', 'ModelValidationError', 'ModelValidationErrorType']
+
+from enum import Enum
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from ..model import (
+    ExternalReference,
+    HashType,
+    _ExternalReferenceSerializationHelper,
+    _HashTypeRepositorySerializationHelper,
+)
+from ..model.bom_ref import BomRef
+from ..model.component import Component, _ComponentScopeSerializationHelper, _ComponentTypeSerializationHelper
+from ..model.license import LicenseExpression, LicenseRepository
+from ..model.service import Service
+from ..model.vulnerability import Vulnerability, _VulnerabilityScoreSourceSerializationHelper
+from ..schema.schema import SCHEMA_VERSIONS
+from . import ValidationError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..model.bom import Bom
+    from ..schema import SchemaVersion
+
+# references to elements of other BOMs - they cannot be resolved in this one
+_BOM_LINK_PREFIX = 'urn:cdx:'
+
+
+class ModelValidationErrorType(str, Enum):
+    """Kinds of :class:`ModelValidationError`."""
+
+    DUPLICATE_BOM_REF = 'duplicate-bom-ref'
+    DANGLING_DEPENDENCY_REF = 'dangling-dependency-ref'
+    DANGLING_AFFECTS_REF = 'dangling-affects-ref'
+    LICENSE_EXPRESSION_ALONG_WITH_OTHERS = 'license-expression-along-with-others'
+    UNSUPPORTED_VALUE = 'unsupported-value'
+    UNSUPPORTED_HASH_ALGORITHM = 'unsupported-hash-algorithm'
+
+
+class ModelValidationError(ValidationError):
+    """Model validation found this specific error.
+
+    :attr:`~data` is a human-readable message.
+    """
+
+    data: str
+
+    type: ModelValidationErrorType
+    """The kind of error."""
+
+    subject: Any
+    """The model element the error was found in."""
+
+    def __init__(self, type: ModelValidationErrorType, message: str, subject: Any) -> None:  # noqa:B042
+        super().__init__(message)
+        self.type = type
+        self.subject = subject
+
+
+class ModelValidator:
+    """Validator for :class:`~cyclonedx.model.bom.Bom` models, targeting a certain :class:`SchemaVersion`.
+
+    Checks, in a single pass over the model:
+
+    * bom-refs are unique across components, services and vulnerabilities - nested ones included
+    * dependencies refer to known components and services
+    * affected targets of vulnerabilities refer to known components and services - BOM-Links aside
+    * license expressions are not mixed with other licenses
+    * component types, component scopes, external reference types and vulnerability rating methods
+      are supported by the schema version
+    * hash algorithms are supported by the schema version
+
+    All findings are reported at once.
+    This is way cheaper than serializing the model and validating the result against the schema -
+    but it does not replace the schema validation.
+    """
+
+    def __init__(self, schema_version: 'SchemaVersion') -> None:
+        self.__schema_version = schema_version
+        view = SCHEMA_VERSIONS[schema_version]
+        self.__component_types = _ComponentTypeSerializationHelper.cases(view)
+        self.__component_scopes = _ComponentScopeSerializationHelper.cases(view)
+        self.__external_reference_types = _ExternalReferenceSerializationHelper.cases(view)
+        self.__hash_algorithms = _HashTypeRepositorySerializationHelper.cases(view)
+        self.__score_sources = _VulnerabilityScoreSourceSerializationHelper.cases(view)
+
+    @property
+    def schema_version(self) -> 'SchemaVersion':
+        """Get the schema version."""
+        return self.__schema_version
+
+    def validate(self, bom: 'Bom') -> Optional[ModelValidationError]:
+        """Validate a model.
+
+        :param bom: the model to validate
+        :return: the first validation error
+        :retval None: if ``bom`` is valid
+        :retval ModelValidationError: if ``bom`` is invalid
+        """
+        return next(self.iter_errors(bom), None)
+
+    def iter_errors(self, bom: 'Bom', *, max_errors: Optional[int] = None) -> Iterator[ModelValidationError]:
+        """Validate a model, and get all errors.
+
+        Errors are produced lazily - the validation stops as soon as ``max_errors`` were found.
+
+        :param bom: the model to validate
+        :param max_errors: stop after this many errors - ``None`` means no limit
+        :return: iterator of validation errors; empty if ``bom`` is valid
+        """
+        return islice(self.__iter_errors(bom), max_errors)
+
+    def __iter_errors(self, bom: 'Bom') -> Iterator[ModelValidationError]:
+        # targets of dependencies and vulnerabilities
+        known_refs: Set[BomRef] = set()
+        known_ref_values: Set[str] = set()
+        # all that have a bom-ref - to detect duplicates
+        subjects_by_ref_value: Dict[str, Any] = {}
+        metadata = bom.metadata
+        yield from self.__check_licenses(metadata.licenses, metadata)
+        components: List[Component] = list(metadata.tools.components)
+        if metadata.component is not None:
+            components.append(metadata.component)
+        components.extend(bom.components)
+        services: List[Service] = list(metadata.tools.services)
+        services.extend(bom.services)
+        # nested structures are walked iteratively - deeply nested models must not exhaust the stack
+        while components:
+            component = components.pop()
+            known_refs.add(component.bom_ref)
+            yield from self.__check_bom_ref(component.bom_ref, component, subjects_by_ref_value)
+            yield from self.__check_component(component)
+            components.extend(component.components)
+        while services:
+            service = services.pop()
+            known_refs.add(service.bom_ref)
+            yield from self.__check_bom_ref(service.bom_ref, service, subjects_by_ref_value)
+            yield from self.__check_licenses(service.licenses, service)
+            yield from self.__check_external_references(service.external_references, service)
+            services.extend(service.services)
+        yield from self.__check_external_references(bom.external_references, bom)
+        # vulnerabilities are no targets - their refs must be unique, still
+        known_ref_values.update(subjects_by_ref_value)
+        for vulnerability in bom.vulnerabilities:
+            yield from self.__check_bom_ref(vulnerability.bom_ref, vulnerability, subjects_by_ref_value)
+            yield from self.__check_vulnerability(vulnerability, known_ref_values)
+        for dependency in bom.dependencies:
+            for ref in chain((dependency.ref,), dependency.dependencies_as_bom_refs()):
+                if ref not in known_refs:
+                    yield ModelValidationError(
+                        ModelValidationErrorType.DANGLING_DEPENDENCY_REF,
+                        f'Dependency refers to unknown {ref!r}',
+                        dependency)
+
+    @staticmethod
+    def __check_bom_ref(bom_ref: BomRef, subject: Any,
+                        subjects_by_ref_value: Dict[str, Any]) -> Iterator[ModelValidationError]:
+        value = bom_ref.value
+        if value is None:
+            return
+        other = subjects_by_ref_value.setdefault(value, subject)
+        if other is not subject:
+            yield ModelValidationError(
+                ModelValidationErrorType.DUPLICATE_BOM_REF,
+                f'Duplicate bom-ref {value!r} in {subject!r} - already used by {other!r}',
+                subject)
+
+    def __check_component(self, component: Component) -> Iterator[ModelValidationError]:
+        if component.type not in self.__component_types:
+            yield self.__unsupported(component.type, component)
+        if component.scope is not None and component.scope not in self.__component_scopes:
+            yield self.__unsupported(component.scope, component)
+        yield from self.__check_hashes(component.hashes, component)
+        yield from self.__check_licenses(component.licenses, component)
+        yield from self.__check_external_references(component.external_references, component)
+
+    def __check_vulnerability(self, vulnerability: Vulnerability,
+                              known_ref_values: Set[str]) -> Iterator[ModelValidationError]:
+        if self.__score_sources:  # otherwise, vulnerabilities are not supported at all
+            for rating in vulnerability.ratings:
+                if rating.method is not None and rating.method not in self.__score_sources:
+                    yield self.__unsupported(rating.method, vulnerability)
+        for target in vulnerability.affects:
+            if target.ref not in known_ref_values and not target.ref.startswith(_BOM_LINK_PREFIX):
+                yield ModelValidationError(
+                    ModelValidationErrorType.DANGLING_AFFECTS_REF,
+                    f'Vulnerability affects unknown ref {target.ref!r}: {vulnerability!r}',
+                    vulnerability)
+
+    def __check_licenses(self, licenses: LicenseRepository, subject: Any) -> Iterator[ModelValidationError]:
+        # see https://github.com/CycloneDX/specification/pull/205
+        if len(licenses) > 1 and any(isinstance(li, LicenseExpression) for li in licenses):
+            yield ModelValidationError(
+                ModelValidationErrorType.LICENSE_EXPRESSION_ALONG_WITH_OTHERS,
+                f'Found LicenseExpression along with others licenses in: {subject!r}',
+                subject)
+
+    def __check_external_references(self, external_references: Iterable[ExternalReference],
+                                    subject: Any) -> Iterator[ModelValidationError]:
+        for external_reference in external_references:
+            if external_reference.type not in self.__external_reference_types:
+                yield self.__unsupported(external_reference.type, subject)
+            yield from self.__check_hashes(external_reference.hashes, subject)
+
+    def __check_hashes(self, hashes: Iterable[HashType], subject: Any) -> Iterator[ModelValidationError]:
+        for hash_ in hashes:
+            if hash_.alg not in self.__hash_algorithms:
+                yield ModelValidationError(
+                    ModelValidationErrorType.UNSUPPORTED_HASH_ALGORITHM,
+                    f'{hash_.alg!r} is not supported in schema version {self.__schema_version.to_version()}:'
+                    f' {subject!r}',
+                    subject)
+
+    def __unsupported(self, value: Enum, subject: Any) -> ModelValidationError:
+        return ModelValidationError(
+            ModelValidationErrorType.UNSUPPORTED_VALUE,
+            f'{value!r} is not supported in schema version {self.__schema_version.to_version()}: {subject!r}',
+            subject)
@@ -19,22 +19,29 @@
 __all__ = ['XmlValidator']
 
 from abc import ABC
-from typing import TYPE_CHECKING, Any, Literal, Optional, Tuple
+from itertools import islice
+from os import fspath
+from threading import local
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, Literal, Optional, Tuple
 
+from .._internal.io import feed_chunks as _feed_chunks
 from ..exception import MissingOptionalDependencyException
 from ..schema import OutputFormat
 from ..schema._res import BOM_XML as _S_BOM
 from . import BaseSchemabasedValidator, SchemabasedValidator, ValidationError
 
 if TYPE_CHECKING:  # pragma: no cover
+    from .._internal.io import BytesLike, StrPath
     from ..schema import SchemaVersion
 
 _missing_deps_error: Optional[Tuple[MissingOptionalDependencyException, ImportError]] = None
 try:
     from lxml.etree import (  # type:ignore[import-untyped] # nosec B410
+        DocumentInvalid,
         XMLParser,
         XMLSchema,
         fromstring as xml_fromstring,
+        parse as xml_parse,
     )
 except ImportError as err:
     _missing_deps_error = MissingOptionalDependencyException(
@@ -42,6 +49,10 @@ except ImportError as err:
         'Please install `cyclonedx-python-lib` with the extra "xml-validation".\n'
     ), err
 
+# per-thread cache of compiled schemas - see `_BaseXmlValidator._validator`.
+# an `XMLSchema` keeps the error log of its last run, so it must not be shared across threads.
+_validators = local()
+
 
 class _BaseXmlValidator(BaseSchemabasedValidator, ABC):
 
@@ -53,25 +64,94 @@ class _BaseXmlValidator(BaseSchemabasedValidator, ABC):
         # this is the def that is used for generating the documentation
         super().__init__(schema_version)
 
-    if _missing_deps_error:
+    if _missing_deps_error:  # noqa:C901
         __MDERROR = _missing_deps_error
 
         def validate_str(self, data: str) -> Optional[ValidationError]:
             raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def validate_bytes(self, data: 'BytesLike') -> Optional[ValidationError]:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def validate_path(self, path: 'StrPath') -> Optional[ValidationError]:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def validate_file(self, file: IO[Any]) -> Optional[ValidationError]:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def validate_element(self, element: Any) -> Optional[ValidationError]:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def iter_errors(self, element: Any, *, max_errors: Optional[int] = None) -> Iterator[ValidationError]:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def _load_path(self, path: 'StrPath') -> Any:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
+        def _warm_up(self) -> None:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
     else:
         def validate_str(self, data: str) -> Optional[ValidationError]:
-            return self._validata_data(
+            return self.validate_element(
                 xml_fromstring(  # nosec B320
                     bytes(data, encoding='utf8'),
                     parser=self.__xml_parser))
 
-        def _validata_data(self, data: Any) -> Optional[ValidationError]:
+        def validate_bytes(self, data: 'BytesLike') -> Optional[ValidationError]:
+            """Validate a raw document.
+
+            The document is fed to the parser chunk by chunk, so a `mmap.mmap` is never copied as a whole.
+            """
+            parser = self.__xml_parser
+            _feed_chunks(lambda chunk: parser.feed(bytes(chunk)), data)
+            return self.validate_element(parser.close())
+
+        def validate_path(self, path: 'StrPath') -> Optional[ValidationError]:
+            """Validate a document file.
+
+            The file is read by the parser directly.
+            """
+            return self.validate_element(
+                self._load_path(path))
+
+        def validate_file(self, file: IO[Any]) -> Optional[ValidationError]:
+            """Validate a document from an open file."""
+            return self.validate_element(
+                xml_parse(  # nosec B320
+                    file,
+                    parser=self.__xml_parser))
+
+        def validate_element(self, element: Any) -> Optional[ValidationError]:
+            """Validate an already parsed document - an `lxml` element or element tree.
+
+            This skips any serialization and parsing.
+            """
             validator = self._validator  # may throw on error that MUST NOT be caught
-            if not validator.validate(data):
-                return ValidationError(validator.error_log.last_error)
+            try:
+                validator.assertValid(element)
+            except DocumentInvalid as error:
+                return ValidationError(error.error_log.last_error)
             return None
 
-        __validator: Optional['XMLSchema'] = None
+        def iter_errors(self, element: Any, *, max_errors: Optional[int] = None) -> Iterator[ValidationError]:
+            """Validate an already parsed document, and get all errors of a single validation run.
+
+            The schema validation always runs completely; its error log is cut at ``max_errors``.
+            Threads may call this concurrently - each thread validates with its own compiled schema,
+            so the error logs of concurrent runs do not mix.
+
+            :param element: the parsed document - an `lxml` element or element tree
+            :param max_errors: yield at most this many errors - ``None`` means no limit
+            :return: iterator of validation errors; empty if ``element`` is valid
+            """
+            validator = self._validator  # may throw on error that MUST NOT be caught
+            try:
+                validator.assertValid(element)
+            except DocumentInvalid as error:
+                return (ValidationError(log_entry) for log_entry in islice(error.error_log, max_errors))
+            return iter(())
+
+        _validata_data = validate_element
 
         @property
         def __xml_parser(self) -> XMLParser:
@@ -86,12 +166,31 @@ class _BaseXmlValidator(BaseSchemabasedValidator, ABC):
 
         @property
         def _validator(self) -> 'XMLSchema':
-            if not self.__validator:
-                schema_file = self._schema_file
-                if schema_file is None:
-                    raise NotImplementedError('missing schema file')
-                self.__validator = XMLSchema(file=schema_file)
-            return self.__validator
+            # not kept on the instance - an instance may be used in several threads.
+            schema_file = self._schema_file
+            if schema_file is None:
+                raise NotImplementedError('missing schema file')
+            return self.__get_validator(schema_file)
+
+        def _load_path(self, path: 'StrPath') -> Any:
+            return xml_parse(  # nosec B320
+                fspath(path),
+                parser=self.__xml_parser)
+
+        def _warm_up(self) -> None:
+            self._validator  # noqa:B018
+
+        @staticmethod
+        def __get_validator(schema_file: str) -> 'XMLSchema':
+            # compiled schemas are shared by all instances in a thread.
+            # the schema file identifies format and version.
+            validators: Optional[Dict[str, 'XMLSchema']] = getattr(_validators, 'by_schema_file', None)
+            if validators is None:
+                validators = _validators.by_schema_file = {}
+            validator = validators.get(schema_file)
+            if validator is None:
+                validator = validators[schema_file] = XMLSchema(file=schema_file)
+            return validator
 
 
 class XmlValidator(_BaseXmlValidator, BaseSchemabasedValidator, SchemabasedValidator):
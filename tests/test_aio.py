@@ -0,0 +1,126 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from asyncio import CancelledError, StreamWriter, create_task, gather, sleep
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep as blocking_sleep
+from typing import Any, List, cast
+from unittest import IsolatedAsyncioTestCase
+
+from cyclonedx.aio import AsyncRunner
+from cyclonedx.exception import MissingOptionalDependencyException
+from cyclonedx.model.bom import Bom
+from cyclonedx.output import make_outputter
+from cyclonedx.schema import OutputFormat, SchemaVersion
+from tests._data.models import get_bom_with_component_setuptools_basic
+
+
+class _StreamWriterStub:
+
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+        self.drains = 0
+
+    def write(self, data: Any) -> None:
+        self.chunks.append(bytes(data))
+
+    async def drain(self) -> None:
+        self.drains += 1
+
+
+class TestAsyncRunner(IsolatedAsyncioTestCase):
+
+    def test_throws_with_unexpected_max_concurrency(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'max_concurrency'):
+            AsyncRunner(max_concurrency=0)
+
+    async def test_output_as_string(self) -> None:
+        outputter = make_outputter(get_bom_with_component_setuptools_basic(), OutputFormat.JSON, SchemaVersion.V1_6)
+        expected = outputter.output_as_string(indent=2)
+        actual = await AsyncRunner().output_as_string(outputter, indent=2)
+        self.assertEqual(expected, actual)
+
+    async def test_write_to(self) -> None:
+        outputter = make_outputter(get_bom_with_component_setuptools_basic(), OutputFormat.XML, SchemaVersion.V1_6)
+        expected = outputter.output_as_string().encode('utf-8')
+        stream = _StreamWriterStub()
+        await AsyncRunner().write_to(outputter, cast(StreamWriter, stream), chunk_size=100)
+        self.assertEqual(expected, b''.join(stream.chunks))
+        self.assertGreater(len(stream.chunks), 1)
+        self.assertTrue(all(len(chunk) <= 100 for chunk in stream.chunks))
+        self.assertEqual(len(stream.chunks), stream.drains)
+
+    async def test_bom_from_bytes(self) -> None:
+        bom = get_bom_with_component_setuptools_basic()
+        data = make_outputter(bom, OutputFormat.JSON, SchemaVersion.V1_6).output_as_string().encode('utf-8')
+        actual = await AsyncRunner().bom_from_bytes(data)
+        self.assertIsInstance(actual, Bom)
+        self.assertEqual(bom.components, actual.components)
+
+    async def test_validate(self) -> None:
+        data = make_outputter(get_bom_with_component_setuptools_basic(), OutputFormat.JSON, SchemaVersion.V1_6
+                              ).output_as_string()
+        runner = AsyncRunner()
+        try:
+            self.assertIsNone(await runner.validate(OutputFormat.JSON, SchemaVersion.V1_6, data))
+            self.assertIsNone(await runner.validate(OutputFormat.JSON, SchemaVersion.V1_6, data.encode('utf-8')))
+            self.assertIsNotNone(await runner.validate(OutputFormat.JSON, SchemaVersion.V1_6, '{"bomFormat": 1}'))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+
+    async def test_validate_bom(self) -> None:
+        self.assertTrue(await AsyncRunner().validate_bom(get_bom_with_component_setuptools_basic()))
+
+    async def test_bounded_concurrency(self) -> None:
+        lock = Lock()
+        running: List[int] = [0, 0]  # current, max
+
+        def work() -> None:
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            try:
+                blocking_sleep(0.01)
+            finally:
+                with lock:
+                    running[0] -= 1
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            runner = AsyncRunner(executor, max_concurrency=2)
+            self.assertIs(executor, runner.executor)
+            self.assertEqual(2, runner.max_concurrency)
+            await gather(*(runner.run(work) for _ in range(10)))
+        self.assertEqual(2, running[1])
+
+    async def test_cancel_waiting(self) -> None:
+        calls: List[str] = []
+
+        def work(name: str) -> None:
+            blocking_sleep(0.05)
+            calls.append(name)
+
+        runner = AsyncRunner(max_concurrency=1)
+        first = create_task(runner.run(work, 'first'))
+        second = create_task(runner.run(work, 'second'))
+        await sleep(0.01)
+        second.cancel()
+        await first
+        with self.assertRaises(CancelledError):
+            await second
+        self.assertEqual(['first'], calls)
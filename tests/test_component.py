@@ -15,13 +15,15 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
-from os.path import join
+from hashlib import blake2b, sha1, sha256
+from os.path import basename, join
 from unittest import TestCase
 
 # See https://github.com/package-url/packageurl-python/issues/65
 from packageurl import PackageURL
 
 from cyclonedx._internal.hash import file_sha1sum as _file_sha1sum
+from cyclonedx.model import HashAlgorithm
 from cyclonedx.model.component import Component
 from tests import OWN_DATA_DIRECTORY
 from tests._data.models import get_component_setuptools_simple
@@ -74,3 +76,33 @@ class TestComponent(TestCase):
         )
         self.assertEqual(c.purl, purl)
         self.assertEqual(len(c.hashes), 1)
+
+    def test_for_file_with_hash_algorithms(self) -> None:
+        test_file = join(OWN_DATA_DIRECTORY, 'xml', '1.4', 'bom_setuptools.xml')
+        with open(test_file, 'rb') as f:
+            content = f.read()
+        c = Component.for_file(test_file, None, hash_algorithms=(HashAlgorithm.SHA_256, HashAlgorithm.BLAKE2B_512))
+        self.assertEqual(test_file, c.name)
+        self.assertEqual({
+            HashAlgorithm.SHA_1: sha1(content).hexdigest(),  # nosec B303, B324
+            HashAlgorithm.SHA_256: sha256(content).hexdigest(),
+            HashAlgorithm.BLAKE2B_512: blake2b(content).hexdigest(),
+        }, {h.alg: h.content for h in c.hashes})
+
+    def test_for_files(self) -> None:
+        test_files = [join(OWN_DATA_DIRECTORY, 'xml', '1.4', 'webgoat-6.1.xml'),
+                      join(OWN_DATA_DIRECTORY, 'xml', '1.6', 'regression_issue630.xml'),
+                      join(OWN_DATA_DIRECTORY, 'xml', '1.4', 'bom_setuptools.xml')]
+        components = Component.for_files(test_files, path_for_bom=basename, max_workers=2,
+                                         hash_algorithms=(HashAlgorithm.SHA_512,))
+        self.assertEqual(
+            [Component.for_file(f, basename(f), hash_algorithms=(HashAlgorithm.SHA_512,)) for f in test_files],
+            components)
+        self.assertEqual(['webgoat-6.1.xml', 'regression_issue630.xml', 'bom_setuptools.xml'],
+                         [c.name for c in components])
+        self.assertEqual([], Component.for_files([]))
+
+    def test_for_files_missing(self) -> None:
+        test_file = join(OWN_DATA_DIRECTORY, 'xml', '1.4', 'bom_setuptools.xml')
+        with self.assertRaises(FileExistsError):
+            Component.for_files([test_file, join(OWN_DATA_DIRECTORY, 'does-not-exist')])
@@ -24,9 +24,11 @@ from unittest.mock import patch
 
 from ddt import data, ddt, named_data
 
+from cyclonedx.exception.serialization import DeserializationLimitExceededException
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.license import DisjunctiveLicense, LicenseExpression, LicenseRepository
 from cyclonedx.schema import OutputFormat, SchemaVersion
+from cyclonedx.serialization import DeserializationLimits
 from tests import OWN_DATA_DIRECTORY, DeepCompareMixin, SnapshotMixin, mksname
 from tests._data.models import (
     all_get_bom_funct_valid_immut,
@@ -50,6 +52,16 @@ class TestDeserializeJson(TestCase, SnapshotMixin, DeepCompareMixin):
         self.assertBomDeepEqual(expected, bom,
                                 fuzzy_deps=get_bom in all_get_bom_funct_with_incomplete_deps)
 
+    @named_data(*all_get_bom_funct_valid_immut,
+                *all_get_bom_funct_valid_reversible_migrate)
+    @patch('cyclonedx.builder.this.__ThisVersion', 'TESTING')
+    def test_prepared_from_path(self, get_bom: Callable[[], Bom], *_: Any, **__: Any) -> None:
+        snapshot_name = mksname(get_bom, SchemaVersion.V1_6, OutputFormat.JSON)
+        expected = get_bom()
+        bom = Bom.from_path(self.getSnapshotFile(snapshot_name))
+        self.assertBomDeepEqual(expected, bom,
+                                fuzzy_deps=get_bom in all_get_bom_funct_with_incomplete_deps)
+
     def test_empty_supplier(self) -> None:
         """Regression for issue #600
         See: https://github.com/CycloneDX/cyclonedx-python-lib/issues/600
@@ -100,3 +112,32 @@ class TestDeserializeJson(TestCase, SnapshotMixin, DeepCompareMixin):
             json = json_loads(f.read())
         bom: Bom = Bom.from_json(json)  # <<< is expected to not crash
         self.assertIsNotNone(bom)
+
+    @named_data(
+        ('max_bytes', DeserializationLimits(max_bytes=100)),
+        ('max_depth', DeserializationLimits(max_depth=3)),
+        ('max_elements', DeserializationLimits(max_elements=10)),
+        ('max_string_length', DeserializationLimits(max_string_length=5)),
+    )
+    def test_limits_exceeded(self, limits: DeserializationLimits) -> None:
+        json_file = join(self.getSnapshotFile(mksname('get_bom_with_nested_services', SchemaVersion.V1_6,
+                                                      OutputFormat.JSON)))
+        with self.assertRaisesRegex(DeserializationLimitExceededException, 'Document exceeds'):
+            Bom.from_path(json_file, limits=limits)
+
+    def test_limits_not_exceeded(self) -> None:
+        json_file = join(self.getSnapshotFile(mksname('get_bom_with_nested_services', SchemaVersion.V1_6,
+                                                      OutputFormat.JSON)))
+        bom = Bom.from_path(json_file, limits=DeserializationLimits(
+            max_bytes=1024 * 1024, max_depth=10, max_elements=1000, max_string_length=100))
+        self.assertEqual(2, len(bom.services))
+
+    def test_limits_recursion(self) -> None:
+        data = b'{"components": ' + b'[' * 100_000 + b']' * 100_000 + b'}'
+        with self.assertRaises(DeserializationLimitExceededException):
+            Bom.from_bytes(data)
+
+    def test_from_bytes_unexpected_type(self) -> None:
+        with patch.object(Bom, 'from_json', return_value=object()):
+            with self.assertRaisesRegex(TypeError, 'Expected an instance of Bom'):
+                Bom.from_bytes(b'{}', OutputFormat.JSON)
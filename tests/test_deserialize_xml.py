@@ -21,8 +21,10 @@ from unittest.mock import patch
 
 from ddt import ddt, named_data
 
+from cyclonedx.exception.serialization import DeserializationLimitExceededException
 from cyclonedx.model.bom import Bom
 from cyclonedx.schema import OutputFormat, SchemaVersion
+from cyclonedx.serialization import DeserializationLimits
 from tests import DeepCompareMixin, SnapshotMixin, mksname
 from tests._data.models import (
     all_get_bom_funct_valid_immut,
@@ -45,3 +47,41 @@ class TestDeserializeXml(TestCase, SnapshotMixin, DeepCompareMixin):
             bom = Bom.from_xml(s)
         self.assertBomDeepEqual(expected, bom,
                                 fuzzy_deps=get_bom in all_get_bom_funct_with_incomplete_deps)
+
+    @named_data(*all_get_bom_funct_valid_immut,
+                *all_get_bom_funct_valid_reversible_migrate)
+    @patch('cyclonedx.builder.this.__ThisVersion', 'TESTING')
+    def test_prepared_from_path(self, get_bom: Callable[[], Bom], *_: Any, **__: Any) -> None:
+        snapshot_name = mksname(get_bom, SchemaVersion.V1_6, OutputFormat.XML)
+        expected = get_bom()
+        bom = Bom.from_path(self.getSnapshotFile(snapshot_name))
+        self.assertBomDeepEqual(expected, bom,
+                                fuzzy_deps=get_bom in all_get_bom_funct_with_incomplete_deps)
+
+    @named_data(
+        ('max_bytes', DeserializationLimits(max_bytes=100)),
+        ('max_depth', DeserializationLimits(max_depth=3)),
+        ('max_elements', DeserializationLimits(max_elements=10)),
+        ('max_string_length', DeserializationLimits(max_string_length=5)),
+    )
+    def test_limits_exceeded(self, limits: DeserializationLimits) -> None:
+        xml_file = self.getSnapshotFile(mksname('get_bom_with_nested_services', SchemaVersion.V1_6, OutputFormat.XML))
+        with self.assertRaisesRegex(DeserializationLimitExceededException, 'Document exceeds'):
+            Bom.from_path(xml_file, limits=limits)
+
+    @named_data(
+        ('entity_expansion', b'<?xml version="1.0"?><!DOCTYPE bom [<!ENTITY a "aaaa"><!ENTITY b "&a;&a;&a;&a;">]>'
+                             b'<bom xmlns="http://cyclonedx.org/schema/bom/1.6">&b;</bom>'),
+        ('external_entity', b'<?xml version="1.0"?><!DOCTYPE bom [<!ENTITY a SYSTEM "file:///etc/passwd">]>'
+                            b'<bom xmlns="http://cyclonedx.org/schema/bom/1.6">&a;</bom>'),
+    )
+    def test_dtd_rejected(self, data: bytes) -> None:
+        for limits in (None, DeserializationLimits(max_depth=10)):
+            with self.subTest(limits=limits), self.assertRaisesRegex(ValueError, 'document type declarations'):
+                Bom.from_bytes(data, limits=limits)
+
+    def test_limits_not_exceeded(self) -> None:
+        xml_file = self.getSnapshotFile(mksname('get_bom_with_nested_services', SchemaVersion.V1_6, OutputFormat.XML))
+        bom = Bom.from_path(xml_file, limits=DeserializationLimits(
+            max_bytes=1024 * 1024, max_depth=10, max_elements=1000, max_string_length=100))
+        self.assertEqual(2, len(bom.services))
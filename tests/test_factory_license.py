@@ -102,3 +102,34 @@ class TestFactoryLicense(unittest.TestCase):
         with self.assertRaises(InvalidLicenseExpressionException, msg='foo'):
             with unittest.mock.patch('cyclonedx.factory.license.is_spdx_compound_expression', return_value=False):
                 LicenseFactory().make_with_expression('foo')
+
+    def test_make_from_strings(self) -> None:
+        actual = LicenseFactory().make_from_strings(['mit', 'Foo License', 'MIT', 'MIT OR Apache-2.0', 'mit'])
+        self.assertEqual(['mit', 'Foo License', 'MIT', 'MIT OR Apache-2.0'], list(actual))
+        self.assertEqual(DisjunctiveLicense(id='MIT'), actual['mit'])
+        self.assertIs(actual['mit'], actual['MIT'])
+        self.assertEqual(DisjunctiveLicense(name='Foo License'), actual['Foo License'])
+        self.assertEqual(LicenseExpression('MIT OR Apache-2.0'), actual['MIT OR Apache-2.0'])
+
+    def test_make_from_strings_frozen(self) -> None:
+        actual = LicenseFactory().make_from_strings(['MIT', 'Foo License', 'MIT OR Apache-2.0'])
+        with self.assertRaises(AttributeError):
+            actual['MIT'].name = 'bar'  # type:ignore[union-attr]
+        with self.assertRaises(AttributeError):
+            actual['Foo License'].acknowledgement = LicenseAcknowledgement.DECLARED
+        with self.assertRaises(AttributeError):
+            actual['MIT OR Apache-2.0'].value = 'bar'  # type:ignore[union-attr]
+        self.assertEqual(DisjunctiveLicense(id='MIT'), actual['MIT'])
+        # still mutable, when made one by one
+        license = LicenseFactory().make_from_string('MIT')
+        license.acknowledgement = LicenseAcknowledgement.DECLARED
+        self.assertIs(LicenseAcknowledgement.DECLARED, license.acknowledgement)
+
+    def test_make_from_strings_resolves_once(self) -> None:
+        with unittest.mock.patch('cyclonedx.factory.license.spdx_fixup', return_value=None) as fixup, \
+                unittest.mock.patch('cyclonedx.factory.license.validate_spdx_expressions',
+                                    return_value={'foo': False}) as validate:
+            actual = LicenseFactory().make_from_strings(['foo', 'foo', 'foo'])
+        fixup.assert_called_once_with('foo')
+        self.assertEqual(['foo'], list(validate.call_args[0][0]))
+        self.assertEqual({'foo': DisjunctiveLicense(name='foo')}, actual)
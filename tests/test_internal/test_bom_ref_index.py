@@ -0,0 +1,71 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from typing import Any, Callable
+from unittest import TestCase
+from unittest.mock import Mock
+
+from ddt import ddt, named_data
+
+from cyclonedx._internal.bom_ref_index import BomRefIndex, ObservedSortedSet, replace_observed
+
+
+@ddt
+class TestInternalObservedSortedSet(TestCase):
+
+    @named_data(
+        ('add', lambda s: s.add(9)),
+        ('discard', lambda s: s.discard(1)),
+        ('remove', lambda s: s.remove(1)),
+        ('pop', lambda s: s.pop()),
+        ('clear', lambda s: s.clear()),
+        ('delitem', lambda s: s.__delitem__(0)),
+        ('update', lambda s: s.update((8, 9))),
+        ('ior', lambda s: s.__ior__((8, 9))),
+        ('difference_update', lambda s: s.difference_update((1,))),
+        ('intersection_update', lambda s: s.intersection_update((1,))),
+        ('symmetric_difference_update', lambda s: s.symmetric_difference_update((1, 9))),
+        ('replace', lambda s: replace_observed(s, (8, 9))),
+    )
+    def test_notifies(self, modify: Callable[[ObservedSortedSet[int]], Any]) -> None:
+        observed = ObservedSortedSet((3, 1, 2))
+        index = Mock(spec=BomRefIndex)
+        observed.observe(index)
+        modify(observed)
+        index.invalidate.assert_called()
+
+    def test_reading_does_not_notify(self) -> None:
+        observed = ObservedSortedSet((3, 1, 2))
+        index = Mock(spec=BomRefIndex)
+        observed.observe(index)
+        self.assertEqual([1, 2, 3], list(observed))
+        self.assertIn(2, observed)
+        self.assertEqual(3, len(observed))
+        index.invalidate.assert_not_called()
+
+    def test_unobserved_does_not_notify(self) -> None:
+        observed = ObservedSortedSet((3, 1, 2))
+        index = Mock(spec=BomRefIndex)
+        ObservedSortedSet((3, 1, 2)).observe(index)
+        observed.add(9)
+        index.invalidate.assert_not_called()
+
+    def test_derived_sets_are_observed(self) -> None:
+        observed = ObservedSortedSet((3, 1, 2))
+        self.assertIsInstance(observed.copy(), ObservedSortedSet)
+        self.assertIsInstance(observed | (4,), ObservedSortedSet)
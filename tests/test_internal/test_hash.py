@@ -0,0 +1,97 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+import hashlib
+import os
+from os import unlink
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from threading import Thread
+from unittest import TestCase, skipUnless
+
+from ddt import data, ddt
+
+from cyclonedx._internal.hash import file_hashes, file_sha1sum
+from cyclonedx.model import HashAlgorithm
+
+_HASHLIB_NAMES = {
+    HashAlgorithm.MD5: 'md5',
+    HashAlgorithm.SHA_1: 'sha1',
+    HashAlgorithm.SHA_256: 'sha256',
+    HashAlgorithm.SHA_384: 'sha384',
+    HashAlgorithm.SHA_512: 'sha512',
+    HashAlgorithm.SHA3_256: 'sha3_256',
+    HashAlgorithm.SHA3_384: 'sha3_384',
+    HashAlgorithm.SHA3_512: 'sha3_512',
+}
+
+
+@ddt
+class TestInternalFileHashes(TestCase):
+
+    def _make_file(self, content: bytes) -> str:
+        with NamedTemporaryFile(delete=False) as f:
+            f.write(content)
+        self.addCleanup(unlink, f.name)
+        return f.name
+
+    @data(
+        b'',
+        b'foo',
+        bytes(range(256)) * (5 * 1024 * 4),  # 5 MiB - multiple chunks
+    )
+    def test_all_algorithms(self, content: bytes) -> None:
+        expected = {alg: hashlib.new(name, content).hexdigest() for alg, name in _HASHLIB_NAMES.items()}
+        expected[HashAlgorithm.BLAKE2B_256] = hashlib.blake2b(content, digest_size=32).hexdigest()
+        expected[HashAlgorithm.BLAKE2B_384] = hashlib.blake2b(content, digest_size=48).hexdigest()
+        expected[HashAlgorithm.BLAKE2B_512] = hashlib.blake2b(content, digest_size=64).hexdigest()
+        filename = self._make_file(content)
+        self.assertEqual(expected, file_hashes(filename, expected))
+        self.assertEqual(expected[HashAlgorithm.SHA_1], file_sha1sum(filename))
+
+    @skipUnless(hasattr(os, 'mkfifo'), 'needs named pipes')
+    def test_pipe(self) -> None:
+        content = bytes(range(256)) * (5 * 1024 * 4)  # 5 MiB - multiple chunks
+        with TemporaryDirectory() as tmpdir:
+            fifo = os.path.join(tmpdir, 'fifo')
+            os.mkfifo(fifo)
+
+            def write() -> None:
+                with open(fifo, 'wb') as f:
+                    f.write(content)
+            writer = Thread(target=write)
+            writer.start()
+            try:
+                actual = file_hashes(fifo, (HashAlgorithm.SHA_1, HashAlgorithm.SHA_256))
+            finally:
+                writer.join()
+        self.assertEqual({HashAlgorithm.SHA_1: hashlib.sha1(content).hexdigest(),  # nosec B303, B324
+                          HashAlgorithm.SHA_256: hashlib.sha256(content).hexdigest()}, actual)
+
+    @skipUnless(os.path.isfile('/proc/self/cmdline'), 'needs procfs')
+    def test_size_unknown(self) -> None:
+        # files in `/proc` claim to be empty
+        self.assertEqual(0, os.stat('/proc/self/cmdline').st_size)
+        with open('/proc/self/cmdline', 'rb') as f:
+            expected = hashlib.sha1(f.read()).hexdigest()  # nosec B303, B324
+        self.assertNotEqual(hashlib.sha1(b'').hexdigest(), expected)  # nosec B303, B324
+        self.assertEqual(expected, file_sha1sum('/proc/self/cmdline'))
+
+    def test_unsupported(self) -> None:
+        filename = self._make_file(b'foo')
+        with self.assertRaisesRegex(ValueError, 'BLAKE3'):
+            file_hashes(filename, (HashAlgorithm.SHA_1, HashAlgorithm.BLAKE3))
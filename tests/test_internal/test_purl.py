@@ -0,0 +1,62 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from pickle import dumps, loads  # nosec B403
+from unittest import TestCase
+
+from packageurl import PackageURL
+
+from cyclonedx._internal.compare import ComparablePackageURL
+from cyclonedx._internal.purl import purl_from_str
+
+
+class TestInternalPurlFromStr(TestCase):
+
+    def test_parses(self) -> None:
+        purl = purl_from_str('pkg:pypi/foo@1.0?b=2&a=1')
+        self.assertEqual(PackageURL(type='pypi', name='foo', version='1.0', qualifiers={'a': '1', 'b': '2'}), purl)
+
+    def test_not_shared(self) -> None:
+        p1 = purl_from_str('pkg:npm/bar@2.0.0?a=1')
+        p2 = purl_from_str('pkg:npm/bar@2.0.0?a=1')
+        self.assertIsNot(p1, p2)
+        p1.qualifiers['a'] = '2'
+        self.assertEqual({'a': '1'}, p2.qualifiers)
+        self.assertEqual({'a': '1'}, purl_from_str('pkg:npm/bar@2.0.0?a=1').qualifiers)
+        c1 = ComparablePackageURL(PackageURL(type='npm', name='bar', version='2.0.0', qualifiers={'a': '1'}))
+        c2 = ComparablePackageURL(purl_from_str('pkg:npm/bar@2.0.0?a=1'))
+        self.assertFalse(c1 < c2 or c2 < c1)
+
+    def test_invalid_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            purl_from_str('not-a-purl')
+
+
+class TestInternalComparablePackageURL(TestCase):
+
+    def test_order(self) -> None:
+        p1 = ComparablePackageURL(PackageURL(type='npm', name='bar', version='1.0.0', qualifiers={'a': '1'}))
+        p2 = ComparablePackageURL(PackageURL(type='npm', name='bar', version='1.0.0', qualifiers={'a': '2'}))
+        self.assertLess(p1, p2)
+        self.assertGreater(p2, p1)
+
+    def test_picklable(self) -> None:
+        p1 = ComparablePackageURL(PackageURL(type='npm', name='bar', version='1.0.0', qualifiers={'a': '1'}))
+        p2 = loads(dumps(p1))
+        self.assertIsInstance(p2, type(p1))
+        self.assertFalse(p1 < p2 or p2 < p1)
@@ -0,0 +1,69 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from json import loads as json_loads
+from os import listdir
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from cyclonedx._internal.schema_cache import get_cache_dir, load_json, set_cache_dir
+from cyclonedx.schema._res import JSF
+
+
+class TestInternalSchemaCache(TestCase):
+
+    def setUp(self) -> None:
+        with open(JSF, 'rb') as f:
+            self.expected = json_loads(f.read())
+
+    def tearDown(self) -> None:
+        set_cache_dir(None)
+
+    def test_disabled(self) -> None:
+        self.assertIsNone(get_cache_dir())
+        self.assertEqual(self.expected, load_json(JSF))
+
+    def test_enabled(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            cache_dir = join(tmpdir, 'cache')
+            set_cache_dir(cache_dir)
+            self.assertEqual(cache_dir, get_cache_dir())
+            self.assertEqual(self.expected, load_json(JSF))
+            self.assertEqual(1, len(listdir(cache_dir)))
+            with patch('cyclonedx._internal.schema_cache.json_loads') as json_loads_mock:
+                self.assertEqual(self.expected, load_json(JSF))
+            json_loads_mock.assert_not_called()
+
+    def test_corrupted_entry(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            set_cache_dir(tmpdir)
+            load_json(JSF)
+            cache_file, = listdir(tmpdir)
+            with open(join(tmpdir, cache_file), 'wb') as f:
+                f.write(b'garbage')
+            self.assertEqual(self.expected, load_json(JSF))
+
+    def test_unwritable(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            not_a_dir = join(tmpdir, 'file')
+            with open(not_a_dir, 'wb'):
+                pass
+            set_cache_dir(not_a_dir)
+            self.assertEqual(self.expected, load_json(JSF))
@@ -0,0 +1,104 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from json import load as json_load
+from typing import Optional
+from unittest import TestCase
+
+from ddt import data, ddt, unpack
+
+from cyclonedx._internal.spdx_match import DEPRECATED_IDS, SpdxIdMatcher, normalize, strip_annotations
+from cyclonedx.schema._res import SPDX_JSON
+
+with open(SPDX_JSON) as spdx_schema:
+    KNOWN_SPDX_IDS = json_load(spdx_schema)['enum']
+
+
+@ddt
+class TestInternalSpdxMatchNormalize(TestCase):
+
+    @data(
+        ('Apache-2.0', 'apache 2'),
+        ('Apache License, Version 2.0', 'apache 2'),
+        ('GPLv2+', 'gpl 2 orlater'),
+        ('GPL-2.0-or-later', 'gpl 2 orlater'),
+        ('GNU Lesser General Public License v2.1 or any later version', 'lgpl 2.1 orlater'),
+        ('OLDAP-2.0.1', 'oldap 2.0.1'),
+        ('MIT License (MIT)', 'mit'),
+        ('Foo 1 Bar 1', 'foo 1 bar 1'),  # versions are not deduplicated
+        ('', ''),
+    )
+    @unpack
+    def test_normalize(self, value: str, expected: str) -> None:
+        self.assertEqual(expected, normalize(value))
+
+    @data(
+        ('MIT', 'MIT'),
+        ('MIT License (MIT)', 'MIT License  '),
+        ('Apache License 2.0 (Apache-2.0)', 'Apache License 2.0  '),
+        ('GNU General Public License v2 or later', 'GNU General Public License v2 or later'),
+        ('MIT OR Apache-2.0', None),
+        ('GPL-2.0 WITH Classpath-exception-2.0', None),
+        ('Apache-2.0 (MIT)', None),
+        ('(MIT OR Apache-2.0)', None),
+        ('(MIT', None),
+    )
+    @unpack
+    def test_strip_annotations(self, value: str, expected: Optional[str]) -> None:
+        self.assertEqual(expected, strip_annotations(value))
+
+
+class TestInternalSpdxIdMatcher(TestCase):
+
+    def test_all_ids_match_themselves_or_successors(self) -> None:
+        matcher = SpdxIdMatcher(KNOWN_SPDX_IDS)
+        for spdx_id in KNOWN_SPDX_IDS:
+            with self.subTest(spdx_id):
+                actual = matcher.match(spdx_id)
+                assert actual is not None
+                self.assertEqual(1.0, actual[1])
+                self.assertIn(actual[0], (spdx_id, f'{spdx_id}-only', f'{spdx_id[:-1]}-or-later'))
+
+    def test_fuzzy(self) -> None:
+        matcher = SpdxIdMatcher(('MIT', 'Apache-2.0', 'Zlib'))
+        self.assertEqual('Apache-2.0', matcher.match('apache licnse 2')[0])  # type:ignore[index]
+        self.assertIsNone(matcher.match('xyz'))
+
+    def test_fuzzy_versions_must_equal(self) -> None:
+        matcher = SpdxIdMatcher(('GPL-2.0-with-classpath-exception', 'GPL-3.0-only', 'Apache-1.0', 'LGPL-2.0-only'))
+        self.assertEqual('GPL-3.0-only', matcher.match('GNU GPL v3 licnse')[0])  # type:ignore[index]
+        for value in ('GPL-3.0 with classpath exception', 'GPL-2.0+ with classpath exception'):
+            self.assertNotEqual('GPL-2.0-with-classpath-exception', (matcher.match(value) or (None,))[0])
+        self.assertIsNone(matcher.match('Apache Software License'))
+        self.assertIsNone(matcher.match('LGPL'))
+
+    def test_compound_expression(self) -> None:
+        matcher = SpdxIdMatcher(KNOWN_SPDX_IDS, DEPRECATED_IDS)
+        self.assertIsNone(matcher.match('EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0'))
+        # not the exception alone
+        self.assertIsNone(matcher.match('GPL-2.0 with Classpath exception'))
+
+    def test_deprecated_excluded(self) -> None:
+        matcher = SpdxIdMatcher(KNOWN_SPDX_IDS, DEPRECATED_IDS)
+        for spdx_id in KNOWN_SPDX_IDS:
+            with self.subTest(spdx_id):
+                actual = matcher.match(spdx_id)
+                if actual is not None:
+                    self.assertNotIn(actual[0], DEPRECATED_IDS)
+        self.assertEqual(('GPL-2.0-only', 1.0), matcher.match('GPL-2.0'))
+        self.assertIsNone(matcher.match('GPL-2.0-with-classpath-exception'))
@@ -0,0 +1,116 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from ddt import data, ddt, unpack
+
+from cyclonedx.license_policy import LicensePolicy
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
+from cyclonedx.model.license import DisjunctiveLicense, License, LicenseExpression
+from cyclonedx.model.service import Service
+
+COPYLEFT = ('GPL-2.0-only', 'GPL-2.0-or-later', 'GPL-3.0-only', 'GPL-3.0-or-later')
+
+
+@ddt
+class TestLicensePolicy(TestCase):
+
+    def test_canonicalized(self) -> None:
+        policy = LicensePolicy(allowed=('mit', 'GPL-2.0+', 'Foo License'), denied=('apache-2.0',))
+        self.assertEqual(frozenset(('MIT', 'GPL-2.0-or-later', 'Foo License')), policy.allowed)
+        self.assertEqual(frozenset(('Apache-2.0',)), policy.denied)
+
+    @data(
+        (DisjunctiveLicense(id='MIT'), True),
+        (DisjunctiveLicense(id='GPL-3.0-only'), False),
+        (DisjunctiveLicense(id='GPL-2.0+'), False),  # deprecated ID
+        (DisjunctiveLicense(name='Foo License'), True),
+        (LicenseExpression('MIT OR GPL-3.0-only'), True),
+        (LicenseExpression('MIT AND GPL-3.0-only'), False),
+        (LicenseExpression('(MIT OR GPL-3.0-only) AND (Apache-2.0 OR GPL-2.0-only)'), True),
+        (LicenseExpression('GPL-2.0-or-later WITH Classpath-exception-2.0'), False),
+        (LicenseExpression('MIT OR'), False),  # unparsable
+    )
+    @unpack
+    def test_deny_list(self, license: License, expected: bool) -> None:
+        self.assertIs(expected, LicensePolicy(denied=COPYLEFT).is_acceptable(license))
+
+    @data(
+        (DisjunctiveLicense(id='mit'), True),
+        (DisjunctiveLicense(id='Apache-2.0'), False),
+        (DisjunctiveLicense(name='Foo License'), False),
+        (LicenseExpression('MIT OR Apache-2.0'), True),
+        (LicenseExpression('BSD-3-Clause AND Apache-2.0'), False),
+        (LicenseExpression('GPL-2.0-only WITH Classpath-exception-2.0'), True),
+        (LicenseExpression('GPL-2.0-only'), False),
+    )
+    @unpack
+    def test_allow_list(self, license: License, expected: bool) -> None:
+        policy = LicensePolicy(allowed=('MIT', 'BSD-3-Clause', 'GPL-2.0-only WITH Classpath-exception-2.0'))
+        self.assertIs(expected, policy.is_acceptable(license))
+
+    def test_large_expression(self) -> None:
+        # exponentially many choices - a crafted SBOM must not stall the check
+        expression = ' AND '.join(f'(LicenseRef-a{i} OR GPL-3.0-only)' for i in range(200))
+        policy = LicensePolicy(denied=COPYLEFT)
+        self.assertTrue(policy.is_acceptable(LicenseExpression(expression)))
+        self.assertFalse(policy.is_acceptable(LicenseExpression(f'({expression}) AND GPL-2.0-only')))
+        self.assertEqual(frozenset((expression,)), LicensePolicy(allowed=(expression,)).allowed)
+
+    def test_exception_listed_itself(self) -> None:
+        policy = LicensePolicy(allowed=('GPL-2.0-only',), denied=('GPL-2.0-only WITH Classpath-exception-2.0',))
+        self.assertTrue(policy.is_acceptable(DisjunctiveLicense(id='GPL-2.0-only')))
+        self.assertFalse(policy.is_acceptable(LicenseExpression('GPL-2.0-only WITH Classpath-exception-2.0')))
+
+    def test_iter_violations(self) -> None:
+        gpl = DisjunctiveLicense(id='GPL-3.0-only')
+        mit = DisjunctiveLicense(id='MIT')
+        nested = Component(name='nested', licenses=[gpl])
+        bom = Bom(
+            components=[
+                Component(name='a', licenses=[mit], components=[nested]),
+                Component(name='b', licenses=[mit, gpl]),
+                Component(name='c'),
+            ],
+            services=[Service(name='s', licenses=[mit], services=[Service(name='t', licenses=[gpl])])],
+        )
+        bom.metadata.component = Component(name='root', licenses=[LicenseExpression('MIT AND GPL-3.0-only')])
+        violations = list(LicensePolicy(denied=COPYLEFT).iter_violations(bom))
+        self.assertEqual(['root', 'nested', 'b', 't'], [v.subject.name for v in violations])
+        self.assertEqual((gpl,), violations[2].licenses)
+        self.assertTrue(LicensePolicy(denied=COPYLEFT).has_violations(bom))
+        self.assertFalse(LicensePolicy(denied=('Apache-2.0',)).has_violations(bom))
+
+    def test_require_license(self) -> None:
+        bom = Bom(components=[Component(name='a'), Component(name='b', licenses=[DisjunctiveLicense(id='MIT')])])
+        self.assertFalse(LicensePolicy().has_violations(bom))
+        violations = list(LicensePolicy(require_license=True).iter_violations(bom))
+        self.assertEqual(['a'], [v.subject.name for v in violations])
+        self.assertEqual((), violations[0].licenses)
+
+    def test_evaluated_once(self) -> None:
+        shared = LicenseExpression('MIT OR Apache-2.0')
+        bom = Bom(components=[Component(name=f'c{i}', licenses=[shared]) for i in range(10)])
+        policy = LicensePolicy(denied=COPYLEFT)
+        with patch('cyclonedx.license_policy.evaluate_spdx_expression', return_value=True) as evaluate:
+            self.assertFalse(policy.has_violations(bom))
+        evaluate.assert_called_once()
+        self.assertEqual('MIT OR Apache-2.0', evaluate.call_args[0][0])
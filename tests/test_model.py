@@ -520,6 +520,17 @@ class TestModelXsUri(TestCase):
         with self.assertRaises(InvalidUriException):
             XsUri(uri='http://datypic.com#f% rag')
 
+    def test_spec_migrate(self) -> None:
+        self.assertEqual(
+            'https://example.com/a%20b/%22%27%5B%5D%3C%3E%7B%7D',
+            XsUri(uri='https://example.com/a b/"\'[]<>{}').uri
+        )
+
+    def test_invalid_url_repeated(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(InvalidUriException):
+                XsUri(uri='http://datypic.com#frag1#frag2')
+
     def test_note_with_no_locale(self) -> None:
         self.assertIsInstance(
             Note(text=NoteText(content='Something')), Note
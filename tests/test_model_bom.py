@@ -17,10 +17,12 @@
 import warnings
 from typing import Callable, Tuple
 from unittest import TestCase
+from unittest.mock import patch
 from uuid import uuid4
 
 from ddt import ddt, named_data
 
+from cyclonedx._internal.bom_ref_index import BomRefIndex
 from cyclonedx.exception.model import LicenseExpressionAlongWithOthersException
 from cyclonedx.model import Property
 from cyclonedx.model.bom import Bom, BomMetaData
@@ -29,7 +31,10 @@ from cyclonedx.model.component import Component, ComponentType
 from cyclonedx.model.contact import OrganizationalContact, OrganizationalEntity
 from cyclonedx.model.license import DisjunctiveLicense
 from cyclonedx.model.lifecycle import LifecyclePhase, NamedLifecycle, PredefinedLifecycle
+from cyclonedx.model.service import Service
 from cyclonedx.model.tool import Tool
+from cyclonedx.model.vulnerability import Vulnerability
+from cyclonedx.output import BomRefDiscriminator
 from cyclonedx.output.json import JsonV1Dot6
 from tests._data.models import (
     get_bom_component_licenses_invalid,
@@ -232,6 +237,86 @@ class TestBom(TestCase):
         self.assertIs(result, setuptools_simple)
         self.assertIsNone(bom.get_component_by_purl(get_component_setuptools_simple_no_version().purl))
 
+    def test_get_component_by_purl_str(self) -> None:
+        bom = Bom()
+        setuptools_simple = get_component_setuptools_simple()
+        bom.components.add(setuptools_simple)
+
+        result = bom.get_component_by_purl(setuptools_simple.purl.to_string())
+
+        self.assertIs(result, setuptools_simple)
+        self.assertIsNone(bom.get_component_by_purl('pkg:pypi/setuptools'))
+
+    def test_get_by_bom_ref(self) -> None:
+        nested = Component(name='nested', bom_ref='nested')
+        component = Component(name='comp', bom_ref='comp', components=[nested])
+        root = Component(name='root', bom_ref='root')
+        nested_service = Service(name='nested', bom_ref='nested-service')
+        service = Service(name='serv', bom_ref='serv', services=[nested_service])
+        vulnerability = Vulnerability(id='vuln', bom_ref='vuln')
+        bom = Bom(components=[component], services=[service], vulnerabilities=[vulnerability],
+                  metadata=BomMetaData(component=root))
+        self.assertIs(nested, bom.get_by_bom_ref('nested'))
+        self.assertIs(component, bom.get_by_bom_ref(BomRef('comp')))
+        self.assertIs(root, bom.get_by_bom_ref('root'))
+        self.assertIs(nested_service, bom.get_by_bom_ref('nested-service'))
+        self.assertIs(service, bom.get_by_bom_ref(service.bom_ref))
+        self.assertIs(vulnerability, bom.get_by_bom_ref('vuln'))
+        self.assertIsNone(bom.get_by_bom_ref('unknown'))
+        self.assertIsNone(bom.get_by_bom_ref(''))
+        self.assertIsNone(bom.get_by_bom_ref(BomRef()))
+
+    def test_get_by_bom_ref_first_wins(self) -> None:
+        component = Component(name='a', bom_ref='dup')
+        bom = Bom(components=[component, Component(name='b', bom_ref='dup')],
+                  services=[Service(name='s', bom_ref='dup')])
+        self.assertIs(component, bom.get_by_bom_ref('dup'))
+
+    def test_get_by_bom_ref_in_sync(self) -> None:
+        component = Component(name='comp', bom_ref='comp')
+        bom = Bom(components=[component])
+        self.assertIs(component, bom.get_by_bom_ref('comp'))
+        nested = Component(name='nested', bom_ref='nested')
+        component.components.add(nested)
+        self.assertIs(nested, bom.get_by_bom_ref('nested'))
+        component.components.remove(nested)
+        self.assertIsNone(bom.get_by_bom_ref('nested'))
+        component.components = [nested]
+        self.assertIs(nested, bom.get_by_bom_ref('nested'))
+        service = Service(name='nested', bom_ref='service')
+        bom.services = [Service(name='serv', services=[service])]
+        self.assertIs(service, bom.get_by_bom_ref('service'))
+        bom.services.clear()
+        self.assertIsNone(bom.get_by_bom_ref('service'))
+        root = Component(name='root', bom_ref='root')
+        bom.metadata.component = root
+        self.assertIs(root, bom.get_by_bom_ref('root'))
+        bom.metadata = BomMetaData()
+        self.assertIsNone(bom.get_by_bom_ref('root'))
+
+    def test_get_by_bom_ref_built_once(self) -> None:
+        bom = Bom(components=[Component(name=f'c{i}', bom_ref=f'c{i}') for i in range(10)])
+        with patch.object(BomRefIndex, '_BomRefIndex__build', autospec=True,
+                          side_effect=vars(BomRefIndex)['_BomRefIndex__build']) as build:
+            for i in range(10):
+                self.assertIsNotNone(bom.get_by_bom_ref(f'c{i}'))
+            self.assertEqual(1, build.call_count)
+            bom.components.add(Component(name='new', bom_ref='new'))
+            self.assertIsNotNone(bom.get_by_bom_ref('new'))
+            self.assertEqual(2, build.call_count)
+            # changes of other boms and their components do not matter
+            other = Bom(components=[Component(name='other', bom_ref='other')])
+            other.components.add(Component(name='more', bom_ref='more'))
+            other.metadata.component = Component(name='root', bom_ref='root')
+            self.assertIsNone(bom.get_by_bom_ref('other'))
+            self.assertEqual(2, build.call_count)
+
+    def test_get_by_bom_ref_while_discriminated(self) -> None:
+        component = Component(name='comp', bom_ref='dup')
+        bom = Bom(components=[component, Component(name='other', bom_ref='dup')])
+        with BomRefDiscriminator.from_bom(bom):
+            self.assertIs(component, bom.get_by_bom_ref('dup'))
+
     @named_data(
         ('none', tuple()),
         # a = anonymous - bom-ref auto-set
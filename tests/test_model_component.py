@@ -16,9 +16,14 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 import datetime
+from copy import deepcopy
+from pickle import dumps, loads  # nosec B403
 from typing import List
 from unittest import TestCase
 
+from packageurl import PackageURL
+
+from cyclonedx._internal.purl import purl_from_str
 from cyclonedx.exception.model import NoPropertiesProvidedException
 from cyclonedx.model import (
     AttachedText,
@@ -263,6 +268,17 @@ class TestModelComponent(TestCase):
         expected_components = reorder(components, expected_order)
         self.assertListEqual(sorted_components, expected_components)
 
+    def test_copy_with_purl(self) -> None:
+        # the cached sort key of the PURL must survive copying
+        purl = PackageURL(type='pypi', name='foo', version='1.0', qualifiers={'a': '1'})
+        c1 = Component(name='foo', purl=purl)
+        for c2 in (deepcopy(c1), loads(dumps(c1))):  # nosec B301
+            with self.subTest(c2=c2):
+                self.assertEqual(c1, c2)
+                self.assertEqual(purl, c2.purl)
+                self.assertFalse(c1 < c2 or c2 < c1)
+                self.assertLess(c2, Component(name='foo', purl=purl_from_str('pkg:pypi/foo@1.0?a=2')))
+
     def test_nested_components_1(self) -> None:
         comp_b = Component(name='comp_b')
         comp_c = Component(name='comp_c')
@@ -16,8 +16,11 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 
+import re
+from contextvars import copy_context
 from itertools import product
-from typing import Tuple
+from threading import Thread
+from typing import List, Optional, Tuple
 from unittest import TestCase
 from unittest.mock import Mock
 
@@ -25,8 +28,9 @@ from ddt import data, ddt, named_data, unpack
 
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.bom_ref import BomRef
-from cyclonedx.output import BomRefDiscriminator, make_outputter
+from cyclonedx.output import BomRefDiscriminator, DeterministicBomRefDiscriminator, make_outputter
 from cyclonedx.schema import OutputFormat, SchemaVersion
+from tests._data.models import bom_all_same_bomref
 
 
 @ddt
@@ -57,23 +61,162 @@ class TestBomRefDiscriminator(TestCase):
     def test_discriminate_and_reset_with(self) -> None:
         bomref1 = BomRef('djdlkfjdslkf')
         bomref2 = BomRef('djdlkfjdslkf')
-        self.assertEqual(bomref1.value, bomref2.value, 'blank')
+        self.assertEqual(BomRef.serialize(bomref1), BomRef.serialize(bomref2), 'blank')
         discr = BomRefDiscriminator([bomref1, bomref2])
-        self.assertEqual(bomref1.value, bomref2.value, 'init')
+        self.assertEqual(BomRef.serialize(bomref1), BomRef.serialize(bomref2), 'init')
         discr.discriminate()
-        self.assertNotEqual(bomref1.value, bomref2.value, 'should be discriminated')
+        self.assertNotEqual(BomRef.serialize(bomref1), BomRef.serialize(bomref2), 'should be discriminated')
         discr.reset()
-        self.assertEqual('djdlkfjdslkf', bomref1.value)
-        self.assertEqual('djdlkfjdslkf', bomref2.value)
+        self.assertEqual('djdlkfjdslkf', BomRef.serialize(bomref1))
+        self.assertEqual('djdlkfjdslkf', BomRef.serialize(bomref2))
 
     def test_discriminate_and_reset_manually(self) -> None:
         bomref1 = BomRef('djdlkfjdslkf')
         bomref2 = BomRef('djdlkfjdslkf')
-        self.assertEqual(bomref1.value, bomref2.value, 'blank')
+        self.assertEqual(BomRef.serialize(bomref1), BomRef.serialize(bomref2), 'blank')
         discr = BomRefDiscriminator([bomref1, bomref2])
-        self.assertEqual(bomref1.value, bomref2.value, 'init')
+        self.assertEqual(BomRef.serialize(bomref1), BomRef.serialize(bomref2), 'init')
         with discr:
-            self.assertNotEqual(bomref1.value, bomref2.value, 'should be discriminated')
+            self.assertNotEqual(BomRef.serialize(bomref1), BomRef.serialize(bomref2), 'should be discriminated')
         discr.reset()
-        self.assertEqual('djdlkfjdslkf', bomref1.value)
-        self.assertEqual('djdlkfjdslkf', bomref2.value)
+        self.assertEqual('djdlkfjdslkf', BomRef.serialize(bomref1))
+        self.assertEqual('djdlkfjdslkf', BomRef.serialize(bomref2))
+
+    def test_discriminate_none(self) -> None:
+        bomref1 = BomRef()
+        bomref2 = BomRef('foo')
+        with BomRefDiscriminator([bomref1, bomref2]):
+            self.assertIsNotNone(BomRef.serialize(bomref1))
+            self.assertNotEqual(BomRef.serialize(bomref1), BomRef.serialize(bomref2))
+            self.assertEqual('foo', BomRef.serialize(bomref2))
+        self.assertIsNone(BomRef.serialize(bomref1))
+
+    def test_discriminate_keeps_first(self) -> None:
+        bomrefs = [BomRef('foo'), BomRef('bar'), BomRef('foo')]
+        with BomRefDiscriminator(bomrefs):
+            self.assertEqual('foo', BomRef.serialize(bomrefs[0]))
+            self.assertEqual('bar', BomRef.serialize(bomrefs[1]))
+            self.assertNotIn(BomRef.serialize(bomrefs[2]), ('foo', 'bar'))
+
+    def test_discriminate_avoids_generated_collisions(self) -> None:
+        class RepetitiveDiscriminator(BomRefDiscriminator):
+            uniques = iter(('foo', 'bar', 'bar', 'baz'))
+
+            def _make_unique(self) -> str:
+                return next(self.uniques)
+
+        bomrefs = [BomRef('foo'), BomRef(), BomRef()]
+        with RepetitiveDiscriminator(bomrefs):
+            self.assertEqual(['foo', 'bar', 'baz'], [BomRef.serialize(bomref) for bomref in bomrefs])
+
+    def test_model_untouched(self) -> None:
+        bomref1 = BomRef('foo')
+        bomref2 = BomRef('foo')
+        seen_elsewhere: List[Optional[str]] = []
+        with BomRefDiscriminator([bomref1, bomref2]):
+            self.assertNotEqual(BomRef.serialize(bomref1), BomRef.serialize(bomref2))
+            self.assertEqual(('foo', 'foo'), (bomref1.value, bomref2.value), 'values are not affected')
+            self.assertEqual(bomref1, bomref2, 'equality is not affected')
+            thread = Thread(target=lambda: seen_elsewhere.extend(map(BomRef.serialize, (bomref1, bomref2))))
+            thread.start()
+            thread.join()
+        self.assertEqual(['foo', 'foo'], seen_elsewhere)
+
+    def test_nested(self) -> None:
+        bomref1 = BomRef()
+        bomref2 = BomRef()
+        with BomRefDiscriminator([bomref1]):
+            value1 = BomRef.serialize(bomref1)
+            with BomRefDiscriminator([bomref2]):
+                self.assertEqual(value1, BomRef.serialize(bomref1))
+                self.assertIsNotNone(BomRef.serialize(bomref2))
+            self.assertIsNone(BomRef.serialize(bomref2))
+        self.assertIsNone(BomRef.serialize(bomref1))
+
+    def test_reset_in_other_context(self) -> None:
+        bomref1 = BomRef()
+        bomref2 = BomRef()
+        outer = BomRefDiscriminator([bomref1])
+        outer.discriminate()
+        value1 = BomRef.serialize(bomref1)
+        self.assertIsNotNone(value1)
+        inner = BomRefDiscriminator([bomref2])
+        copy_context().run(inner.discriminate)
+        inner.reset()  # not the context it was discriminated in
+        self.assertEqual(value1, BomRef.serialize(bomref1), 'restored what was there before')
+        self.assertIsNone(BomRef.serialize(bomref2))
+        outer.reset()
+        self.assertIsNone(BomRef.serialize(bomref1))
+
+    def test_concurrent_output(self) -> None:
+        bom, nr_bomrefs = bom_all_same_bomref()
+        results: List[List[str]] = []
+
+        def output(output_format: OutputFormat) -> None:
+            for _ in range(20):
+                found = re.findall(r'bom-ref(?:"\s*:\s*|=)"(.*?)"',
+                                   make_outputter(bom, output_format, SchemaVersion.V1_6).output_as_string())
+                results.append(found)
+
+        threads = [Thread(target=output, args=(of,)) for of in (OutputFormat.JSON, OutputFormat.XML) * 2]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(80, len(results))
+        for found in results:
+            self.assertEqual(nr_bomrefs, len(set(found)), 'expected unique items')
+        self.assertEqual({'foo'}, {c.bom_ref.value for c in bom._get_all_components()})
+
+    def test_discriminate_many(self) -> None:
+        # benchmark-ish: 100k refs, mostly duplicates and blanks - was quadratic, must stay linear
+        bomrefs = [BomRef(None if i % 3 == 0 else f'ref-{i % 1000}') for i in range(100_000)]
+        with BomRefDiscriminator(bomrefs):
+            self.assertEqual(len(bomrefs), len({BomRef.serialize(bomref) for bomref in bomrefs}))
+        self.assertEqual(33_334, sum(1 for bomref in bomrefs if BomRef.serialize(bomref) is None))
+
+
+class TestDeterministicBomRefDiscriminator(TestCase):
+
+    def test_discriminate_and_reset(self) -> None:
+        bomrefs = [BomRef(), BomRef('foo'), BomRef('foo'), BomRef()]
+        discr = DeterministicBomRefDiscriminator(zip(bomrefs, ('a', 'b', 'b', 'a')))
+        with discr:
+            values = [BomRef.serialize(bomref) for bomref in bomrefs]
+        self.assertEqual([None, 'foo', 'foo', None], [BomRef.serialize(bomref) for bomref in bomrefs])
+        self.assertEqual('foo', values[1])
+        self.assertEqual(4, len(set(values)))
+        self.assertTrue(all(value.startswith('BomRef-') for value in values if value != 'foo'))
+        with discr:
+            self.assertEqual(values, [BomRef.serialize(bomref) for bomref in bomrefs], 'reproducible')
+        other_bomrefs = [BomRef(), BomRef('foo'), BomRef('foo'), BomRef()]
+        with DeterministicBomRefDiscriminator(zip(other_bomrefs, ('a', 'b', 'b', 'a'))):
+            self.assertEqual(values, [BomRef.serialize(bomref) for bomref in other_bomrefs], 'reproducible')
+
+    def test_keeps_given_values(self) -> None:
+        class CollidingDiscriminator(DeterministicBomRefDiscriminator):
+            def _make_deterministic(self, identity: str, occurrence: int) -> str:
+                return f'{identity}{occurrence}'
+
+        bomrefs = [BomRef(), BomRef('a1'), BomRef(), BomRef('a0')]
+        with CollidingDiscriminator(zip(bomrefs, 'aaaa')):
+            self.assertEqual(['a2', 'a1', 'a3', 'a0'], [BomRef.serialize(bomref) for bomref in bomrefs])
+
+    def test_from_bom(self) -> None:
+        def discriminated() -> List[str]:
+            bom, _ = bom_all_same_bomref()
+            bomrefs = [c.bom_ref for c in bom._get_all_components()]
+            bomrefs.extend(s.bom_ref for s in bom.services)
+            bomrefs.extend(v.bom_ref for v in bom.vulnerabilities)
+            with DeterministicBomRefDiscriminator.from_bom(bom):
+                return [BomRef.serialize(bomref) for bomref in bomrefs]
+
+        values = discriminated()
+        self.assertEqual(6, len(set(values)))
+        self.assertEqual(values, discriminated())
+
+    def test_make_outputter(self) -> None:
+        bom = Mock(spec=Bom)
+        self.assertFalse(make_outputter(bom, OutputFormat.JSON, SchemaVersion.V1_6).deterministic_bom_refs)
+        self.assertTrue(make_outputter(bom, OutputFormat.XML, SchemaVersion.V1_6,
+                                       deterministic_bom_refs=True).deterministic_bom_refs)
@@ -85,6 +85,18 @@ class TestOutputXml(TestCase, SnapshotMixin):
             return None  # expected
         raise error.exception
 
+    @named_data(*(
+        (n, gb) for n, gb in all_get_bom_funct_valid
+        if is_valid_for_schema_version(gb, SchemaVersion.V1_6)
+    ))
+    def test_validate(self, get_bom: Callable[[], Bom]) -> None:
+        outputter = BY_SCHEMA_VERSION[SchemaVersion.V1_6](get_bom())
+        try:
+            errors = outputter.validate()
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertIsNone(errors)
+
     def test_bomref_not_duplicate(self) -> None:
         bom, nr_bomrefs = bom_all_same_bomref()
         output = BY_SCHEMA_VERSION[SchemaVersion.V1_4](bom).output_as_string()
@@ -92,6 +104,15 @@ class TestOutputXml(TestCase, SnapshotMixin):
         self.assertEqual(nr_bomrefs, len(found))
         self.assertCountEqual(set(found), found, 'expected unique items')
 
+    def test_bomref_deterministic(self) -> None:
+        def output() -> str:
+            bom, _ = bom_all_same_bomref()
+            return BY_SCHEMA_VERSION[SchemaVersion.V1_4](bom, deterministic_bom_refs=True).output_as_string()
+
+        found = re.findall(r'bom-ref="(.*?)"', output())
+        self.assertCountEqual(set(found), found, 'expected unique items')
+        self.assertEqual(found, re.findall(r'bom-ref="(.*?)"', output()), 'expected reproducible items')
+
 
 @ddt
 class TestFunctionalBySchemaVersion(TestCase):
@@ -0,0 +1,107 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from glob import iglob
+from io import BytesIO
+from os.path import join
+from unittest import TestCase
+
+from ddt import ddt, idata, named_data, unpack
+
+from cyclonedx.schema import OutputFormat, SchemaVersion
+from cyclonedx.schema.detect import (
+    detect_format,
+    detect_format_and_version,
+    detect_format_and_version_of_file,
+    detect_format_and_version_of_stream,
+    detect_format_of_file,
+)
+from tests import SCHEMA_TESTDATA_DIRECTORY, SNAPSHOTS_DIRECTORY, DpTuple
+
+
+@ddt
+class TestDetectFormat(TestCase):
+
+    @named_data(
+        ('json', b'{"bomFormat": "CycloneDX"}', OutputFormat.JSON),
+        ('json_whitespace', b'\n\t  {}', OutputFormat.JSON),
+        ('json_utf8bom', b'\xef\xbb\xbf{}', OutputFormat.JSON),
+        ('xml', b'<?xml version="1.0" ?><bom/>', OutputFormat.XML),
+        ('xml_whitespace', b'\r\n<bom/>', OutputFormat.XML),
+        ('xml_utf8bom', b'\xef\xbb\xbf<bom/>', OutputFormat.XML),
+    )
+    def test_detect(self, data: bytes, expected: OutputFormat) -> None:
+        self.assertIs(expected, detect_format(data))
+        self.assertIs(expected, detect_format(memoryview(data)))
+
+    @named_data(
+        ('empty', b''),
+        ('whitespace', b'   '),
+        ('text', b'foo bar'),
+    )
+    def test_undetectable(self, data: bytes) -> None:
+        with self.assertRaises(ValueError):
+            detect_format(data)
+
+    def test_file(self) -> None:
+        self.assertIs(OutputFormat.JSON, detect_format_of_file(
+            join(SNAPSHOTS_DIRECTORY, 'get_bom_just_complete_metadata-1.6.json.bin')))
+        self.assertIs(OutputFormat.XML, detect_format_of_file(
+            join(SNAPSHOTS_DIRECTORY, 'get_bom_just_complete_metadata-1.6.xml.bin')))
+
+
+@ddt
+class TestDetectFormatAndVersion(TestCase):
+
+    @idata(
+        DpTuple((sv, tf))
+        for sv in SchemaVersion
+        for tf in iglob(join(SCHEMA_TESTDATA_DIRECTORY, sv.to_version(), 'valid-*.*'))
+    )
+    @unpack
+    def test_file(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        expected_format = OutputFormat.JSON if test_data_file.endswith('.json') else OutputFormat.XML
+        self.assertEqual((expected_format, schema_version), detect_format_and_version_of_file(test_data_file))
+
+    @named_data(
+        ('json_spec_version', b'{"bomFormat": "CycloneDX", "specVersion": "1.4"}',
+         OutputFormat.JSON, SchemaVersion.V1_4),
+        ('json_schema', b'{"$schema": "http://cyclonedx.org/schema/bom-1.2b.schema.json"}',
+         OutputFormat.JSON, SchemaVersion.V1_2),
+        ('xml', b'<?xml version="1.0"?><bom xmlns="http://cyclonedx.org/schema/bom/1.0" version="1"/>',
+         OutputFormat.XML, SchemaVersion.V1_0),
+        ('xml_prefixed', b"<cdx:bom xmlns:cdx='http://cyclonedx.org/schema/bom/1.6'/>",
+         OutputFormat.XML, SchemaVersion.V1_6),
+    )
+    def test_detect(self, data: bytes, expected_format: OutputFormat, expected_version: SchemaVersion) -> None:
+        self.assertEqual((expected_format, expected_version), detect_format_and_version(data))
+
+    @named_data(
+        ('json_unknown', b'{"specVersion": "9.9"}'),
+        ('json_missing', b'{"bomFormat": "CycloneDX"}'),
+        ('xml_missing', b'<bom xmlns="http://example.com"/>'),
+    )
+    def test_undetectable(self, data: bytes) -> None:
+        with self.assertRaises(ValueError):
+            detect_format_and_version(data)
+
+    def test_stream_is_rewound(self) -> None:
+        stream = BytesIO(b'{"specVersion": "1.5", "components": []}')
+        stream.seek(0)
+        self.assertEqual((OutputFormat.JSON, SchemaVersion.V1_5), detect_format_and_version_of_stream(stream))
+        self.assertEqual(0, stream.tell())
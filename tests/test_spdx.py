@@ -15,9 +15,13 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
+import sys
 from itertools import chain
 from json import load as json_load
+from subprocess import run  # nosec B404
+from typing import Set, Tuple
 from unittest import TestCase
+from unittest.mock import patch
 
 from ddt import data, ddt, idata, unpack
 
@@ -94,3 +98,145 @@ class TestSpdxIsCompoundExpression(TestCase):
     def test_negative(self, invalid_expression: str) -> None:
         actual = spdx.is_compound_expression(invalid_expression)
         self.assertFalse(actual)
+
+
+class TestSpdxValidateExpressions(TestCase):
+
+    def test_deduplicated(self) -> None:
+        actual = spdx.validate_expressions([
+            'MIT OR Apache-2.0', '(c) John Doe', 'MIT OR Apache-2.0', 'BSD-2-Clause AND MIT'])
+        self.assertEqual([
+            ('MIT OR Apache-2.0', True), ('(c) John Doe', False), ('BSD-2-Clause AND MIT', True),
+        ], list(actual.items()))
+
+    def test_empty(self) -> None:
+        self.assertEqual({}, spdx.validate_expressions(()))
+
+    def test_memoized(self) -> None:
+        value = 'ISC OR 0BSD OR MIT-0'  # not used elsewhere
+        licensing = vars(spdx)['__get_expression_licensing']()  # name would be mangled in here
+        with patch.object(licensing, 'validate', wraps=licensing.validate) as validate:
+            self.assertTrue(spdx.is_compound_expression(value))
+            self.assertTrue(spdx.is_compound_expression(value))
+            self.assertEqual({value: True}, spdx.validate_expressions([value, value]))
+        validate.assert_called_once_with(value)
+
+
+@ddt
+class TestSpdxMatchId(TestCase):
+
+    @data(
+        ('Apache 2.0', 'Apache-2.0'),
+        ('Apache License, Version 2.0', 'Apache-2.0'),
+        ('GPLv2+', 'GPL-2.0-or-later'),
+        ('GNU General Public License v3 or later', 'GPL-3.0-or-later'),
+        ('GPL-2.0', 'GPL-2.0-only'),
+        ('GNU Lesser General Public License v2.1', 'LGPL-2.1-only'),
+        ('The MIT License', 'MIT'),
+        ('MIT License (MIT)', 'MIT'),
+        ('Apache License 2.0 (Apache-2.0)', 'Apache-2.0'),
+        ('BSD 3-Clause', 'BSD-3-Clause'),
+        ('3-clause BSD', 'BSD-3-Clause'),
+        ('new BSD license', 'BSD-3-Clause'),
+        ('Creative Commons Attribution 4.0 International', 'CC-BY-4.0'),
+        ('CC0 1.0 Universal', 'CC0-1.0'),
+        ('mit', 'MIT'),
+    )
+    @unpack
+    def test_known_spelling(self, value: str, expected: str) -> None:
+        self.assertEqual((expected, 1.0), spdx.match_id(value))
+
+    def test_similar(self) -> None:
+        actual = spdx.match_id('Apache Licnse 2.0', min_score=0.5)
+        assert actual is not None
+        self.assertEqual('Apache-2.0', actual[0])
+        self.assertLess(actual[1], 1.0)
+        self.assertIsNone(spdx.match_id('Apache Licnse 2.0', min_score=actual[1] + 0.01))
+
+    @data(
+        '', '---', 'Proprietary', 'Public Domain',
+        # similar, but of other versions
+        'GPL-3.0 with classpath exception', 'Apache Software License', 'LGPL',
+        # compound expressions
+        'EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0', 'MIT AND Apache-2.0', 'Apache 2.0 (MIT)', '(MIT',
+        # deprecated, without successor
+        'wxWindows', 'GPL-2.0 with classpath exception',
+    )
+    def test_no_match(self, value: str) -> None:
+        self.assertIsNone(spdx.match_id(value))
+
+    @data(
+        ('wxWindows', 'wxWindows'),
+        ('GPL-2.0 with classpath exception', 'GPL-2.0-with-classpath-exception'),
+        ('GPL-2.0', 'GPL-2.0-only'),  # has a successor
+    )
+    @unpack
+    def test_include_deprecated(self, value: str, expected: str) -> None:
+        self.assertEqual((expected, 1.0), spdx.match_id(value, include_deprecated=True))
+
+
+@ddt
+class TestSpdxParseExpression(TestCase):
+
+    @data(
+        ('mit', {('MIT',)}),
+        ('MIT OR (Apache-2.0 AND BSD-3-Clause)', {('MIT',), ('Apache-2.0', 'BSD-3-Clause')}),
+        ('(MIT OR Foo) AND (Bar OR Apache-2.0)',
+         {('Bar', 'MIT'), ('Apache-2.0', 'MIT'), ('Bar', 'Foo'), ('Apache-2.0', 'Foo')}),
+        ('GPL-2.0+ WITH Classpath-exception-2.0', {('GPL-2.0-or-later WITH Classpath-exception-2.0',)}),
+    )
+    @unpack
+    def test_choices(self, expression: str, expected: Set[Tuple[str, ...]]) -> None:
+        actual = spdx.parse_expression(expression)
+        self.assertEqual(frozenset(frozenset(choice) for choice in expected), actual)
+        self.assertIs(actual, spdx.parse_expression(expression))  # memoized
+
+    @data('', 'MIT OR', '(MIT')
+    def test_unparsable(self, expression: str) -> None:
+        self.assertIsNone(spdx.parse_expression(expression))
+        self.assertIsNone(spdx.evaluate_expression(expression, bool))
+
+    def test_too_many_choices(self) -> None:
+        expression = ' AND '.join(f'(LicenseRef-a{i} OR LicenseRef-b{i})' for i in range(16))
+        with self.assertRaisesRegex(ValueError, 'more than 1024 choices'):
+            spdx.parse_expression(expression)
+
+    @data(
+        ('MIT', {'MIT'}, True),
+        ('MIT', set(), False),
+        ('MIT OR (Apache-2.0 AND BSD-3-Clause)', {'Apache-2.0', 'BSD-3-Clause'}, True),
+        ('MIT OR (Apache-2.0 AND BSD-3-Clause)', {'Apache-2.0'}, False),
+        ('GPL-2.0+ WITH Classpath-exception-2.0', {'GPL-2.0-or-later WITH Classpath-exception-2.0'}, True),
+    )
+    @unpack
+    def test_evaluate(self, expression: str, holds: Set[str], expected: bool) -> None:
+        self.assertIs(expected, spdx.evaluate_expression(expression, holds.__contains__))
+
+    def test_evaluate_large(self) -> None:
+        # 2**200 choices - must not be listed
+        expression = ' AND '.join(f'(LicenseRef-a{i} OR LicenseRef-b{i})' for i in range(200))
+        self.assertTrue(spdx.evaluate_expression(expression, lambda license: license.startswith('LicenseRef-b')))
+        self.assertFalse(spdx.evaluate_expression(expression, lambda license: license != 'LicenseRef-b199'
+                                                  and license != 'LicenseRef-a199'))
+
+
+class TestSpdxLazyInit(TestCase):
+    # import-time regression: importing must not do any of the costly work - in a fresh interpreter.
+
+    @staticmethod
+    def __run(code: str) -> str:
+        return run([sys.executable, '-c', code],  # nosec B603
+                   capture_output=True, check=True, text=True).stdout.strip()
+
+    def test_import_is_cheap(self) -> None:
+        self.assertEqual('False', self.__run(
+            'import sys, cyclonedx.spdx, cyclonedx.factory.license;'
+            'print("license_expression" in sys.modules)'))
+
+    def test_preload(self) -> None:
+        self.assertEqual('True', self.__run(
+            'import sys, cyclonedx.spdx;'
+            'cyclonedx.spdx.preload();'
+            'print("license_expression" in sys.modules)'))
+        spdx.preload()  # idempotent
+        self.assertTrue(spdx.is_compound_expression('MIT OR Apache-2.0'))
@@ -22,8 +22,9 @@ from unittest import TestCase
 
 from ddt import data, ddt, named_data, unpack
 
+from cyclonedx.exception import MissingOptionalDependencyException
 from cyclonedx.schema import OutputFormat, SchemaVersion
-from cyclonedx.validation import make_schemabased_validator
+from cyclonedx.validation import make_schemabased_validator, warm_up
 
 UNDEFINED_FORMAT_VERSION = {
     (OutputFormat.JSON, SchemaVersion.V1_1),
@@ -52,3 +53,31 @@ class TestGetSchemabasedValidator(TestCase):
     def test_fails_on_wrong_args(self, of: OutputFormat, sv: SchemaVersion, raises_regex: Tuple) -> None:
         with self.assertRaisesRegex(*raises_regex):
             make_schemabased_validator(of, sv)
+
+
+@ddt
+class TestWarmUp(TestCase):
+
+    def test_warm_up_all(self) -> None:
+        try:
+            warm_up()
+            warm_up(strict=True)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+
+    def test_fails_on_wrong_format(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'Unexpected output_format'):
+            warm_up(['foo'], [SchemaVersion.V1_6])
+
+    @named_data(*([f'{f.name} {v.name}', f, v]
+                  for f, v
+                  in product(OutputFormat, (SchemaVersion.V1_6, SchemaVersion.V1_2))))
+    @unpack
+    def test_compiled_schema_is_shared(self, of: OutputFormat, sv: SchemaVersion) -> None:
+        try:
+            warm_up([of], [sv])
+            v1 = make_schemabased_validator(of, sv)
+            v2 = make_schemabased_validator(of, sv)
+            self.assertIs(v1._validator, v2._validator)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
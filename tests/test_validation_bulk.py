@@ -0,0 +1,141 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stderr
+from glob import glob
+from io import StringIO
+from os.path import basename, join
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+from ddt import data, ddt
+
+from cyclonedx.exception import MissingOptionalDependencyException
+from cyclonedx.schema import OutputFormat, SchemaVersion
+from cyclonedx.validation.__main__ import main
+from cyclonedx.validation.bulk import iter_paths, validate_files
+from tests import SCHEMA_TESTDATA_DIRECTORY
+
+_TESTDATA_DIRECTORY = join(SCHEMA_TESTDATA_DIRECTORY, SchemaVersion.V1_6.to_version())
+
+
+@ddt
+class TestValidateFiles(TestCase):
+
+    def test_iter_paths(self) -> None:
+        expected = sorted(glob(join(_TESTDATA_DIRECTORY, '*.json')) + glob(join(_TESTDATA_DIRECTORY, '*.xml')))
+        self.assertListEqual(expected, list(iter_paths([_TESTDATA_DIRECTORY])))
+        self.assertListEqual(['foo.txt'], list(iter_paths(['foo.txt'])))
+
+    def test_validate_directory(self) -> None:
+        try:
+            results = list(validate_files([_TESTDATA_DIRECTORY], max_workers=2, max_errors=1))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertCountEqual(iter_paths([_TESTDATA_DIRECTORY]), (r.path for r in results))
+        for result in results:
+            with self.subTest(result.path):
+                if result.schema_version is not None:  # some invalid documents are undetectable
+                    self.assertIs(SchemaVersion.V1_6, result.schema_version)
+                    self.assertIs(OutputFormat.XML if result.path.endswith('.xml') else OutputFormat.JSON,
+                                  result.output_format)
+                self.assertEqual(basename(result.path).startswith('valid-'), result.is_valid)
+                self.assertLessEqual(len(result.errors), 1)
+                self.assertGreaterEqual(result.duration, 0)
+
+    def test_undetectable(self) -> None:
+        result, = validate_files([join(SCHEMA_TESTDATA_DIRECTORY, 'README.md')], max_workers=1)
+        self.assertFalse(result.is_valid)
+        self.assertIsNone(result.output_format)
+        self.assertIsNone(result.schema_version)
+        self.assertEqual(1, len(result.errors))
+
+    def test_failure_is_reported_per_file(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            deep = join(tmpdir, 'deep.json')
+            with open(deep, 'w') as f:
+                f.write('{"bomFormat": "CycloneDX", "specVersion": "1.6", "x": ' + '[' * 100_000 + ']' * 100_000 + '}')
+            valid = join(_TESTDATA_DIRECTORY, 'valid-bom-1.6.json')
+            try:
+                results = {r.path: r for r in validate_files([valid, deep], max_workers=1)}
+            except MissingOptionalDependencyException:
+                self.skipTest('MissingOptionalDependencyException')
+        self.assertTrue(results[valid].is_valid)
+        self.assertFalse(results[deep].is_valid)
+        self.assertEqual(1, len(results[deep].errors))
+
+    def test_worker_failure_is_reported_per_file(self) -> None:
+        valid = join(_TESTDATA_DIRECTORY, 'valid-bom-1.6.json')
+        with patch('cyclonedx.validation.bulk.ProcessPoolExecutor', _FailingExecutor):
+            result, = validate_files([valid], max_workers=1)
+        self.assertEqual(valid, result.path)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(('worker died',), result.errors)
+
+    @data(0, -1)
+    def test_throws_with_unexpected_max_errors(self, max_errors: int) -> None:
+        with self.assertRaisesRegex(ValueError, 'Unexpected max_errors'):
+            validate_files([_TESTDATA_DIRECTORY], max_errors=max_errors)
+
+    @data(0, -1)
+    def test_throws_with_unexpected_max_workers(self, max_workers: int) -> None:
+        with self.assertRaisesRegex(ValueError, 'Unexpected max_workers'):
+            validate_files([_TESTDATA_DIRECTORY], max_workers=max_workers)
+
+
+class _FailingExecutor(ThreadPoolExecutor):
+
+    def submit(self, *args: Any, **kwargs: Any) -> 'Future[Any]':
+        future: 'Future[Any]' = Future()
+        future.set_exception(BrokenProcessPool('worker died'))
+        return future
+
+
+@ddt
+class TestMain(TestCase):
+
+    def test_invalid(self) -> None:
+        out = StringIO()
+        try:
+            rc = main(['--workers', '1', join(_TESTDATA_DIRECTORY, 'valid-bom-1.6.json'),
+                       join(_TESTDATA_DIRECTORY, 'invalid-bomformat-1.6.json')], out=out)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertEqual(1, rc)
+        self.assertIn('$.bomFormat', out.getvalue())
+        self.assertIn('2 files, 1 invalid', out.getvalue())
+
+    @data('--max-errors', '--workers')
+    def test_throws_with_unexpected_number(self, option: str) -> None:
+        out = StringIO()
+        with redirect_stderr(StringIO()) as err, self.assertRaises(SystemExit) as cm:
+            main([option, '0', join(_TESTDATA_DIRECTORY, 'invalid-bomformat-1.6.json')], out=out)
+        self.assertEqual(2, cm.exception.code)
+        self.assertIn('must be at least 1', err.getvalue())
+        self.assertEqual('', out.getvalue())
+
+    def test_valid(self) -> None:
+        out = StringIO()
+        try:
+            rc = main(['--workers', '1', join(_TESTDATA_DIRECTORY, 'valid-bom-1.6.xml')], out=out)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertEqual(0, rc)
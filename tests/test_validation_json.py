@@ -15,17 +15,19 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
+from concurrent.futures import ProcessPoolExecutor
 from glob import iglob
 from itertools import chain
+from json import loads as json_loads
 from os.path import join
-from typing import Generator
+from typing import Any, Dict, Generator
 from unittest import TestCase
 
 from ddt import data, ddt, idata, unpack
 
 from cyclonedx.exception import MissingOptionalDependencyException
 from cyclonedx.schema import OutputFormat, SchemaVersion
-from cyclonedx.validation.json import JsonStrictValidator, JsonValidator
+from cyclonedx.validation.json import FORMAT_CHECKS_FAST, JsonStrictValidator, JsonValidator, json_pointer
 from tests import OWN_DATA_DIRECTORY, SCHEMA_TESTDATA_DIRECTORY, DpTuple
 
 UNSUPPORTED_SCHEMA_VERSIONS = {SchemaVersion.V1_0, SchemaVersion.V1_1, }
@@ -93,6 +95,291 @@ class TestJsonValidator(TestCase):
         self.assertIsNotNone(validation_error)
         self.assertIsNotNone(validation_error.data)
 
+    @idata(chain(
+        _dp_sv_tf(True),
+        _dp_sv_own(True)
+    ))
+    @unpack
+    def test_validate_path_no_none(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = JsonValidator(schema_version)
+        try:
+            validation_error = validator.validate_path(test_data_file)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertIsNone(validation_error)
+
+    @idata(chain(
+        _dp_sv_tf(False),
+        _dp_sv_own(False)
+    ))
+    @unpack
+    def test_validate_bytes_expected_error(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = JsonValidator(schema_version)
+        with open(test_data_file, 'rb') as tdfh:
+            test_data = tdfh.read()
+        try:
+            validation_error = validator.validate_bytes(test_data)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertIsNotNone(validation_error)
+        self.assertIsNotNone(validation_error.data)
+
+    @idata(chain(
+        _dp_sv_tf(True),
+        _dp_sv_own(True)
+    ))
+    @unpack
+    def test_validate_file_no_none(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = JsonValidator(schema_version)
+        try:
+            with open(test_data_file, 'rb') as tdfh:
+                validation_error = validator.validate_file(tdfh)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertIsNone(validation_error)
+
+    @idata(chain(
+        _dp_sv_tf(False),
+        _dp_sv_own(False)
+    ))
+    @unpack
+    def test_validate_data_expected_error(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = JsonValidator(schema_version)
+        with open(test_data_file, 'rb') as tdfh:
+            test_data = json_loads(tdfh.read())
+        try:
+            validation_error = validator.validate_data(test_data)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertIsNotNone(validation_error)
+        self.assertIsNotNone(validation_error.data)
+
+    def test_iter_errors_all(self) -> None:
+        validator = JsonValidator(SchemaVersion.V1_6)
+        test_data = {'bomFormat': 'CycloneDX', 'specVersion': '1.6', 'version': 'x',
+                     'components': [{'type': 'foo'}, {'type': 'library'}]}
+        try:
+            errors = list(validator.iter_errors(test_data))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertEqual(4, len(errors))
+        self.assertEqual(2, len(list(validator.iter_errors(test_data, max_errors=2))))
+
+    @idata(_dp_sv_tf(True))
+    @unpack
+    def test_iter_errors_none(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = JsonValidator(schema_version)
+        with open(test_data_file, 'rb') as tdfh:
+            test_data = json_loads(tdfh.read())
+        try:
+            errors = list(validator.iter_errors(test_data))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertListEqual([], errors)
+
+
+_FORMATS_TEST_DATA = {
+    'bomFormat': 'CycloneDX', 'specVersion': '1.6', 'version': 1,
+    'metadata': {'timestamp': 'not-a-date'},
+    'externalReferences': [{'type': 'website', 'url': 'http://exa mple.com/<>'}],
+}
+
+
+@ddt
+class TestJsonValidatorFormatChecks(TestCase):
+
+    def test_presets(self) -> None:
+        self.assertIn('iri-reference', JsonValidator(SchemaVersion.V1_6).format_checks)
+        self.assertIn('iri-reference', JsonValidator(SchemaVersion.V1_6, format_checks='all').format_checks)
+        self.assertSetEqual(set(), JsonValidator(SchemaVersion.V1_6, format_checks='none').format_checks)
+        self.assertIs(FORMAT_CHECKS_FAST, JsonValidator(SchemaVersion.V1_6, format_checks='fast').format_checks)
+        self.assertNotIn('iri-reference', FORMAT_CHECKS_FAST)
+        self.assertIn('date-time', FORMAT_CHECKS_FAST)
+
+    @data('foo', ['date-time', 'foo'])
+    def test_throws_with_unexpected(self, format_checks: Any) -> None:
+        with self.assertRaises(ValueError):
+            JsonValidator(SchemaVersion.V1_6, format_checks=format_checks)
+
+    @data(
+        ('all', 2),
+        ('fast', 1),
+        ('none', 0),
+        (['date-time'], 1),
+        (['iri-reference'], 1),
+    )
+    @unpack
+    def test_errors(self, format_checks: Any, expected_errors: int) -> None:
+        validator = JsonValidator(SchemaVersion.V1_6, format_checks=format_checks)
+        try:
+            errors = list(validator.iter_errors(_FORMATS_TEST_DATA))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertEqual(expected_errors, len(errors))
+
+    def test_compiled_schema_per_format_checks(self) -> None:
+        try:
+            import jsonschema  # noqa:F401
+            import referencing  # noqa:F401
+        except ImportError:
+            self.skipTest('MissingOptionalDependencyException')
+        all_checks = JsonValidator(SchemaVersion.V1_6)._validator
+        no_checks = JsonValidator(SchemaVersion.V1_6, format_checks='none')._validator
+        self.assertIsNot(all_checks, no_checks)
+        self.assertIs(no_checks, JsonValidator(SchemaVersion.V1_6, format_checks=[])._validator)
+
+
+def _fast_path_test_data(component: Dict[str, Any]) -> Dict[str, Any]:
+    return {'bomFormat': 'CycloneDX', 'specVersion': '1.6', 'version': 1,
+            'components': [{'type': 'library', 'name': 'foo'},
+                           {'type': 'library', 'name': 'bar', 'components': [component]}]}
+
+
+@ddt
+class TestJsonValidatorFastPath(TestCase):
+
+    @idata(chain(
+        _dp_sv_tf(True),
+        _dp_sv_own(True)
+    ))
+    @unpack
+    def test_valid_pass_fast_path(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = JsonValidator(schema_version, fast_path=True)
+        with open(test_data_file, 'rb') as tdfh:
+            test_data = json_loads(tdfh.read())
+        try:
+            self.assertIsNone(validator.validate_data(test_data))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertTrue(validator._passes_fast_path(test_data), 'expected to pass the fast path')
+
+    @idata(chain(
+        _dp_sv_tf(False),
+        _dp_sv_own(False)
+    ))
+    @unpack
+    def test_invalid_equivalent(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = JsonValidator(schema_version, fast_path=True)
+        with open(test_data_file, 'rb') as tdfh:
+            test_data = json_loads(tdfh.read())
+        try:
+            validation_error = validator.validate_data(test_data)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertFalse(validator._passes_fast_path(test_data))
+        self.assertIsNotNone(validation_error)
+        self.assertEqual(str(JsonValidator(schema_version).validate_data(test_data)), str(validation_error))
+
+    @data(
+        {'type': 'foo', 'name': 'baz'},
+        {'type': 'library'},
+        {'type': 'library', 'name': 'baz', 'unknown': 'property'},
+        {'type': 'library', 'name': 'baz', 'hashes': [{'alg': 'FOO', 'content': 'a' * 64}]},
+        {'type': 'library', 'name': 'baz', 'hashes': [{'alg': 'SHA-256', 'content': 'xyz'}]},
+        {'type': 'library', 'name': 'baz', 'bom-ref': ''},
+        {'type': 'library', 'name': 'baz', 'externalReferences': [{'type': 'foo', 'url': 'https://example.com'}]},
+        {'type': 'library', 'name': 'baz', 'licenses': [{'license': {'id': 'Apache-2'}}]},
+        {'type': 'library', 'name': 'baz', 'licenses': [{'expression': 'MIT'}, {'expression': 'MIT'}]},
+        {'type': 'library', 'name': 'baz', 'properties': [{'name': 'foo', 'value': 1}]},
+        {'type': 'library', 'name': 'baz', 'releaseNotes': {'type': 'major', 'timestamp': 'yesterday'}},
+    )
+    def test_invalid_rejected(self, component: Dict[str, Any]) -> None:
+        test_data = _fast_path_test_data(component)
+        validator = JsonValidator(SchemaVersion.V1_6, fast_path=True)
+        try:
+            self.assertFalse(validator._passes_fast_path(test_data))
+            self.assertIsNotNone(validator.validate_data(test_data))
+            self.assertEqual(1, len(list(validator.iter_errors(test_data))))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+
+    def test_disabled_by_default(self) -> None:
+        self.assertFalse(JsonValidator(SchemaVersion.V1_6).fast_path)
+        self.assertTrue(JsonValidator(SchemaVersion.V1_6, fast_path=True).fast_path)
+        self.assertFalse(JsonStrictValidator(SchemaVersion.V1_6)._passes_fast_path(
+            _fast_path_test_data({'type': 'library', 'name': 'baz'})))
+
+
+def _parallel_test_data(*components: Dict[str, Any]) -> Dict[str, Any]:
+    return {'bomFormat': 'CycloneDX', 'specVersion': '1.6', 'version': 1,
+            'components': [{'type': 'library', 'name': f'c{i}'} for i in range(5)] + list(components)}
+
+
+@ddt
+class TestJsonValidatorParallel(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.executor.shutdown()
+
+    @idata(chain(
+        _dp_sv_tf(True),
+        _dp_sv_own(True),
+        _dp_sv_tf(False),
+        _dp_sv_own(False),
+    ))
+    @unpack
+    def test_equivalent(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = JsonValidator(schema_version)
+        with open(test_data_file, 'rb') as tdfh:
+            test_data = json_loads(tdfh.read())
+        try:
+            expected = sorted(set(map(json_pointer, validator.iter_errors(test_data))))
+            actual = sorted(set(map(json_pointer, validator.iter_errors_parallel(
+                test_data, executor=self.executor, max_workers=2, chunk_size=1))))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertEqual(expected, actual)
+
+    def test_json_pointer(self) -> None:
+        test_data = _parallel_test_data({'type': 'foo', 'name': 'bar'}, {'type': 'library', 'name': 1})
+        test_data['version'] = 'one'
+        validator = JsonValidator(SchemaVersion.V1_6)
+        try:
+            errors = list(validator.iter_errors_parallel(test_data, executor=self.executor, chunk_size=2))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertEqual(['/version', '/components/5/type', '/components/6/name'], list(map(json_pointer, errors)))
+        self.assertEqual(('components', 5, 'type'), tuple(errors[1].data.path))
+        self.assertEqual('foo', errors[1].data.instance)
+        self.assertEqual('enum', errors[1].data.validator)
+
+    def test_max_errors(self) -> None:
+        test_data = _parallel_test_data(*({'type': 'foo', 'name': f'bar{i}'} for i in range(20)))
+        validator = JsonValidator(SchemaVersion.V1_6)
+        try:
+            errors = list(validator.iter_errors_parallel(test_data, executor=self.executor,
+                                                         max_errors=3, chunk_size=4))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertEqual(['/components/5/type', '/components/6/type', '/components/7/type'],
+                         list(map(json_pointer, errors)))
+
+    def test_duplicates(self) -> None:
+        test_data = _parallel_test_data({'name': 'c1', 'type': 'library'})
+        validator = JsonValidator(SchemaVersion.V1_6)
+        try:
+            errors = list(validator.iter_errors_parallel(test_data, executor=self.executor))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertEqual(['/components'], list(map(json_pointer, errors)))
+        self.assertEqual('uniqueItems', errors[0].data.validator)
+
+    def test_own_pool(self) -> None:
+        validator = JsonValidator(SchemaVersion.V1_6)
+        try:
+            self.assertEqual([], list(validator.iter_errors_parallel(_parallel_test_data(), max_workers=1)))
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+
+    def test_throws_with_unexpected_chunk_size(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'chunk_size'):
+            JsonValidator(SchemaVersion.V1_6).iter_errors_parallel(_parallel_test_data(), chunk_size=0)
+
 
 @ddt
 class TestJsonStrictValidator(TestCase):
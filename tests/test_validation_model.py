@@ -0,0 +1,117 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+from typing import Any, Callable, List
+from unittest import TestCase
+from warnings import catch_warnings, simplefilter
+
+from ddt import ddt, named_data, unpack
+
+from cyclonedx.model import ExternalReference, ExternalReferenceType, HashAlgorithm, HashType, XsUri
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component, ComponentScope, ComponentType
+from cyclonedx.model.dependency import Dependency
+from cyclonedx.model.vulnerability import BomTarget, Vulnerability, VulnerabilityRating, VulnerabilityScoreSource
+from cyclonedx.schema import SchemaVersion
+from cyclonedx.validation.model import ModelValidationError, ModelValidationErrorType, ModelValidator
+from tests import is_valid_for_schema_version
+from tests._data.models import all_get_bom_funct_invalid, all_get_bom_funct_valid, bom_all_same_bomref
+
+
+def _error_types(errors: List[ModelValidationError]) -> List[ModelValidationErrorType]:
+    return [e.type for e in errors]
+
+
+@ddt
+class TestModelValidator(TestCase):
+
+    @named_data(*(
+        (n, gb) for n, gb in all_get_bom_funct_valid
+        if is_valid_for_schema_version(gb, SchemaVersion.V1_6)
+    ))
+    def test_valid(self, get_bom: Callable[[], Bom]) -> None:
+        with catch_warnings():
+            simplefilter('ignore')
+            bom = get_bom()
+        validator = ModelValidator(SchemaVersion.V1_6)
+        self.assertListEqual([], list(validator.iter_errors(bom)))
+        self.assertIsNone(validator.validate(bom))
+
+    @named_data(*(
+        (n, gb, ModelValidationErrorType.DANGLING_DEPENDENCY_REF if 'dependencies' in n
+         else ModelValidationErrorType.LICENSE_EXPRESSION_ALONG_WITH_OTHERS)
+        for n, gb in all_get_bom_funct_invalid
+        if 'licenses' in n or 'dependencies' in n
+    ))
+    @unpack
+    def test_invalid(self, get_bom: Callable[[], Bom], expected: ModelValidationErrorType) -> None:
+        errors = list(ModelValidator(SchemaVersion.V1_6).iter_errors(get_bom()))
+        self.assertListEqual([expected], _error_types(errors))
+        self.assertIsInstance(str(errors[0]), str)
+
+    def test_duplicate_bom_refs(self) -> None:
+        bom, nr_bomrefs = bom_all_same_bomref()
+        errors = list(ModelValidator(SchemaVersion.V1_6).iter_errors(bom))
+        self.assertListEqual([ModelValidationErrorType.DUPLICATE_BOM_REF] * (nr_bomrefs - 1), _error_types(errors))
+        self.assertEqual(2, len(list(ModelValidator(SchemaVersion.V1_6).iter_errors(bom, max_errors=2))))
+
+    def test_unsupported_values(self) -> None:
+        component = Component(
+            name='foo', type=ComponentType.PLATFORM, scope=ComponentScope.EXCLUDED,
+            hashes=[HashType(alg=HashAlgorithm.BLAKE3, content='0' * 64)],
+            external_references=[ExternalReference(type=ExternalReferenceType.POAM,
+                                                   url=XsUri('https://example.com'))])
+        bom = Bom(components=[Component(name='bar', components=[component])])
+        self.assertListEqual([
+            ModelValidationErrorType.UNSUPPORTED_VALUE,  # type
+            ModelValidationErrorType.UNSUPPORTED_VALUE,  # scope
+            ModelValidationErrorType.UNSUPPORTED_HASH_ALGORITHM,
+            ModelValidationErrorType.UNSUPPORTED_VALUE,  # external reference type
+        ], _error_types(list(ModelValidator(SchemaVersion.V1_0).iter_errors(bom))))
+        self.assertListEqual([
+            ModelValidationErrorType.UNSUPPORTED_VALUE,  # type
+            ModelValidationErrorType.UNSUPPORTED_VALUE,  # external reference type
+        ], _error_types(list(ModelValidator(SchemaVersion.V1_4).iter_errors(bom))))
+        self.assertIsNone(ModelValidator(SchemaVersion.V1_6).validate(bom))
+
+    def test_vulnerabilities(self) -> None:
+        component = Component(name='foo', bom_ref='foo')
+        bom = Bom(components=[component], vulnerabilities=[
+            Vulnerability(bom_ref='vuln', affects=[
+                BomTarget(ref='foo'),
+                BomTarget(ref='unknown'),
+                BomTarget(ref='urn:cdx:3e671687-395b-41f5-a30f-a58921a69b79/1#foo'),
+            ], ratings=[VulnerabilityRating(method=VulnerabilityScoreSource.SSVC)])
+        ])
+        self.assertListEqual([
+            ModelValidationErrorType.UNSUPPORTED_VALUE,
+            ModelValidationErrorType.DANGLING_AFFECTS_REF,
+        ], _error_types(list(ModelValidator(SchemaVersion.V1_4).iter_errors(bom))))
+        errors = list(ModelValidator(SchemaVersion.V1_6).iter_errors(bom))
+        self.assertListEqual([ModelValidationErrorType.DANGLING_AFFECTS_REF], _error_types(errors))
+        self.assertIn("'unknown'", str(errors[0]))
+        self.assertIs(bom.vulnerabilities[0], errors[0].subject)
+
+    def test_dependencies(self) -> None:
+        component = Component(name='foo')
+        other = Component(name='bar', bom_ref='bar')
+        bom = Bom(components=[component])
+        bom.dependencies.add(Dependency(ref=component.bom_ref, dependencies=[Dependency(ref=other.bom_ref)]))
+        errors: List[Any] = list(ModelValidator(SchemaVersion.V1_6).iter_errors(bom))
+        self.assertListEqual([ModelValidationErrorType.DANGLING_DEPENDENCY_REF], _error_types(errors))
+        bom.components.add(other)
+        self.assertIsNone(ModelValidator(SchemaVersion.V1_6).validate(bom))
@@ -15,10 +15,11 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
+from concurrent.futures import ThreadPoolExecutor
 from glob import iglob
 from itertools import chain
 from os.path import join
-from typing import Generator
+from typing import Any, Generator, List
 from unittest import TestCase
 
 from ddt import ddt, idata, unpack
@@ -92,3 +93,119 @@ class TestXmlValidator(TestCase):
             self.skipTest('MissingOptionalDependencyException')
         self.assertIsNotNone(validation_error)
         self.assertIsNotNone(validation_error.data)
+
+    @idata(chain(
+        _dp_sv_tf(True),
+        _dp_sv_own(True)
+    ))
+    @unpack
+    def test_validate_path_no_none(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = XmlValidator(schema_version)
+        try:
+            validation_error = validator.validate_path(test_data_file)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertIsNone(validation_error)
+
+    @idata(chain(
+        _dp_sv_tf(False),
+        _dp_sv_own(False)
+    ))
+    @unpack
+    def test_validate_bytes_expected_error(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = XmlValidator(schema_version)
+        with open(test_data_file, 'rb') as tdfh:
+            test_data = tdfh.read()
+        try:
+            validation_error = validator.validate_bytes(test_data)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertIsNotNone(validation_error)
+        self.assertIsNotNone(validation_error.data)
+
+    @idata(chain(
+        _dp_sv_tf(True),
+        _dp_sv_own(True)
+    ))
+    @unpack
+    def test_validate_file_no_none(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = XmlValidator(schema_version)
+        try:
+            with open(test_data_file, 'rb') as tdfh:
+                validation_error = validator.validate_file(tdfh)
+        except MissingOptionalDependencyException:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertIsNone(validation_error)
+
+    @idata(chain(
+        _dp_sv_tf(False),
+        _dp_sv_own(False)
+    ))
+    @unpack
+    def test_validate_element_expected_error(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = XmlValidator(schema_version)
+        try:
+            from lxml.etree import parse as xml_parse  # type:ignore[import-untyped] # nosec B410
+        except ImportError:
+            self.skipTest('MissingOptionalDependencyException')
+        validation_error = validator.validate_element(xml_parse(test_data_file))  # nosec B320
+        self.assertIsNotNone(validation_error)
+        self.assertIsNotNone(validation_error.data)
+
+    def test_iter_errors_all(self) -> None:
+        validator = XmlValidator(SchemaVersion.V1_6)
+        try:
+            from lxml.etree import fromstring as xml_fromstring  # type:ignore[import-untyped] # nosec B410
+        except ImportError:
+            self.skipTest('MissingOptionalDependencyException')
+        test_data = xml_fromstring(  # nosec B320
+            b'<bom xmlns="http://cyclonedx.org/schema/bom/1.6" version="x"><components>'
+            b'<component type="foo"><name>a</name></component><component type="library"/>'
+            b'</components></bom>')
+        self.assertEqual(3, len(list(validator.iter_errors(test_data))))
+        self.assertEqual(2, len(list(validator.iter_errors(test_data, max_errors=2))))
+
+    @idata(_dp_sv_tf(True))
+    @unpack
+    def test_iter_errors_none(self, schema_version: SchemaVersion, test_data_file: str) -> None:
+        validator = XmlValidator(schema_version)
+        try:
+            from lxml.etree import parse as xml_parse  # type:ignore[import-untyped] # nosec B410
+        except ImportError:
+            self.skipTest('MissingOptionalDependencyException')
+        self.assertListEqual([], list(validator.iter_errors(xml_parse(test_data_file))))  # nosec B320
+
+    def test_validate_element_concurrently(self) -> None:
+        try:
+            from lxml.etree import parse as xml_parse  # type:ignore[import-untyped] # nosec B410
+        except ImportError:
+            self.skipTest('MissingOptionalDependencyException')
+        # valid documents clear the error log of a schema - which must not affect other threads
+        test_data = [(XmlValidator(sv), xml_parse(tf), valid)  # nosec B320
+                     for valid in (False, True)
+                     for sv, tf in _dp_sv_tf(valid) if sv is SchemaVersion.V1_6] * 20
+
+        def validate(validator: XmlValidator, element: Any, valid: bool) -> bool:
+            validation_error = validator.validate_element(element)
+            if valid:
+                return validation_error is None
+            return validation_error is not None and validation_error.data is not None
+
+        with ThreadPoolExecutor(max_workers=40) as executor:
+            self.assertTrue(all(executor.map(validate, *zip(*test_data))))
+
+    def test_iter_errors_concurrently(self) -> None:
+        try:
+            from lxml.etree import parse as xml_parse  # type:ignore[import-untyped] # nosec B410
+        except ImportError:
+            self.skipTest('MissingOptionalDependencyException')
+        validator = XmlValidator(SchemaVersion.V1_6)
+        elements = [xml_parse(tf) for valid in (False, True)  # nosec B320
+                    for sv, tf in _dp_sv_tf(valid) if sv is SchemaVersion.V1_6]
+
+        def messages(element: Any) -> List[str]:
+            return [str(error) for error in validator.iter_errors(element)]
+
+        expected = list(map(messages, elements)) * 20
+        with ThreadPoolExecutor(max_workers=40) as executor:
+            self.assertListEqual(expected, list(executor.map(messages, elements * 20)))